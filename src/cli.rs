@@ -1,6 +1,8 @@
 use clap::{Parser, Subcommand};
+use std::ffi::OsString;
+use std::sync::OnceLock;
 
-fn get_version() -> &'static str {
+pub fn get_version() -> &'static str {
     const BASE_VERSION: &str = env!("CARGO_PKG_VERSION");
 
     // If there's a git tag at HEAD, use just the tag (release build)
@@ -8,14 +10,13 @@ fn get_version() -> &'static str {
         return tag;
     }
 
-    // Not on a tag - include commit hash and branch (dev build)
-    let commit = option_env!("TOOLER_GIT_COMMIT").unwrap_or("unknown");
-    let branch = option_env!("TOOLER_GIT_BRANCH").unwrap_or("unknown");
-
-    // Return a static string by leaking the formatted string
-    // This is safe because it only happens once at startup
-    let version = format!("v{}-{} ({})", BASE_VERSION, commit, branch);
-    Box::leak(version.into_boxed_str())
+    // Not on a tag - include commit hash and branch (dev build), formatted once
+    static VERSION: OnceLock<String> = OnceLock::new();
+    VERSION.get_or_init(|| {
+        let commit = option_env!("TOOLER_GIT_COMMIT").unwrap_or("unknown");
+        let branch = option_env!("TOOLER_GIT_BRANCH").unwrap_or("unknown");
+        format!("v{}-{} ({})", BASE_VERSION, commit, branch)
+    })
 }
 
 #[derive(Parser)]
@@ -29,7 +30,10 @@ Quick start:\n  \
 tooler run <owner>/<repo> [args]   Run a tool (installs on first use)\n  \
 tooler list                        Show installed tools and versions\n  \
 tooler info <tool>                 Show install details for a tool\n  \
-tooler update [tool|all]           Update one or all tools"
+tooler update [tool|all]           Update one or all tools\n\n\
+`run` checks for tool updates in the background, except in CI or when stderr is not a \
+terminal. Set TOOLER_NO_UPDATE_CHECK=1 to never check, or TOOLER_NO_UPDATE_CHECK=0 to \
+always check."
 )]
 #[command(version = get_version(), propagate_version = true)]
 pub struct Cli {
@@ -49,6 +53,47 @@ pub struct Cli {
     pub command: Commands,
 }
 
+impl Cli {
+    /// Parse the command line, bypassing clap for the hot `tooler run <tool> [args]`
+    /// shape that shims produce.
+    pub fn parse_args() -> Self {
+        Self::parse_run_fast(std::env::args_os()).unwrap_or_else(Self::parse)
+    }
+
+    /// Recognize `run <tool> [args]` when clap would treat every argument after the
+    /// tool as a trailing tool argument: neither the tool nor its first argument may
+    /// look like a flag, since tooler flags are only accepted before the first
+    /// positional. Anything else returns `None` and goes through clap.
+    fn parse_run_fast<I: IntoIterator<Item = OsString>>(args: I) -> Option<Self> {
+        let mut args = args.into_iter().skip(1).map(|a| a.into_string().ok());
+        if args.next()?? != "run" {
+            return None;
+        }
+        let tool_id = args.next()??;
+        if tool_id.starts_with('-') {
+            return None;
+        }
+        let tool_args: Vec<String> = args.collect::<Option<_>>()?;
+        if tool_args.first().is_some_and(|a| a.starts_with('-')) {
+            return None;
+        }
+        Some(Cli {
+            verbose: 0,
+            quiet: false,
+            output: None,
+            command: Commands::Run {
+                tool_id,
+                tool_args,
+                asset: None,
+                parse_release_body: false,
+                no_parse_release_body: false,
+                cache: false,
+                cache_stdin: false,
+            },
+        })
+    }
+}
+
 #[derive(Subcommand)]
 pub enum Commands {
     /// Run a tool
@@ -73,6 +118,16 @@ pub enum Commands {
         /// Don't parse release body for download URLs
         #[arg(long)]
         no_parse_release_body: bool,
+        /// Replay the saved output of an identical earlier run instead of running the
+        /// tool again. Only for tools whose output depends solely on their arguments
+        /// and working directory path: file contents and the environment are not
+        /// part of the key
+        #[arg(long)]
+        cache: bool,
+        /// Like --cache, and also read stdin to the end, feed it to the tool and
+        /// include it in the cache key. Without it a cached run gets no stdin
+        #[arg(long)]
+        cache_stdin: bool,
     },
 
     /// List all installed tools
@@ -173,3 +228,71 @@ pub enum ConfigAction {
         format: String,
     },
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn run_fields(cli: &Cli) -> Option<(&str, &[String])> {
+        if cli.verbose != 0 || cli.quiet || cli.output.is_some() {
+            return None;
+        }
+        match &cli.command {
+            Commands::Run {
+                tool_id,
+                tool_args,
+                asset: None,
+                parse_release_body: false,
+                no_parse_release_body: false,
+                cache: false,
+                cache_stdin: false,
+            } => Some((tool_id, tool_args)),
+            _ => None,
+        }
+    }
+
+    #[test]
+    fn test_fast_run_parse_matches_clap() {
+        let cases: &[&[&str]] = &[
+            &["tooler", "run", "k9s"],
+            &["tooler", "run", "nektos/act@v0.2.79", "list"],
+            &[
+                "tooler",
+                "run",
+                "kubectl",
+                "get",
+                "-n",
+                "kube-system",
+                "--help",
+            ],
+            &["tooler", "run", "gh", "pr", "--", "-v"],
+        ];
+        for argv in cases {
+            let fast = Cli::parse_run_fast(argv.iter().map(OsString::from))
+                .unwrap_or_else(|| panic!("fast path rejected {:?}", argv));
+            let slow = Cli::try_parse_from(*argv).unwrap();
+            assert!(run_fields(&fast).is_some(), "{:?}", argv);
+            assert_eq!(run_fields(&fast), run_fields(&slow), "{:?}", argv);
+        }
+    }
+
+    #[test]
+    fn test_fast_run_parse_defers_flags_to_clap() {
+        let cases: &[&[&str]] = &[
+            &["tooler", "-v", "run", "k9s"],
+            &["tooler", "run", "-v", "k9s"],
+            &["tooler", "run", "k9s", "-v"],
+            &["tooler", "run", "k9s", "--asset", "k9s.tar.gz"],
+            &["tooler", "run", "--help"],
+            &["tooler", "list"],
+            &["tooler", "run"],
+        ];
+        for argv in cases {
+            assert!(
+                Cli::parse_run_fast(argv.iter().map(OsString::from)).is_none(),
+                "{:?}",
+                argv
+            );
+        }
+    }
+}
@@ -1,13 +1,19 @@
 use crate::types::*;
 use anyhow::{Context, Result};
 
+use serde::Serialize;
 use std::fs;
-use std::path::PathBuf;
+use std::io::Write;
+use std::path::{Path, PathBuf};
 
 pub const APP_NAME: &str = "tooler";
 pub const CONFIG_DIR_NAME: &str = "tooler";
 pub const TOOLS_DIR_NAME: &str = "tools";
+pub const TRASH_DIR_NAME: &str = "trash";
 pub const CONFIG_FILE_NAME: &str = "config.json";
+pub const RELEASE_CACHE_FILE_NAME: &str = "release_cache.json";
+pub const PENDING_UPDATES_FILE_NAME: &str = "pending_updates.json";
+pub const RUN_CACHE_DIR_NAME: &str = "run-cache";
 
 pub fn get_user_data_dir() -> Result<PathBuf> {
     if let Ok(env_path) = std::env::var("TOOLER_DATA_DIR") {
@@ -59,6 +65,72 @@ pub fn get_tooler_tools_dir() -> Result<PathBuf> {
     Ok(path)
 }
 
+pub fn get_tooler_trash_dir() -> Result<PathBuf> {
+    let path = get_user_data_dir()?.join(TRASH_DIR_NAME);
+    fs::create_dir_all(&path)?;
+    Ok(path)
+}
+
+pub fn get_run_cache_dir() -> Result<PathBuf> {
+    let path = get_user_data_dir()?.join(RUN_CACHE_DIR_NAME);
+    fs::create_dir_all(&path)?;
+    Ok(path)
+}
+
+pub fn get_release_cache_file_path() -> Result<PathBuf> {
+    Ok(get_user_data_dir()?.join(RELEASE_CACHE_FILE_NAME))
+}
+
+/// Load the release cache. The cache is disposable, so a missing or unreadable
+/// file yields an empty cache instead of an error.
+pub fn load_release_cache() -> ReleaseCache {
+    let Ok(path) = get_release_cache_file_path() else {
+        return ReleaseCache::default();
+    };
+    let Ok(content) = fs::read_to_string(&path) else {
+        return ReleaseCache::default();
+    };
+    serde_json::from_str(&content).unwrap_or_else(|e| {
+        tracing::debug!(
+            "Ignoring unreadable release cache {}: {}",
+            path.display(),
+            e
+        );
+        ReleaseCache::default()
+    })
+}
+
+pub fn save_release_cache(cache: &ReleaseCache) -> Result<()> {
+    write_json_atomic(&get_release_cache_file_path()?, cache)
+}
+
+pub fn get_pending_updates_file_path() -> Result<PathBuf> {
+    Ok(get_user_data_dir()?.join(PENDING_UPDATES_FILE_NAME))
+}
+
+/// Load updates found by earlier background checks. Like the release cache,
+/// this file is disposable and unreadable content is treated as empty.
+pub fn load_pending_updates() -> Vec<PendingUpdate> {
+    let Ok(path) = get_pending_updates_file_path() else {
+        return Vec::new();
+    };
+    let Ok(content) = fs::read_to_string(&path) else {
+        return Vec::new();
+    };
+    serde_json::from_str(&content).unwrap_or_default()
+}
+
+pub fn save_pending_updates(updates: &[PendingUpdate]) -> Result<()> {
+    let path = get_pending_updates_file_path()?;
+    if updates.is_empty() {
+        if path.exists() {
+            fs::remove_file(path)?;
+        }
+        return Ok(());
+    }
+    write_json_atomic(&path, &updates)
+}
+
 pub fn load_tool_configs() -> Result<ToolerConfig> {
     let config_path = get_tooler_config_file_path()?;
 
@@ -71,21 +143,10 @@ pub fn load_tool_configs() -> Result<ToolerConfig> {
             Err(e) => {
                 // Check if error is due to missing fields (partial config) vs malformed JSON
                 if e.is_data() {
-                    // Missing fields - try to parse as partial config and merge with defaults
-                    let mut default_config = ToolerConfig::default();
-                    if let Ok(partial_config) = serde_json::from_str::<ToolerConfig>(&content) {
-                        // Merge any valid settings from partial config
-                        if partial_config.settings.update_check_days != 0 {
-                            default_config.settings.update_check_days =
-                                partial_config.settings.update_check_days;
-                        }
-                        if !partial_config.settings.bin_dir.is_empty() {
-                            default_config.settings.bin_dir = partial_config.settings.bin_dir;
-                        }
-                        default_config.settings.auto_shim = partial_config.settings.auto_shim;
-                        default_config.settings.auto_update = partial_config.settings.auto_update;
-                    }
-                    default_config
+                    // Valid JSON with an unexpected shape - salvage the settings that
+                    // still read correctly and use defaults for everything else
+                    let value: serde_json::Value = serde_json::from_str(&content)?;
+                    salvage_settings(&value)
                 } else {
                     // Malformed JSON - fail with original error
                     return Err(e).with_context(|| "Could not parse config file as JSON");
@@ -97,10 +158,42 @@ pub fn load_tool_configs() -> Result<ToolerConfig> {
     };
 
     apply_environment_overrides(&mut config);
+    config.rebuild_tool_index();
 
     Ok(config)
 }
 
+/// Build a default config carrying over whichever settings in `value` still
+/// have the expected types.
+fn salvage_settings(value: &serde_json::Value) -> ToolerConfig {
+    let mut config = ToolerConfig::default();
+    let Some(settings) = value.get("settings") else {
+        return config;
+    };
+    if let Some(days) = settings
+        .get("update_check_days")
+        .and_then(|v| v.as_i64())
+        .and_then(|v| i32::try_from(v).ok())
+        .filter(|days| *days != 0)
+    {
+        config.settings.update_check_days = days;
+    }
+    if let Some(bin_dir) = settings
+        .get("bin_dir")
+        .and_then(|v| v.as_str())
+        .filter(|dir| !dir.is_empty())
+    {
+        config.settings.bin_dir = bin_dir.to_string();
+    }
+    if let Some(auto_shim) = settings.get("auto_shim").and_then(|v| v.as_bool()) {
+        config.settings.auto_shim = auto_shim;
+    }
+    if let Some(auto_update) = settings.get("auto_update").and_then(|v| v.as_bool()) {
+        config.settings.auto_update = auto_update;
+    }
+    config
+}
+
 fn apply_environment_overrides(config: &mut ToolerConfig) {
     if let Ok(days) = std::env::var("TOOLER_UPDATE_CHECK_DAYS") {
         if let Ok(days) = days.parse::<i32>() {
@@ -137,10 +230,31 @@ pub fn save_tool_configs_to_path(config: &ToolerConfig, path: &std::path::Path)
         .ok_or_else(|| anyhow::anyhow!("Invalid config path"))?;
 
     fs::create_dir_all(config_dir)?;
+    write_json_atomic(path, config)
+}
 
-    let content = serde_json::to_string_pretty(config)?;
-    fs::write(path, content)?;
+/// Serialize `value` as pretty JSON into a temporary file next to `path`, then
+/// rename it over `path`. Readers see either the old or the new file, never a
+/// partial write, and an existing file keeps its permissions. When `path`
+/// already holds exactly these bytes, nothing is written.
+fn write_json_atomic<T: Serialize + ?Sized>(path: &Path, value: &T) -> Result<()> {
+    let dir = path
+        .parent()
+        .ok_or_else(|| anyhow::anyhow!("Invalid path: {}", path.display()))?;
+    let json = serde_json::to_vec_pretty(value)?;
+    if fs::read(path).is_ok_and(|existing| existing == json) {
+        return Ok(());
+    }
 
+    let mut temp = tempfile::NamedTempFile::new_in(dir)?;
+    temp.write_all(&json)?;
+    temp.as_file().sync_all()?;
+
+    if let Ok(metadata) = fs::metadata(path) {
+        fs::set_permissions(temp.path(), metadata.permissions())?;
+    }
+    temp.persist(path)
+        .with_context(|| format!("Failed to write {}", path.display()))?;
     Ok(())
 }
 
@@ -197,6 +311,30 @@ mod tests {
         assert_eq!(config.settings.parse_release_body, ReleaseBodyPolicy::Ask);
     }
 
+    #[test]
+    fn test_settings_table_round_trips() {
+        let defaults = ToolerSettings::default();
+        for setting in SETTINGS {
+            assert_eq!(normalize_key(&setting.display_key()), setting.key);
+            assert!(std::ptr::eq(find_setting(setting.key).unwrap(), setting));
+
+            // Every displayed value can be set back, and reset restores the default
+            let mut settings = defaults.clone();
+            (setting.set)(&mut settings, &(setting.get)(&defaults)).unwrap();
+            assert_eq!(settings, defaults);
+            settings.update_check_days = 1;
+            settings.bin_dir = "/elsewhere".to_string();
+            settings.auto_shim = !defaults.auto_shim;
+            settings.auto_update = !defaults.auto_update;
+            settings.parse_release_body = ReleaseBodyPolicy::Never;
+            (setting.reset)(&mut settings);
+            assert_eq!((setting.get)(&settings), (setting.get)(&defaults));
+        }
+        assert!(find_setting("shim_dir").is_none());
+        let mut settings = defaults.clone();
+        assert!((find_setting("update_check_days").unwrap().set)(&mut settings, "soon").is_err());
+    }
+
     #[test]
     fn test_parse_release_body_legacy_booleans() {
         let always: ToolerConfig = serde_json::from_str(
@@ -227,6 +365,66 @@ mod tests {
         assert_eq!(never.settings.parse_release_body, ReleaseBodyPolicy::Never);
     }
 
+    #[test]
+    fn test_salvage_settings_keeps_well_typed_values() {
+        let value: serde_json::Value = serde_json::from_str(
+            r#"{
+                "tools": ["not", "a", "map"],
+                "settings": {
+                    "update_check_days": 9,
+                    "bin_dir": 42,
+                    "auto_update": true
+                }
+            }"#,
+        )
+        .unwrap();
+        assert!(serde_json::from_value::<ToolerConfig>(value.clone()).is_err());
+
+        let config = salvage_settings(&value);
+        assert_eq!(config.settings.update_check_days, 9);
+        assert_eq!(
+            config.settings.bin_dir,
+            ToolerConfig::default().settings.bin_dir
+        );
+        assert!(config.settings.auto_update);
+        assert!(config.tools.is_empty());
+    }
+
+    #[test]
+    fn test_save_replaces_config_without_leaving_temp_files() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        let config_path = temp_dir.path().join("config.json");
+        fs::write(&config_path, "{ truncated").unwrap();
+
+        let mut config = ToolerConfig::default();
+        config.settings.update_check_days = 7;
+        save_tool_configs_to_path(&config, &config_path).unwrap();
+
+        let saved: ToolerConfig =
+            serde_json::from_str(&fs::read_to_string(&config_path).unwrap()).unwrap();
+        assert_eq!(saved.settings.update_check_days, 7);
+        assert_eq!(fs::read_dir(temp_dir.path()).unwrap().count(), 1);
+    }
+
+    #[cfg(unix)]
+    #[test]
+    fn test_save_skips_identical_config() {
+        use std::os::unix::fs::MetadataExt;
+
+        let temp_dir = tempfile::tempdir().unwrap();
+        let config_path = temp_dir.path().join("config.json");
+        let mut config = ToolerConfig::default();
+        save_tool_configs_to_path(&config, &config_path).unwrap();
+        let inode = fs::metadata(&config_path).unwrap().ino();
+
+        save_tool_configs_to_path(&config, &config_path).unwrap();
+        assert_eq!(fs::metadata(&config_path).unwrap().ino(), inode);
+
+        config.settings.auto_update = !config.settings.auto_update;
+        save_tool_configs_to_path(&config, &config_path).unwrap();
+        assert_ne!(fs::metadata(&config_path).unwrap().ino(), inode);
+    }
+
     #[test]
     fn test_env_overrides_apply_without_existing_config_file() {
         let temp_dir = tempfile::tempdir().unwrap();
@@ -1,20 +1,44 @@
-use crate::platform::{check_binary_architecture, get_system_info};
+use crate::platform::check_binary_architecture;
+use crate::types::PlatformInfo;
 use anyhow::{anyhow, Result};
 use flate2::read::GzDecoder;
-use indicatif::{ProgressBar, ProgressStyle};
+use indicatif::{MultiProgress, ProgressBar, ProgressStyle};
+use std::collections::HashSet;
 use std::fs;
-use std::io::{self, Write};
+use std::io::{self, BufWriter, Write};
 use std::path::{Path, PathBuf};
+use std::sync::OnceLock;
 use tar::Archive;
 use walkdir::WalkDir;
 
+/// Write buffer for downloads, so each syscall moves up to 1 MiB.
+const DOWNLOAD_BUFFER_SIZE: usize = 1 << 20;
+
+/// Shared HTTP client for every GitHub API call and download, so connections
+/// and TLS sessions to the same host are pooled across requests.
+pub fn http_client() -> &'static reqwest::Client {
+    static CLIENT: OnceLock<reqwest::Client> = OnceLock::new();
+    CLIENT.get_or_init(|| {
+        reqwest::Client::builder()
+            .user_agent("tooler")
+            .build()
+            .unwrap_or_default()
+    })
+}
+
+/// The progress display shared by every download in the process.
+pub fn progress() -> &'static MultiProgress {
+    static PROGRESS: OnceLock<MultiProgress> = OnceLock::new();
+    PROGRESS.get_or_init(MultiProgress::new)
+}
+
 pub async fn download_file(url: &str, local_path: &Path) -> Result<()> {
     tracing::info!(
         "Downloading {}...",
         local_path.file_name().unwrap().to_string_lossy()
     );
 
-    let response = reqwest::get(url).await?;
+    let response = http_client().get(url).send().await?;
     let total_size = response.content_length().unwrap_or(0);
 
     let filename = local_path
@@ -22,7 +46,8 @@ pub async fn download_file(url: &str, local_path: &Path) -> Result<()> {
         .unwrap()
         .to_string_lossy()
         .to_string();
-    let pb = ProgressBar::new(total_size);
+    // Concurrent downloads (update all) each get their own line
+    let pb = progress().add(ProgressBar::new(total_size));
     pb.set_style(
         ProgressStyle::default_bar()
             .template("{msg} {spinner:.green} [{elapsed_precise}] [{bar:40.cyan/blue}] {bytes}/{total_bytes} ({eta})")
@@ -31,17 +56,17 @@ pub async fn download_file(url: &str, local_path: &Path) -> Result<()> {
     );
     pb.set_message(format!("Downloading {}", filename));
 
-    let mut file = fs::File::create(local_path)?;
-    let mut downloaded = 0u64;
+    // Network chunks are typically a few KiB; batch them into large writes
+    let mut file = BufWriter::with_capacity(DOWNLOAD_BUFFER_SIZE, fs::File::create(local_path)?);
     let mut stream = response.bytes_stream();
 
     use futures_util::StreamExt;
     while let Some(chunk) = stream.next().await {
         let chunk = chunk?;
         file.write_all(&chunk)?;
-        downloaded += chunk.len() as u64;
-        pb.set_position(downloaded);
+        pb.inc(chunk.len() as u64);
     }
+    file.flush()?;
 
     pb.finish_and_clear();
     Ok(())
@@ -52,14 +77,13 @@ pub fn extract_archive(
     extract_dir: &Path,
     tool_name: &str,
     repo_full_name: &str,
+    system_info: &PlatformInfo,
 ) -> Result<PathBuf> {
     tracing::info!(
         "Extracting {}...",
         archive_path.file_name().unwrap().to_string_lossy()
     );
 
-    let system_info = get_system_info();
-
     if archive_path.extension().and_then(|s| s.to_str()) == Some("zip") {
         extract_zip(archive_path, extract_dir)?;
     } else if archive_path.to_string_lossy().ends_with(".tar.gz")
@@ -108,24 +132,31 @@ pub fn extract_archive(
 }
 
 fn extract_zip(archive_path: &Path, extract_dir: &Path) -> Result<()> {
-    let file = fs::File::open(archive_path)?;
+    // The central directory is parsed with many small reads, so buffer them
+    let file = io::BufReader::new(fs::File::open(archive_path)?);
     let mut archive = zip::ZipArchive::new(file)?;
+    // Directories already created, so each file only touches its parent once
+    let mut created_dirs: HashSet<PathBuf> = HashSet::new();
 
     for i in 0..archive.len() {
         let mut file = archive.by_index(i)?;
-        let outpath = extract_dir.join(file.name());
-
-        // Security check for path traversal
-        if !outpath.starts_with(extract_dir) {
+        // Security check for path traversal: `enclosed_name` rejects absolute
+        // paths and `..` components without touching the filesystem
+        let Some(relative) = file.enclosed_name() else {
             tracing::warn!("Skipping malicious path in zip: {}", file.name());
             continue;
-        }
+        };
+        let outpath = extract_dir.join(relative);
 
-        if file.name().ends_with('/') {
+        if file.is_dir() {
             fs::create_dir_all(&outpath)?;
+            created_dirs.insert(outpath);
         } else {
             if let Some(parent) = outpath.parent() {
-                fs::create_dir_all(parent)?;
+                if !created_dirs.contains(parent) {
+                    fs::create_dir_all(parent)?;
+                    created_dirs.insert(parent.to_path_buf());
+                }
             }
             let mut outfile = fs::File::create(&outpath)?;
             io::copy(&mut file, &mut outfile)?;
@@ -143,45 +174,31 @@ fn extract_zip(archive_path: &Path, extract_dir: &Path) -> Result<()> {
 
 fn extract_tar_gz(archive_path: &Path, extract_dir: &Path) -> Result<()> {
     let file = fs::File::open(archive_path)?;
-    let decoder = GzDecoder::new(file);
-    let mut archive = Archive::new(decoder);
-
-    // Security: Validate each entry to prevent path traversal
-    for entry in archive.entries()? {
-        let mut entry = entry?;
-        let path = entry.path()?;
-        let outpath = extract_dir.join(&path);
-
-        // Security check for path traversal
-        if !outpath.starts_with(extract_dir) {
-            tracing::warn!("Skipping malicious path in tar.gz: {}", path.display());
-            continue;
-        }
-
-        entry.unpack_in(extract_dir)?;
-    }
-
-    Ok(())
+    extract_tar(GzDecoder::new(file), extract_dir, "tar.gz")
 }
 
 fn extract_tar_xz(archive_path: &Path, extract_dir: &Path) -> Result<()> {
     let file = fs::File::open(archive_path)?;
-    let decoder = xz2::read::XzDecoder::new(file);
+    extract_tar(xz2::read::XzDecoder::new(file), extract_dir, "tar.xz")
+}
+
+/// Unpack a tar stream entry by entry as it is decompressed, without reading
+/// the member list up front.
+fn extract_tar<R: io::Read>(decoder: R, extract_dir: &Path, format: &str) -> Result<()> {
     let mut archive = Archive::new(decoder);
 
-    // Security: Validate each entry to prevent path traversal
+    // Security: unpack_in keeps every write inside extract_dir on its own. It
+    // treats absolute paths as relative, refuses to write through symlinks
+    // that lead outside, and skips entries with `..` components by returning false
     for entry in archive.entries()? {
         let mut entry = entry?;
-        let path = entry.path()?;
-        let outpath = extract_dir.join(&path);
-
-        // Security check for path traversal
-        if !outpath.starts_with(extract_dir) {
-            tracing::warn!("Skipping malicious path in tar.xz: {}", path.display());
-            continue;
+        if !entry.unpack_in(extract_dir)? {
+            tracing::warn!(
+                "Skipping malicious path in {}: {}",
+                format,
+                entry.path()?.display()
+            );
         }
-
-        entry.unpack_in(extract_dir)?;
     }
 
     Ok(())
@@ -194,28 +211,22 @@ pub fn find_executable_in_extracted(
     os_system: &str,
     archive_path: &Path,
 ) -> Option<PathBuf> {
-    let mut candidates = Vec::new();
     let tool_name_lower = tool_name.to_lowercase();
 
     // Base target names from tool name
-    let mut target_names = if os_system == "windows" {
-        vec![
+    let mut target_names: HashSet<String> = if os_system == "windows" {
+        HashSet::from([
             format!("{}.exe", tool_name_lower),
             format!("{}.cmd", tool_name_lower),
             format!("{}.bat", tool_name_lower),
             tool_name_lower.clone(),
-        ]
+        ])
     } else {
-        vec![tool_name_lower.clone(), format!("{}.sh", tool_name_lower)]
+        HashSet::from([tool_name_lower.clone(), format!("{}.sh", tool_name_lower)])
     };
 
     // Also consider the repo name parts as high-priority candidates
-    for part in repo_full_name.split('/') {
-        let p = part.to_lowercase();
-        if !target_names.contains(&p) {
-            target_names.push(p);
-        }
-    }
+    target_names.extend(repo_full_name.split('/').map(str::to_lowercase));
 
     // Extract potential names from the archive filename itself
     // e.g., "gh_2.83.2_linux_amd64.tar.gz" -> "gh"
@@ -230,9 +241,12 @@ pub fn find_executable_in_extracted(
         .filter(|s| s.len() > 1 && !s.chars().all(|c| c.is_numeric()))
         .collect();
 
+    let mut best: Option<(i32, PathBuf)> = None;
     for entry in WalkDir::new(extract_dir).into_iter().filter_map(|e| e.ok()) {
         let path = entry.path();
-        if path.is_file() && is_executable(path, os_system) {
+        // Directories are known from the listing without a stat; everything
+        // else gets the single stat in is_executable
+        if !entry.file_type().is_dir() && is_executable(path, os_system) {
             let file_name = path.file_name()?.to_string_lossy().to_lowercase();
             let file_stem = path.file_stem()?.to_string_lossy().to_lowercase();
 
@@ -252,7 +266,7 @@ pub fn find_executable_in_extracted(
                 score += 100;
             } else if target_names.contains(&file_stem) {
                 score += 90;
-            } else if !file_base.is_empty() && target_names.iter().any(|t| t == file_base) {
+            } else if !file_base.is_empty() && target_names.contains(file_base) {
                 score += 85;
             }
 
@@ -279,39 +293,29 @@ pub fn find_executable_in_extracted(
             }
 
             // Penalize deeper paths to prefer binaries in bin/ or root over nested examples/
-            let depth = path
-                .strip_prefix(extract_dir)
-                .ok()
-                .map_or(0, |p| p.components().count());
-            score -= (depth as i32) * 5;
-
-            if score > 0 {
-                candidates.push((score, path.to_path_buf()));
+            score -= (entry.depth() as i32) * 5;
+
+            // Keep the first of equally scored candidates, in walk order
+            if score > 0
+                && best
+                    .as_ref()
+                    .is_none_or(|(best_score, _)| score > *best_score)
+            {
+                best = Some((score, path.to_path_buf()));
             }
         }
     }
 
-    candidates.sort_by_key(|(score, _)| -(*score));
-
-    if let Some((score, path)) = candidates.first() {
-        tracing::debug!(
-            "Found candidate executable: {} with score {}",
-            path.display(),
-            score
-        );
-        if *score <= 0 {
-            return None;
-        }
-    }
-
-    candidates.into_iter().map(|(_, path)| path).next()
+    let (score, path) = best?;
+    tracing::debug!(
+        "Found candidate executable: {} with score {}",
+        path.display(),
+        score
+    );
+    Some(path)
 }
 
 pub fn is_executable(filepath: &Path, os_system: &str) -> bool {
-    if !filepath.is_file() {
-        return false;
-    }
-
     let file_name = filepath
         .file_name()
         .map(|n| n.to_string_lossy().to_lowercase())
@@ -362,7 +366,7 @@ pub fn is_executable(filepath: &Path, os_system: &str) -> bool {
     }
 
     if os_system == "windows" {
-        matches!(ext.as_str(), "exe" | "cmd" | "bat")
+        matches!(ext.as_str(), "exe" | "cmd" | "bat") && filepath.is_file()
     } else {
         // On Unix-like systems, check if it's a regular file and not a library/archive
         if matches!(
@@ -372,17 +376,111 @@ pub fn is_executable(filepath: &Path, os_system: &str) -> bool {
             return false;
         }
 
-        // Check execution bit on Unix
+        // One stat answers both "regular file?" and "execution bit set?"
+        let Ok(metadata) = filepath.metadata() else {
+            return false;
+        };
+        if !metadata.is_file() {
+            return false;
+        }
+
         #[cfg(unix)]
         {
             use std::os::unix::fs::PermissionsExt;
-            if let Ok(metadata) = filepath.metadata() {
-                if metadata.permissions().mode() & 0o111 == 0 {
-                    return false;
-                }
+            if metadata.permissions().mode() & 0o111 == 0 {
+                return false;
             }
         }
 
         true
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Append a regular file member named `name` verbatim, bypassing the
+    /// path checks `tar::Builder` applies to names it sets itself.
+    fn append_raw<W: Write>(builder: &mut tar::Builder<W>, name: &str, data: &[u8]) {
+        let mut header = tar::Header::new_gnu();
+        let field = &mut header.as_gnu_mut().unwrap().name;
+        field[..name.len()].copy_from_slice(name.as_bytes());
+        header.set_size(data.len() as u64);
+        header.set_mode(0o755);
+        header.set_entry_type(tar::EntryType::Regular);
+        header.set_cksum();
+        builder.append(&header, data).unwrap();
+    }
+
+    #[test]
+    fn test_extract_zip_skips_escaping_entries() {
+        use zip::write::FileOptions;
+
+        let temp_dir = tempfile::tempdir().unwrap();
+        let extract_dir = temp_dir.path().join("extract");
+        fs::create_dir_all(&extract_dir).unwrap();
+        let absolute = temp_dir.path().join("absolute");
+
+        let archive_path = temp_dir.path().join("tool.zip");
+        let mut writer = zip::ZipWriter::new(fs::File::create(&archive_path).unwrap());
+        let members: [(&str, &[u8]); 4] = [
+            ("bin/tool", b"binary"),
+            ("../evil", b"escaped"),
+            (absolute.to_str().unwrap(), b"absolute"),
+            // No directory entries precede these, so their parents are created
+            // from the file entries alone
+            ("share/doc/deep/README", b"docs"),
+        ];
+        for (name, data) in members {
+            writer.start_file(name, FileOptions::default()).unwrap();
+            writer.write_all(data).unwrap();
+        }
+        writer.finish().unwrap();
+
+        extract_zip(&archive_path, &extract_dir).unwrap();
+
+        assert!(!temp_dir.path().join("evil").exists());
+        assert!(!absolute.exists());
+        assert_eq!(
+            fs::read(extract_dir.join("bin").join("tool")).unwrap(),
+            b"binary"
+        );
+        assert_eq!(
+            fs::read(extract_dir.join("share/doc/deep/README")).unwrap(),
+            b"docs"
+        );
+    }
+
+    #[test]
+    fn test_extract_tar_gz_keeps_members_inside_extract_dir() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        let extract_dir = temp_dir.path().join("extract");
+        let outside = temp_dir.path().join("outside");
+        fs::create_dir_all(&extract_dir).unwrap();
+        let absolute = outside.join("absolute");
+
+        let archive_path = temp_dir.path().join("tool.tar.gz");
+        let encoder = flate2::write::GzEncoder::new(
+            fs::File::create(&archive_path).unwrap(),
+            flate2::Compression::fast(),
+        );
+        let mut builder = tar::Builder::new(encoder);
+        append_raw(&mut builder, "bin/tool", b"binary");
+        append_raw(&mut builder, "../escape", b"escaped");
+        append_raw(&mut builder, absolute.to_str().unwrap(), b"absolute");
+        append_raw(&mut builder, "README", b"docs");
+        builder.into_inner().unwrap().finish().unwrap();
+
+        extract_tar_gz(&archive_path, &extract_dir).unwrap();
+
+        assert!(!temp_dir.path().join("escape").exists());
+        assert!(!absolute.exists());
+        assert!(!outside.exists());
+        assert_eq!(
+            fs::read(extract_dir.join("bin").join("tool")).unwrap(),
+            b"binary"
+        );
+        assert_eq!(fs::read(extract_dir.join("README")).unwrap(), b"docs");
+    }
+}
@@ -2,19 +2,38 @@
 //!
 //! Provides functions for querying GitHub releases and constructing API URLs.
 
-use crate::types::GitHubRelease;
+use crate::types::{CachedRelease, GitHubRelease, ReleaseCache};
 use anyhow::Result;
+use chrono::{DateTime, Duration, Utc};
 use reqwest::StatusCode;
+use serde::Deserialize;
+use std::collections::{HashMap, VecDeque};
 use std::error::Error;
 use std::fmt;
+use std::sync::Mutex;
+use std::time::Instant;
 
 #[derive(Debug)]
 pub enum GitHubReleaseError {
-    TagNotFound { repo: String, version: String },
-    LatestNotFound { repo: String },
-    RepoNotFound { repo: String },
-    RateLimited { repo: String },
-    RequestFailed { repo: String, status: StatusCode },
+    TagNotFound {
+        repo: String,
+        version: String,
+    },
+    LatestNotFound {
+        repo: String,
+    },
+    RepoNotFound {
+        repo: String,
+    },
+    /// `reset_at` is the Unix time from `X-RateLimit-Reset`, when GitHub sent it.
+    RateLimited {
+        repo: String,
+        reset_at: Option<i64>,
+    },
+    RequestFailed {
+        repo: String,
+        status: StatusCode,
+    },
 }
 
 impl fmt::Display for GitHubReleaseError {
@@ -29,7 +48,7 @@ impl fmt::Display for GitHubReleaseError {
             GitHubReleaseError::RepoNotFound { repo } => {
                 write!(f, "Repository '{}' not found on GitHub", repo)
             }
-            GitHubReleaseError::RateLimited { repo } => {
+            GitHubReleaseError::RateLimited { repo, .. } => {
                 write!(f, "GitHub API rate limit reached while querying {}", repo)
             }
             GitHubReleaseError::RequestFailed { repo, status } => {
@@ -41,6 +60,35 @@ impl fmt::Display for GitHubReleaseError {
 
 impl Error for GitHubReleaseError {}
 
+/// How long a cached latest-release lookup is trusted without contacting GitHub.
+pub const RELEASE_CACHE_TTL_HOURS: i64 = 24;
+
+const GITHUB_GRAPHQL_URL: &str = "https://api.github.com/graphql";
+
+/// Repositories per GraphQL query; keeps each query well under GitHub's node limits.
+const GRAPHQL_BATCH_SIZE: usize = 50;
+
+/// Client-side request budget per rolling minute.
+const REQUESTS_PER_MINUTE: usize = 30;
+
+/// Retries after a server error or timeout, backing off 0.5s, 1s, 2s.
+const MAX_RETRIES: u32 = 3;
+
+/// Longest `Retry-After` a single invocation is willing to sleep for.
+const MAX_RETRY_AFTER_SECS: u64 = 10;
+
+/// Time allowed for the TCP connect that checks whether GitHub is reachable.
+const PROBE_TIMEOUT: std::time::Duration = std::time::Duration::from_millis(200);
+
+/// How long a failed reachability probe keeps checks on cached answers.
+const OFFLINE_RECHECK_SECS: i64 = 60;
+
+/// Variables reqwest reads to proxy an https request.
+const HTTPS_PROXY_VARS: &[&str] = &["HTTPS_PROXY", "https_proxy", "ALL_PROXY", "all_proxy"];
+
+/// Send times of recent GitHub requests, for the [`REQUESTS_PER_MINUTE`] budget.
+static REQUEST_TIMES: Mutex<VecDeque<Instant>> = Mutex::new(VecDeque::new());
+
 /// Build GitHub API URL for fetching release information
 ///
 /// # Arguments
@@ -66,66 +114,364 @@ pub fn build_gh_release_url(repo: &str, version: Option<&str>) -> String {
 pub async fn get_gh_release_info(repo: &str, version: Option<&str>) -> Result<GitHubRelease> {
     let url = build_gh_release_url(repo, version);
 
-    let client = reqwest::Client::new();
-    let mut request = client.get(&url).header("User-Agent", "tooler");
-    if let Ok(token) = std::env::var("GITHUB_TOKEN") {
-        let token = token.trim();
-        if !token.is_empty() {
-            request = request.bearer_auth(token);
+    let response = send_with_retry(github_request(&url)).await?;
+
+    if !response.status().is_success() {
+        return Err(release_error(repo, version, &response).into());
+    }
+
+    let release: GitHubRelease = response.json().await?;
+    Ok(release)
+}
+
+/// Resolve the latest release of `repo`, starting from its previous cache entry.
+///
+/// Entries younger than [`RELEASE_CACHE_TTL_HOURS`] are returned without any
+/// network traffic. Older entries are revalidated with `If-None-Match`, so an
+/// unchanged release costs a header-only `304 Not Modified` response. The
+/// returned entry should be written back to the cache by the caller.
+pub async fn fetch_latest_release(
+    repo: &str,
+    cached: Option<&CachedRelease>,
+) -> Result<CachedRelease> {
+    let now = Utc::now();
+    if let Some(cached) = cached {
+        if is_cache_entry_fresh(cached, now) {
+            tracing::debug!(
+                "Using cached latest release for {}: {}",
+                repo,
+                cached.tag_name
+            );
+            return Ok(cached.clone());
         }
     }
-    let response = request.send().await?;
+    revalidate_latest_release(repo, cached).await
+}
+
+/// Ask GitHub for the latest release of `repo` regardless of the cache entry's
+/// age. With an ETag from `cached`, an unchanged release is confirmed by a
+/// header-only `304 Not Modified` response.
+pub async fn revalidate_latest_release(
+    repo: &str,
+    cached: Option<&CachedRelease>,
+) -> Result<CachedRelease> {
+    let now = Utc::now();
+    let url = build_gh_release_url(repo, None);
+    let mut request = github_request(&url);
+    if let Some(etag) = cached.and_then(|c| c.etag.as_deref()) {
+        request = request.header(reqwest::header::IF_NONE_MATCH, etag);
+    }
+    let response = send_with_retry(request).await?;
 
+    if response.status() == StatusCode::NOT_MODIFIED {
+        if let Some(cached) = cached {
+            tracing::debug!(
+                "Latest release for {} not modified: {}",
+                repo,
+                cached.tag_name
+            );
+            return Ok(CachedRelease {
+                fetched_at: now.to_rfc3339(),
+                ..cached.clone()
+            });
+        }
+    }
     if !response.status().is_success() {
-        let status = response.status();
-        if status == StatusCode::NOT_FOUND {
-            if let Some(v) = version {
-                if v == "latest" || v == "default" {
-                    return Err(GitHubReleaseError::LatestNotFound {
-                        repo: repo.to_string(),
-                    }
-                    .into());
-                }
-                return Err(GitHubReleaseError::TagNotFound {
-                    repo: repo.to_string(),
-                    version: v.to_string(),
-                }
-                .into());
+        return Err(release_error(repo, None, &response).into());
+    }
+
+    let etag = response
+        .headers()
+        .get(reqwest::header::ETAG)
+        .and_then(|v| v.to_str().ok())
+        .map(str::to_string);
+    let release: GitHubRelease = response.json().await?;
+    Ok(CachedRelease {
+        tag_name: release.tag_name,
+        etag,
+        fetched_at: now.to_rfc3339(),
+    })
+}
+
+/// Fetch the latest release tag of many repositories with batched GraphQL queries.
+///
+/// GraphQL requires authentication, so this returns `Ok(None)` when no
+/// `GITHUB_TOKEN` is set and callers should fall back to REST lookups.
+/// Repositories without a release, or that do not exist, are absent from the map.
+pub async fn get_latest_release_tags(repos: &[String]) -> Result<Option<HashMap<String, String>>> {
+    let Some(token) = github_token() else {
+        return Ok(None);
+    };
+
+    let client = crate::download::http_client();
+    let mut tags = HashMap::new();
+    for batch in repos.chunks(GRAPHQL_BATCH_SIZE) {
+        let query = build_latest_releases_query(batch);
+        let request = client
+            .post(GITHUB_GRAPHQL_URL)
+            .bearer_auth(&token)
+            .json(&serde_json::json!({ "query": query }));
+        let response = send_with_retry(request).await?;
+        if !response.status().is_success() {
+            return Err(anyhow::anyhow!(
+                "GitHub GraphQL request failed: {}",
+                response.status()
+            ));
+        }
+
+        let body: LatestReleasesResponse = response.json().await?;
+        let data = body
+            .data
+            .ok_or_else(|| anyhow::anyhow!("GitHub GraphQL response has no data"))?;
+        for (alias, repository) in data {
+            let repo = alias
+                .strip_prefix('r')
+                .and_then(|idx| idx.parse::<usize>().ok())
+                .and_then(|idx| batch.get(idx));
+            if let (Some(repo), Some(release)) = (repo, repository.and_then(|r| r.latest_release)) {
+                tags.insert(repo.clone(), release.tag_name);
             }
-            return Err(GitHubReleaseError::LatestNotFound {
-                repo: repo.to_string(),
+        }
+    }
+    Ok(Some(tags))
+}
+
+/// The parts of a latest-releases GraphQL response that are read, keyed by alias;
+/// serde skips everything else without building it.
+#[derive(Deserialize)]
+struct LatestReleasesResponse {
+    data: Option<HashMap<String, Option<LatestReleaseRepository>>>,
+}
+
+#[derive(Deserialize)]
+#[serde(rename_all = "camelCase")]
+struct LatestReleaseRepository {
+    latest_release: Option<LatestReleaseTag>,
+}
+
+#[derive(Deserialize)]
+#[serde(rename_all = "camelCase")]
+struct LatestReleaseTag {
+    tag_name: String,
+}
+
+/// Build one GraphQL document that asks for the latest release of every repo,
+/// aliasing each `repository` field as `r<index>`.
+fn build_latest_releases_query(repos: &[String]) -> String {
+    let mut query = String::from("query {");
+    for (idx, repo) in repos.iter().enumerate() {
+        let Some((owner, name)) = repo.split_once('/') else {
+            continue;
+        };
+        // JSON string escaping is valid GraphQL string escaping.
+        query.push_str(&format!(
+            " r{}: repository(owner: {}, name: {}) {{ latestRelease {{ tagName }} }}",
+            idx,
+            serde_json::Value::from(owner),
+            serde_json::Value::from(name)
+        ));
+    }
+    query.push_str(" }");
+    query
+}
+
+/// Store a freshly fetched latest tag, keeping the ETag when the tag is unchanged.
+pub fn record_latest_release(cache: &mut ReleaseCache, repo: &str, tag_name: &str) {
+    let now = Utc::now().to_rfc3339();
+    match cache.releases.get_mut(repo) {
+        Some(entry) if entry.tag_name == tag_name => entry.fetched_at = now,
+        _ => {
+            cache.releases.insert(
+                repo.to_string(),
+                CachedRelease {
+                    tag_name: tag_name.to_string(),
+                    etag: None,
+                    fetched_at: now,
+                },
+            );
+        }
+    }
+}
+
+/// Whether the GitHub API accepts connections, probed with one short TCP connect
+/// so that an offline machine does not wait out a full request timeout per tool.
+/// A failed probe is recorded in `cache` and answers for the next minute.
+pub async fn api_reachable(cache: &mut ReleaseCache, now: i64) -> bool {
+    if cache
+        .offline_at
+        .is_some_and(|at| (0..OFFLINE_RECHECK_SECS).contains(&(now - at)))
+    {
+        return false;
+    }
+    // The direct connect would bypass a configured proxy, and fail behind a
+    // mandatory one; requests then go through the proxy unprobed.
+    if https_proxy_configured(|name| std::env::var_os(name)) {
+        cache.offline_at = None;
+        return true;
+    }
+    let probe = tokio::net::TcpStream::connect(("api.github.com", 443));
+    let reachable = matches!(tokio::time::timeout(PROBE_TIMEOUT, probe).await, Ok(Ok(_)));
+    cache.offline_at = if reachable { None } else { Some(now) };
+    reachable
+}
+
+/// Whether the environment read through `var` routes https requests through a proxy.
+fn https_proxy_configured(var: impl Fn(&str) -> Option<std::ffi::OsString>) -> bool {
+    HTTPS_PROXY_VARS
+        .iter()
+        .any(|name| var(name).is_some_and(|value| !value.is_empty()))
+}
+
+/// Whether `cache` can answer a latest-release lookup for `repo` without a request.
+pub fn has_fresh_release(cache: &ReleaseCache, repo: &str) -> bool {
+    cache
+        .releases
+        .get(repo)
+        .is_some_and(|entry| is_cache_entry_fresh(entry, Utc::now()))
+}
+
+fn is_cache_entry_fresh(entry: &CachedRelease, now: DateTime<Utc>) -> bool {
+    entry
+        .fetched_at
+        .parse::<DateTime<Utc>>()
+        .is_ok_and(|fetched_at| now - fetched_at < Duration::hours(RELEASE_CACHE_TTL_HOURS))
+}
+
+/// Build a GitHub API request with the headers every call needs.
+fn github_request(url: &str) -> reqwest::RequestBuilder {
+    let request = crate::download::http_client().get(url);
+    match github_token() {
+        Some(token) => request.bearer_auth(token),
+        None => request,
+    }
+}
+
+/// Send a GitHub API request within the client-side budget, retrying server
+/// errors and timeouts with exponential backoff and honoring short
+/// `Retry-After` delays. Anything else, including connection failures when
+/// offline, is returned to the caller as-is.
+async fn send_with_retry(request: reqwest::RequestBuilder) -> Result<reqwest::Response> {
+    let mut attempt = 0;
+    loop {
+        wait_for_request_budget().await;
+        let Some(this_try) = request.try_clone() else {
+            return Ok(request.send().await?);
+        };
+        let result = this_try.send().await;
+        let delay = match &result {
+            Ok(response) if response.status().is_server_error() => Some(backoff_delay(attempt)),
+            Ok(response) => retry_after(response),
+            Err(e) if e.is_timeout() => Some(backoff_delay(attempt)),
+            Err(_) => None,
+        };
+        match delay {
+            Some(delay) if attempt < MAX_RETRIES => {
+                tracing::debug!("Retrying GitHub request in {:?}", delay);
+                tokio::time::sleep(delay).await;
+                attempt += 1;
             }
-            .into());
+            _ => return Ok(result?),
         }
-        // GitHub returns 403 for non-existent repos (to prevent enumeration)
-        // and also for rate limiting. Check the X-RateLimit-Remaining header.
-        if status == StatusCode::FORBIDDEN {
-            let rate_remaining = response
+    }
+}
+
+fn backoff_delay(attempt: u32) -> std::time::Duration {
+    std::time::Duration::from_millis(500 << attempt)
+}
+
+/// Delay requested by a `429`/`403` response's `Retry-After` header, if it is
+/// short enough to wait for.
+fn retry_after(response: &reqwest::Response) -> Option<std::time::Duration> {
+    let status = response.status();
+    if status != StatusCode::TOO_MANY_REQUESTS && status != StatusCode::FORBIDDEN {
+        return None;
+    }
+    let secs = response
+        .headers()
+        .get(reqwest::header::RETRY_AFTER)?
+        .to_str()
+        .ok()?
+        .trim()
+        .parse::<u64>()
+        .ok()?;
+    (secs <= MAX_RETRY_AFTER_SECS).then(|| std::time::Duration::from_secs(secs))
+}
+
+async fn wait_for_request_budget() {
+    let window = std::time::Duration::from_secs(60);
+    loop {
+        let wait = {
+            let mut times = REQUEST_TIMES.lock().unwrap_or_else(|e| e.into_inner());
+            let now = Instant::now();
+            while times
+                .front()
+                .is_some_and(|sent| now.duration_since(*sent) >= window)
+            {
+                times.pop_front();
+            }
+            if times.len() < REQUESTS_PER_MINUTE {
+                times.push_back(now);
+                return;
+            }
+            window - now.duration_since(times[0])
+        };
+        tracing::debug!("GitHub request budget exhausted, waiting {:?}", wait);
+        tokio::time::sleep(wait).await;
+    }
+}
+
+fn github_token() -> Option<String> {
+    let token = std::env::var("GITHUB_TOKEN").ok()?;
+    let token = token.trim();
+    (!token.is_empty()).then(|| token.to_string())
+}
+
+/// Map an unsuccessful release response to a [`GitHubReleaseError`].
+fn release_error(
+    repo: &str,
+    version: Option<&str>,
+    response: &reqwest::Response,
+) -> GitHubReleaseError {
+    let status = response.status();
+    if status == StatusCode::NOT_FOUND {
+        return match version {
+            Some(v) if v != "latest" && v != "default" => GitHubReleaseError::TagNotFound {
+                repo: repo.to_string(),
+                version: v.to_string(),
+            },
+            _ => GitHubReleaseError::LatestNotFound {
+                repo: repo.to_string(),
+            },
+        };
+    }
+    // GitHub returns 403 for non-existent repos (to prevent enumeration)
+    // and also for rate limiting. Check the X-RateLimit-Remaining header.
+    if status == StatusCode::FORBIDDEN {
+        let rate_remaining = response
+            .headers()
+            .get("x-ratelimit-remaining")
+            .and_then(|v| v.to_str().ok())
+            .and_then(|v| v.parse::<u32>().ok());
+        if rate_remaining == Some(0) {
+            let reset_at = response
                 .headers()
-                .get("x-ratelimit-remaining")
+                .get("x-ratelimit-reset")
                 .and_then(|v| v.to_str().ok())
-                .and_then(|v| v.parse::<u32>().ok());
-            if rate_remaining == Some(0) {
-                return Err(GitHubReleaseError::RateLimited {
-                    repo: repo.to_string(),
-                }
-                .into());
-            }
-            // 403 with remaining rate limit means the repo doesn't exist or is private
-            return Err(GitHubReleaseError::RepoNotFound {
+                .and_then(|v| v.parse::<i64>().ok());
+            return GitHubReleaseError::RateLimited {
                 repo: repo.to_string(),
-            }
-            .into());
+                reset_at,
+            };
         }
-        return Err(GitHubReleaseError::RequestFailed {
+        // 403 with remaining rate limit means the repo doesn't exist or is private
+        return GitHubReleaseError::RepoNotFound {
             repo: repo.to_string(),
-            status,
-        }
-        .into());
+        };
+    }
+    GitHubReleaseError::RequestFailed {
+        repo: repo.to_string(),
+        status,
     }
-
-    let release: GitHubRelease = response.json().await?;
-    Ok(release)
 }
 
 /// Stub for discovering versions from URL-based tools
@@ -171,4 +517,93 @@ mod tests {
             "https://api.github.com/repos/owner/repo/releases/tags/prefix/v1.0.0"
         );
     }
+
+    #[test]
+    fn test_https_proxy_skips_reachability_probe() {
+        let env = |vars: &'static [(&'static str, &'static str)]| {
+            move |name: &str| {
+                vars.iter()
+                    .find(|(key, _)| *key == name)
+                    .map(|(_, value)| std::ffi::OsString::from(value))
+            }
+        };
+        assert!(https_proxy_configured(env(&[(
+            "HTTPS_PROXY",
+            "http://proxy:3128"
+        )])));
+        assert!(https_proxy_configured(env(&[(
+            "all_proxy",
+            "socks5://proxy:1080"
+        )])));
+        assert!(!https_proxy_configured(env(&[("HTTPS_PROXY", "")])));
+        // HTTP_PROXY only applies to plain http URLs, not the GitHub API
+        assert!(!https_proxy_configured(env(&[(
+            "HTTP_PROXY",
+            "http://proxy:3128"
+        )])));
+        assert!(!https_proxy_configured(env(&[])));
+    }
+
+    #[test]
+    fn test_backoff_delay_doubles() {
+        assert_eq!(backoff_delay(0), std::time::Duration::from_millis(500));
+        assert_eq!(backoff_delay(1), std::time::Duration::from_secs(1));
+        assert_eq!(backoff_delay(2), std::time::Duration::from_secs(2));
+    }
+
+    #[test]
+    fn test_build_latest_releases_query() {
+        let repos = vec![
+            "derailed/k9s".to_string(),
+            "not-a-repo".to_string(),
+            "cli/cli".to_string(),
+        ];
+        let query = build_latest_releases_query(&repos);
+        assert!(query.contains(
+            r#"r0: repository(owner: "derailed", name: "k9s") { latestRelease { tagName } }"#
+        ));
+        assert!(!query.contains("r1:"));
+        assert!(query.contains(r#"r2: repository(owner: "cli", name: "cli")"#));
+    }
+
+    #[test]
+    fn test_record_latest_release_keeps_etag_for_same_tag() {
+        let mut cache = ReleaseCache::default();
+        cache.releases.insert(
+            "owner/repo".to_string(),
+            CachedRelease {
+                tag_name: "v1.0.0".to_string(),
+                etag: Some("\"abc\"".to_string()),
+                fetched_at: "2020-01-01T00:00:00Z".to_string(),
+            },
+        );
+
+        record_latest_release(&mut cache, "owner/repo", "v1.0.0");
+        assert!(cache.releases["owner/repo"].etag.is_some());
+        assert!(has_fresh_release(&cache, "owner/repo"));
+
+        record_latest_release(&mut cache, "owner/repo", "v1.1.0");
+        assert_eq!(cache.releases["owner/repo"].tag_name, "v1.1.0");
+        assert!(cache.releases["owner/repo"].etag.is_none());
+    }
+
+    #[test]
+    fn test_release_cache_entry_freshness() {
+        let now = Utc::now();
+        let entry = |age: Duration| CachedRelease {
+            tag_name: "v1.0.0".to_string(),
+            etag: Some("\"abc\"".to_string()),
+            fetched_at: (now - age).to_rfc3339(),
+        };
+
+        assert!(is_cache_entry_fresh(&entry(Duration::hours(1)), now));
+        assert!(!is_cache_entry_fresh(
+            &entry(Duration::hours(RELEASE_CACHE_TTL_HOURS + 1)),
+            now
+        ));
+
+        let mut unparsable = entry(Duration::zero());
+        unparsable.fetched_at = "not-a-date".to_string();
+        assert!(!is_cache_entry_fresh(&unparsable, now));
+    }
 }
@@ -5,20 +5,36 @@ use crate::tool_id::ToolIdentifier;
 use crate::types::*;
 use anyhow::{anyhow, Result};
 use chrono::{DateTime, Utc};
+use futures_util::stream::{self, StreamExt};
+use std::borrow::Cow;
+use std::collections::HashMap;
 use std::fs;
-use std::io::{self, Write};
+use std::io::{self, IsTerminal, Write};
 use std::path::PathBuf;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::OnceLock;
 use walkdir::WalkDir;
 
 pub mod github;
-pub use github::{discover_url_versions, get_gh_release_info};
+pub use github::{
+    discover_url_versions, fetch_latest_release, get_gh_release_info, get_latest_release_tags,
+    revalidate_latest_release,
+};
 
-pub fn list_installed_tools(config: &ToolerConfig) {
+/// Maximum number of GitHub release lookups in flight during an update check.
+const UPDATE_CHECK_CONCURRENCY: usize = 8;
+
+/// How many tool downloads run at once when several tools are installed together.
+pub const INSTALL_CONCURRENCY: usize = 4;
+
+/// Print the installed tools through one buffered, locked stdout handle.
+pub fn list_installed_tools(config: &ToolerConfig) -> io::Result<()> {
     use console::style;
-    println!("--- Installed Tooler Tools ---");
+    let mut out = io::BufWriter::new(io::stdout().lock());
+    writeln!(out, "--- Installed Tooler Tools ---")?;
     if config.tools.is_empty() {
-        println!("  No tools installed yet.");
-        return;
+        writeln!(out, "  No tools installed yet.")?;
+        return out.flush();
     }
 
     let mut tools: Vec<_> = config.tools.values().collect();
@@ -79,7 +95,8 @@ pub fn list_installed_tools(config: &ToolerConfig) {
             Forge::Url => "🔗",
         };
 
-        println!(
+        writeln!(
+            out,
             "  - {} ({}) {}{}{}[{} | {} | {}]{}",
             info.repo,
             info.version,
@@ -90,15 +107,121 @@ pub fn list_installed_tools(config: &ToolerConfig) {
             arch,
             age_colored,
             update_note
-        );
-        println!("    Path:    {}\n", info.executable_path);
+        )?;
+        writeln!(out, "    Path:    {}\n", info.executable_path)?;
     }
-    println!("------------------------------");
+    writeln!(out, "------------------------------")?;
+    out.flush()
+}
+
+/// Whether `run` should look for updates in the background. The notice would go
+/// unseen in CI or when stderr is not a terminal, so the check is skipped there
+/// unless `TOOLER_NO_UPDATE_CHECK` is set to `0` or `false`; any other value
+/// disables it everywhere.
+pub fn update_checks_enabled() -> bool {
+    if let Ok(value) = std::env::var("TOOLER_NO_UPDATE_CHECK") {
+        if !value.is_empty() {
+            return matches!(value.to_lowercase().as_str(), "0" | "false");
+        }
+    }
+    !std::env::var("CI").is_ok_and(|v| !v.is_empty()) && io::stderr().is_terminal()
+}
+
+/// Whether an installed version and a release tag name the same release.
+/// Recovered entries store versions without the `v` that tags usually carry.
+pub fn same_version(installed: &str, tag: &str) -> bool {
+    installed.trim_start_matches('v') == tag.trim_start_matches('v')
+}
+
+/// Whether `info` is installed at the latest tag resolved for its repo, so
+/// `update all` has nothing to download for it.
+pub fn is_latest_installed(info: &ToolInfo, latest_tags: &HashMap<String, String>) -> bool {
+    latest_tags
+        .get(&info.repo)
+        .is_some_and(|tag| same_version(&info.version, tag))
+        && std::path::Path::new(&info.executable_path).exists()
 }
 
-pub async fn check_for_updates(config: &mut ToolerConfig, tool_key: Option<&str>) -> Result<()> {
+/// Resolve the current latest release tag of each GitHub repo in `repos` for
+/// `update all`, so that tools already at that tag are not downloaded again.
+///
+/// One batched GraphQL query answers everything when a token is set. Repos it
+/// leaves unresolved, or all of them without a token, are revalidated over REST
+/// against their release-cache ETags, so an unchanged release costs a `304`.
+/// Repos that cannot be resolved are absent from the map.
+pub async fn resolve_latest_tags(repos: &[String]) -> HashMap<String, String> {
+    if repos.is_empty() {
+        return HashMap::new();
+    }
+    let mut tags = match get_latest_release_tags(repos).await {
+        Ok(tags) => tags.unwrap_or_default(),
+        Err(e) => {
+            tracing::debug!("Batched release lookup failed, using REST: {}", e);
+            HashMap::new()
+        }
+    };
+
+    let mut release_cache = load_release_cache();
+    let now = Utc::now().timestamp();
+    let unresolved: Vec<(String, Option<CachedRelease>)> = repos
+        .iter()
+        .filter(|repo| !tags.contains_key(*repo))
+        .map(|repo| (repo.clone(), release_cache.releases.get(repo).cloned()))
+        .collect();
+    let rate_limited = release_cache
+        .rate_limit_reset
+        .is_some_and(|reset| reset > now);
+    if !unresolved.is_empty()
+        && !rate_limited
+        && github::api_reachable(&mut release_cache, now).await
+    {
+        let lookups: Vec<(String, Result<CachedRelease>)> = stream::iter(unresolved)
+            .map(|(repo, cached)| async move {
+                let result = revalidate_latest_release(&repo, cached.as_ref()).await;
+                (repo, result)
+            })
+            .buffer_unordered(UPDATE_CHECK_CONCURRENCY)
+            .collect()
+            .await;
+        for (repo, result) in lookups {
+            match result {
+                Ok(release) => {
+                    tags.insert(repo.clone(), release.tag_name.clone());
+                    release_cache.releases.insert(repo, release);
+                }
+                Err(e) => {
+                    if let Some(github::GitHubReleaseError::RateLimited {
+                        reset_at: Some(reset),
+                        ..
+                    }) = e.downcast_ref::<github::GitHubReleaseError>()
+                    {
+                        release_cache.rate_limit_reset =
+                            release_cache.rate_limit_reset.max(Some(*reset));
+                    }
+                    tracing::debug!("Failed to look up latest release of {}: {}", repo, e);
+                }
+            }
+        }
+    }
+
+    for (repo, tag) in &tags {
+        github::record_latest_release(&mut release_cache, repo, tag);
+    }
+    if let Err(e) = save_release_cache(&release_cache) {
+        tracing::debug!("Failed to save release cache: {}", e);
+    }
+    tags
+}
+
+/// Look up newer releases for stale, unpinned tools without modifying `config`,
+/// so the check can run in the background while a tool executes.
+pub async fn find_available_updates(
+    config: &ToolerConfig,
+    tool_key: Option<&str>,
+) -> Result<UpdateCheck> {
+    let mut check = UpdateCheck::default();
     if config.settings.update_check_days <= 0 {
-        return Ok(());
+        return Ok(check);
     }
 
     if let Some(name) = tool_key {
@@ -114,23 +237,22 @@ pub async fn check_for_updates(config: &mut ToolerConfig, tool_key: Option<&str>
         );
     }
     let now = Utc::now();
-    let mut updates_found = Vec::new();
-    let mut keys_to_update = Vec::new();
-    let mut tools_to_auto_update = Vec::new();
-
-    let stale_tools: Vec<(String, String, String, String)> = config
-        .tools
-        .iter()
-        .filter(|(key, _info)| tool_key.is_none_or(|tk| *key == tk))
+    // A tool is stale once more than `update_check_days` whole days have passed
+    // since its last check, i.e. when that check is at or before this cutoff.
+    let cutoff = now.timestamp() - (config.settings.update_check_days as i64 + 1) * 86_400;
+
+    // A single-tool check looks its entry up directly instead of scanning
+    let candidates: Box<dyn Iterator<Item = (&String, &ToolInfo)>> = match tool_key {
+        Some(key) => Box::new(config.tools.get_key_value(key).into_iter()),
+        None => Box::new(config.tools.iter()),
+    };
+    let stale_tools: Vec<(String, String, String, String)> = candidates
         .filter_map(|(key, info)| {
             if info.pinned {
                 return None;
             }
-            let check_time = info.last_checked.as_deref().unwrap_or(&info.last_accessed);
-
-            if let Ok(last_checked) = check_time.parse::<DateTime<Utc>>() {
-                let days_since_check = (now - last_checked).num_days();
-                if days_since_check > config.settings.update_check_days as i64 {
+            if let Some(last_checked) = info.last_check_timestamp() {
+                if last_checked <= cutoff {
                     return Some((
                         key.clone(),
                         info.tool_name.clone(),
@@ -145,7 +267,119 @@ pub async fn check_for_updates(config: &mut ToolerConfig, tool_key: Option<&str>
 
     if stale_tools.is_empty() {
         tracing::info!("No stale tools to check for updates.");
-        return Ok(());
+        return Ok(check);
+    }
+
+    let mut release_cache = load_release_cache();
+
+    // After GitHub rejected us for rate limiting, stay on cached answers until
+    // the reset time it reported instead of spending more requests.
+    let rate_limit_reset = release_cache
+        .rate_limit_reset
+        .filter(|reset| *reset > now.timestamp());
+    if let Some(reset) = rate_limit_reset {
+        tracing::info!(
+            "GitHub rate limit in effect until {}; using cached releases only",
+            reset
+        );
+    }
+
+    // Resolve every uncached GitHub repo with one batched query when a token
+    // is available; the per-tool loop below then reads from the cache.
+    let uncached_repos: Vec<String> = stale_tools
+        .iter()
+        .filter(|(key, _, repo, _)| {
+            config
+                .tools
+                .get(key)
+                .is_some_and(|t| t.forge == Forge::GitHub)
+                && !github::has_fresh_release(&release_cache, repo)
+        })
+        .map(|(_, _, repo, _)| repo.clone())
+        .collect();
+    // Offline, every request would wait out its timeout; one short probe up
+    // front keeps the check on cached answers instead.
+    let offline_at = release_cache.offline_at;
+    let cache_only = rate_limit_reset.is_some()
+        || (!uncached_repos.is_empty()
+            && !github::api_reachable(&mut release_cache, now.timestamp()).await);
+    if cache_only && rate_limit_reset.is_none() {
+        tracing::info!("GitHub is unreachable; using cached releases only");
+    }
+
+    if uncached_repos.len() > 1 && !cache_only {
+        match get_latest_release_tags(&uncached_repos).await {
+            Ok(Some(tags)) => {
+                for (repo, tag) in &tags {
+                    github::record_latest_release(&mut release_cache, repo, tag);
+                }
+            }
+            Ok(None) => {}
+            Err(e) => tracing::debug!("Batched release lookup failed, using REST: {}", e),
+        }
+    }
+
+    // Each lookup is pure network wait, so run them concurrently; cache hits
+    // resolve immediately without a request.
+    let mut github_checks: Vec<(String, Option<CachedRelease>)> = stale_tools
+        .iter()
+        .filter(|(key, ..)| {
+            config
+                .tools
+                .get(key)
+                .is_some_and(|t| t.forge == Forge::GitHub)
+        })
+        .map(|(_, _, repo, version)| {
+            tracing::info!(
+                "Checking for GitHub update for {} (current: {})...",
+                repo,
+                version
+            );
+            (repo, version)
+        })
+        .filter(|(repo, _)| !cache_only || github::has_fresh_release(&release_cache, repo))
+        .map(|(repo, _)| (repo.clone(), release_cache.releases.get(repo).cloned()))
+        .collect();
+    github_checks.sort_by(|a, b| a.0.cmp(&b.0));
+    github_checks.dedup_by(|a, b| a.0 == b.0);
+    let lookups: Vec<(String, Result<CachedRelease>)> = stream::iter(github_checks)
+        .map(|(repo, cached)| async move {
+            let result = fetch_latest_release(&repo, cached.as_ref()).await;
+            (repo, result)
+        })
+        .buffer_unordered(UPDATE_CHECK_CONCURRENCY)
+        .collect()
+        .await;
+
+    let mut latest_releases: HashMap<String, CachedRelease> = HashMap::new();
+    let mut new_rate_limit_reset = rate_limit_reset;
+    for (repo, result) in lookups {
+        match result {
+            Ok(release) => {
+                latest_releases.insert(repo, release);
+            }
+            Err(e) => {
+                if let Some(github::GitHubReleaseError::RateLimited {
+                    reset_at: Some(reset),
+                    ..
+                }) = e.downcast_ref::<github::GitHubReleaseError>()
+                {
+                    new_rate_limit_reset = new_rate_limit_reset.max(Some(*reset));
+                }
+                tracing::debug!("Failed to check {} for updates: {}", repo, e);
+            }
+        }
+    }
+
+    if !latest_releases.is_empty()
+        || new_rate_limit_reset != release_cache.rate_limit_reset
+        || offline_at != release_cache.offline_at
+    {
+        release_cache.releases.extend(latest_releases.clone());
+        release_cache.rate_limit_reset = new_rate_limit_reset;
+        if let Err(e) = save_release_cache(&release_cache) {
+            tracing::debug!("Failed to save release cache: {}", e);
+        }
     }
 
     for (key, name, repo, version) in stale_tools {
@@ -153,26 +387,18 @@ pub async fn check_for_updates(config: &mut ToolerConfig, tool_key: Option<&str>
 
         match tool_info.forge {
             Forge::GitHub => {
-                tracing::info!(
-                    "Checking for GitHub update for {} (current: {})...",
-                    repo,
-                    version
-                );
-                if let Ok(release) = get_gh_release_info(&repo, Some("latest")).await {
-                    let current_clean = version.trim_start_matches('v');
-                    let latest_clean = release.tag_name.trim_start_matches('v');
-
-                    if latest_clean != current_clean {
-                        if config.settings.auto_update {
-                            tools_to_auto_update.push((name, repo.clone(), release.tag_name));
-                        } else {
-                            updates_found.push(format!(
-                                "Tool {} ({}) has update: {} -> {}",
-                                name, repo, version, release.tag_name
-                            ));
-                        }
+                if let Some(latest_tag) = latest_releases.get(&repo).map(|r| r.tag_name.clone()) {
+                    if !same_version(&version, &latest_tag) {
+                        check.updates.push(PendingUpdate {
+                            key: key.clone(),
+                            tool_name: name,
+                            source: repo,
+                            current_version: version,
+                            latest_version: latest_tag,
+                            forge: Forge::GitHub,
+                        });
                     }
-                    keys_to_update.push(key);
+                    check.checked_keys.push(key);
                 }
             }
             Forge::Url => {
@@ -180,31 +406,67 @@ pub async fn check_for_updates(config: &mut ToolerConfig, tool_key: Option<&str>
                     tracing::info!("Checking for URL update for {} at {}...", name, url);
                     if let Ok(versions) = discover_url_versions(url).await {
                         if let Some(latest) = versions.last() {
-                            let current_clean = version.trim_start_matches('v');
-                            let latest_clean = latest.trim_start_matches('v');
-
-                            if latest_clean != current_clean {
-                                let new_url = url.replace(version.as_str(), latest);
-                                if config.settings.auto_update {
-                                    tools_to_auto_update.push((name, new_url, latest.clone()));
-                                } else {
-                                    updates_found.push(format!(
-                                        "Tool {} (URL) has update: {} -> {} (URL: {})",
-                                        name, version, latest, new_url
-                                    ));
-                                }
+                            if !same_version(&version, latest) {
+                                check.updates.push(PendingUpdate {
+                                    key: key.clone(),
+                                    tool_name: name,
+                                    source: url.replace(version.as_str(), latest),
+                                    current_version: version.clone(),
+                                    latest_version: latest.clone(),
+                                    forge: Forge::Url,
+                                });
                             }
                         }
                     }
-                    keys_to_update.push(key);
+                    check.checked_keys.push(key);
                 }
             }
         }
     }
 
-    for (name, repo, old_version) in tools_to_auto_update {
-        eprintln!("[tooler] Auto-updating {}...", name);
-        match install_or_update_tool(config, &repo, true, None, None).await {
+    Ok(check)
+}
+
+/// Apply an update check: install found updates when `auto_update` is enabled
+/// (otherwise print a notice), then stamp and persist the checked tools.
+pub async fn apply_update_check(config: &mut ToolerConfig, check: UpdateCheck) -> Result<()> {
+    let mut updates_found = Vec::new();
+    let mut auto_updates = Vec::new();
+
+    for update in check.updates {
+        // Skip results that no longer describe the installed version, e.g. a
+        // pending update recorded before the user updated manually.
+        if config
+            .tools
+            .get(&update.key)
+            .is_none_or(|t| t.version != update.current_version)
+        {
+            continue;
+        }
+
+        if !config.settings.auto_update {
+            updates_found.push(match update.forge {
+                Forge::GitHub => format!(
+                    "Tool {} ({}) has update: {} -> {}",
+                    update.tool_name, update.source, update.current_version, update.latest_version
+                ),
+                Forge::Url => format!(
+                    "Tool {} (URL) has update: {} -> {} (URL: {})",
+                    update.tool_name, update.current_version, update.latest_version, update.source
+                ),
+            });
+            continue;
+        }
+
+        eprintln!("[tooler] Auto-updating {}...", update.tool_name);
+        let source = update.source.clone();
+        auto_updates.push((update, source));
+    }
+
+    // Download the auto-updates concurrently, recording each as it finishes
+    let mut dirty = fetch_tools(config, auto_updates, |config, update, fetched| {
+        let repo = update.source;
+        match fetched {
             Ok(_) => {
                 let new_version = config
                     .tools
@@ -212,7 +474,7 @@ pub async fn check_for_updates(config: &mut ToolerConfig, tool_key: Option<&str>
                     .find(|t| t.repo == repo)
                     .map(|t| t.version.clone())
                     .unwrap_or_else(|| "unknown".to_string());
-                let old = old_version.trim_start_matches('v');
+                let old = update.current_version.trim_start_matches('v');
                 let new = new_version.trim_start_matches('v');
                 if old == new {
                     eprintln!("[tooler] {} already at v{}", repo, new);
@@ -222,16 +484,17 @@ pub async fn check_for_updates(config: &mut ToolerConfig, tool_key: Option<&str>
             }
             Err(e) => tracing::error!("Failed to auto-update {}: {}", repo, e),
         }
-    }
+    })
+    .await;
 
-    for key in keys_to_update {
-        if let Some(tool_info) = config.tools.get_mut(&key) {
-            tool_info.last_checked = Some(now.to_rfc3339());
-        }
+    // Stamp all checked tools in memory and persist them with a single write,
+    // whether or not an update was found, so the next run skips them.
+    dirty |= stamp_checked_tools(config, &check.checked_keys);
+    if dirty {
+        save_tool_configs(config)?;
     }
 
     if !updates_found.is_empty() {
-        save_tool_configs(config)?;
         eprintln!("\n--- Tool Updates Available ---");
         for msg in updates_found {
             eprintln!("  {}", msg);
@@ -243,13 +506,159 @@ pub async fn check_for_updates(config: &mut ToolerConfig, tool_key: Option<&str>
     Ok(())
 }
 
+/// Record a check that finished in the background: stamp the checked tools and
+/// keep found updates in the pending file so the next run applies or reports them.
+/// The stamps are only applied in memory; returns whether the config changed so
+/// the caller can save it together with its own changes.
+pub fn record_update_check(config: &mut ToolerConfig, check: UpdateCheck) -> Result<bool> {
+    if !check.updates.is_empty() {
+        let mut pending = load_pending_updates();
+        pending.retain(|p| check.updates.iter().all(|u| u.key != p.key));
+        pending.extend(check.updates);
+        save_pending_updates(&pending)?;
+    }
+    Ok(stamp_checked_tools(config, &check.checked_keys))
+}
+
+/// Remove and return the pending updates recorded for `tool_key`.
+pub fn take_pending_updates(tool_key: &str) -> Vec<PendingUpdate> {
+    let pending = load_pending_updates();
+    if pending.iter().all(|p| p.key != tool_key) {
+        return Vec::new();
+    }
+    let (taken, rest): (Vec<_>, Vec<_>) = pending.into_iter().partition(|p| p.key == tool_key);
+    if let Err(e) = save_pending_updates(&rest) {
+        tracing::debug!("Failed to save pending updates: {}", e);
+    }
+    taken
+}
+
+fn stamp_checked_tools(config: &mut ToolerConfig, keys: &[String]) -> bool {
+    let now = Utc::now();
+    let mut dirty = false;
+    for key in keys {
+        if let Some(tool_info) = config.tools.get_mut(key) {
+            tool_info.mark_checked(now);
+            dirty = true;
+        }
+    }
+    dirty
+}
+
+/// A downloaded tool that has not been recorded in the config yet.
+pub struct FetchedTool {
+    pub executable_path: PathBuf,
+    /// Config key of the tool's entry
+    pub key: String,
+    /// New config entry, or `None` when the version was already installed
+    pub entry: Option<ToolInfo>,
+}
+
+/// Fetch a tool and record it in the config. The returned entry has already
+/// been recorded; its key locates the tool's config entry.
 pub async fn install_or_update_tool(
     config: &mut ToolerConfig,
     tool_id: &str,
     is_update: bool,
     asset_name: Option<&str>,
     parse_release_body: Option<bool>,
-) -> Result<PathBuf> {
+) -> Result<FetchedTool> {
+    let release_body = ReleaseBodyGate::new(config.settings.parse_release_body.clone());
+    let mut fetched = fetch_tool(
+        &release_body,
+        tool_id,
+        is_update,
+        asset_name,
+        parse_release_body,
+    )
+    .await;
+    let answered = release_body.record(config);
+    if record_fetched_tool(config, fetched.as_mut().ok()) || answered {
+        save_tool_configs(config)?;
+    }
+    fetched
+}
+
+/// Update several tools at once, handing each result to `on_fetched` in the
+/// order the downloads finish. Entries and a prompt's release-body answer are
+/// recorded in `config` without saving it; returns whether the config changed.
+pub async fn fetch_tools<T>(
+    config: &mut ToolerConfig,
+    tools: Vec<(T, String)>,
+    mut on_fetched: impl FnMut(&ToolerConfig, T, Result<FetchedTool>),
+) -> bool {
+    let release_body = ReleaseBodyGate::new(config.settings.parse_release_body.clone());
+    let mut fetches = stream::iter(tools)
+        .map(|(item, tool_id)| {
+            let release_body = &release_body;
+            async move {
+                let fetched = fetch_tool(release_body, &tool_id, true, None, None).await;
+                (item, fetched)
+            }
+        })
+        .buffer_unordered(INSTALL_CONCURRENCY);
+    let mut changed = false;
+    while let Some((item, mut fetched)) = fetches.next().await {
+        changed |= record_fetched_tool(config, fetched.as_mut().ok());
+        on_fetched(config, item, fetched);
+    }
+    drop(fetches);
+    release_body.record(config) || changed
+}
+
+/// Record a fetched tool's new entry, if it has one, without saving the config.
+/// Returns whether the config changed.
+fn record_fetched_tool(config: &mut ToolerConfig, fetched: Option<&mut FetchedTool>) -> bool {
+    match fetched {
+        Some(fetched) => match fetched.entry.take() {
+            Some(tool_info) => {
+                config.insert_tool(fetched.key.clone(), tool_info);
+                true
+            }
+            None => false,
+        },
+        None => false,
+    }
+}
+
+/// The release-body policy shared by fetches that run at once. Prompts are
+/// asked one at a time under its lock, so an `always` or `never` answer is
+/// seen by every fetch still waiting and is the policy that gets saved.
+pub struct ReleaseBodyGate {
+    configured: ReleaseBodyPolicy,
+    policy: tokio::sync::Mutex<ReleaseBodyPolicy>,
+}
+
+impl ReleaseBodyGate {
+    pub fn new(configured: ReleaseBodyPolicy) -> Self {
+        Self {
+            policy: tokio::sync::Mutex::new(configured.clone()),
+            configured,
+        }
+    }
+
+    /// Save a prompt's answer into the config settings. Returns whether the
+    /// setting changed; without an answer the configured value is left alone.
+    pub fn record(self, config: &mut ToolerConfig) -> bool {
+        let policy = self.policy.into_inner();
+        if policy == self.configured || config.settings.parse_release_body == policy {
+            return false;
+        }
+        config.settings.parse_release_body = policy;
+        true
+    }
+}
+
+/// Download and unpack a tool without touching the config, so several fetches
+/// can run at once. `release_body` holds the configured release-body policy
+/// and keeps the answer when the user picks `always` or `never` at the prompt.
+pub async fn fetch_tool(
+    release_body: &ReleaseBodyGate,
+    tool_id: &str,
+    is_update: bool,
+    asset_name: Option<&str>,
+    parse_release_body: Option<bool>,
+) -> Result<FetchedTool> {
     let tool_identifier = ToolIdentifier::parse(tool_id).map_err(|e| anyhow!(e))?;
     let system_info = get_system_info();
 
@@ -294,7 +703,7 @@ pub async fn install_or_update_tool(
                         let policy = match parse_release_body {
                             Some(true) => ReleaseBodyPolicy::Always,
                             Some(false) => ReleaseBodyPolicy::Never,
-                            None => config.settings.parse_release_body.clone(),
+                            None => release_body.policy.lock().await.clone(),
                         };
                         if policy == ReleaseBodyPolicy::Never {
                             return Err(anyhow!(
@@ -326,12 +735,14 @@ pub async fn install_or_update_tool(
                             })?;
 
                         approve_release_body_asset(
-                            config,
+                            release_body,
                             &tool_identifier.full_repo(),
                             &release_info.tag_name,
                             &parsed_asset,
-                            policy,
-                        )?;
+                            parse_release_body,
+                            read_release_body_answer,
+                        )
+                        .await?;
                         parsed_asset.download_url
                     }
                 }
@@ -379,7 +790,11 @@ pub async fn install_or_update_tool(
             &system_info.os,
             &archive_path,
         ) {
-            return Ok(exec_path);
+            return Ok(FetchedTool {
+                executable_path: exec_path,
+                key: tool_identifier.config_key(),
+                entry: None,
+            });
         }
     }
 
@@ -387,7 +802,11 @@ pub async fn install_or_update_tool(
     let archive_name = download_url.split('/').next_back().unwrap_or("unknown");
     let archive_path = version_dir.join(archive_name);
 
-    download_file(&download_url, &archive_path).await?;
+    // Empty the trash left by `remove` while the download waits on the network
+    let purge = tokio::task::spawn_blocking(empty_trash);
+    let downloaded = download_file(&download_url, &archive_path).await;
+    let _ = purge.await;
+    downloaded?;
 
     let executable_path = if archive_name.ends_with(".zip")
         || archive_name.ends_with(".tar.gz")
@@ -399,6 +818,7 @@ pub async fn install_or_update_tool(
             &version_dir,
             &tool_identifier.tool_name(),
             &tool_identifier.full_repo(),
+            system_info,
         )?
     } else {
         #[cfg(unix)]
@@ -412,6 +832,7 @@ pub async fn install_or_update_tool(
     };
 
     // 5. Update config
+    let now = Utc::now();
     let tool_info = ToolInfo {
         tool_name: tool_identifier.tool_name().to_lowercase(),
         repo: tool_identifier.full_repo(),
@@ -427,27 +848,39 @@ pub async fn install_or_update_tool(
             "binary".to_string()
         },
         pinned: tool_identifier.is_pinned(),
-        installed_at: Utc::now().to_rfc3339(),
-        last_accessed: Utc::now().to_rfc3339(),
-        last_checked: Some(Utc::now().to_rfc3339()),
+        installed_at: now.to_rfc3339(),
+        last_accessed: now.to_rfc3339(),
+        last_checked: Some(now.to_rfc3339()),
+        last_accessed_ts: Some(now.timestamp()),
+        last_checked_ts: Some(now.timestamp()),
         forge: tool_identifier.forge.clone(),
         original_url,
     };
 
-    let key = tool_identifier.config_key();
-    config.tools.insert(key, tool_info);
-    save_tool_configs(config)?;
-
-    Ok(executable_path)
+    Ok(FetchedTool {
+        executable_path,
+        key: tool_identifier.config_key(),
+        entry: Some(tool_info),
+    })
 }
 
-fn approve_release_body_asset(
-    config: &mut ToolerConfig,
+/// Approve a binary URL parsed from a release body. With no command-line
+/// override the shared policy decides, and `Ask` prompts on a blocking thread
+/// while the lock is held, so concurrent fetches never prompt over each other.
+async fn approve_release_body_asset(
+    release_body: &ReleaseBodyGate,
     repo: &str,
     version: &str,
     asset: &AssetInfo,
-    policy: ReleaseBodyPolicy,
+    parse_release_body: Option<bool>,
+    read_answer: fn() -> io::Result<String>,
 ) -> Result<()> {
+    let mut saved_policy = release_body.policy.lock().await;
+    let policy = match parse_release_body {
+        Some(true) => ReleaseBodyPolicy::Always,
+        Some(false) => ReleaseBodyPolicy::Never,
+        None => saved_policy.clone(),
+    };
     match policy {
         ReleaseBodyPolicy::Always => {
             eprintln!(
@@ -461,26 +894,26 @@ fn approve_release_body_asset(
             asset.download_url
         )),
         ReleaseBodyPolicy::Ask => {
-            eprintln!(
-                "Release body parsing selected binary for {} {}:",
-                repo, version
-            );
-            eprintln!("  {}", asset.download_url);
-            eprint!("Download this binary? [ask] once, [always], [never]: ");
-            io::stderr().flush()?;
+            // Print above the download progress bars rather than through them
+            crate::download::progress().suspend(|| -> io::Result<()> {
+                eprintln!(
+                    "Release body parsing selected binary for {} {}:",
+                    repo, version
+                );
+                eprintln!("  {}", asset.download_url);
+                eprint!("Download this binary? [ask] once, [always], [never]: ");
+                io::stderr().flush()
+            })?;
 
-            let mut input = String::new();
-            io::stdin().read_line(&mut input)?;
+            let input = tokio::task::spawn_blocking(read_answer).await??;
             match input.trim().to_ascii_lowercase().as_str() {
                 "ask" | "y" | "yes" => Ok(()),
                 "always" | "a" => {
-                    config.settings.parse_release_body = ReleaseBodyPolicy::Always;
-                    save_tool_configs(config)?;
+                    *saved_policy = ReleaseBodyPolicy::Always;
                     Ok(())
                 }
                 "never" | "n" | "no" => {
-                    config.settings.parse_release_body = ReleaseBodyPolicy::Never;
-                    save_tool_configs(config)?;
+                    *saved_policy = ReleaseBodyPolicy::Never;
                     Err(anyhow!("Release body binary download rejected"))
                 }
                 _ => Err(anyhow!("Release body binary download rejected")),
@@ -489,6 +922,12 @@ fn approve_release_body_asset(
     }
 }
 
+fn read_release_body_answer() -> io::Result<String> {
+    let mut input = String::new();
+    io::stdin().read_line(&mut input)?;
+    Ok(input)
+}
+
 pub async fn reinstall_configured_tool(
     config: &mut ToolerConfig,
     config_key: &str,
@@ -496,9 +935,9 @@ pub async fn reinstall_configured_tool(
     requested_tool_id: &str,
     asset_name: Option<&str>,
     parse_release_body: Option<bool>,
-) -> Result<PathBuf> {
+) -> Result<FetchedTool> {
     let install_target = reinstall_target_for_tool_info(configured, Some(requested_tool_id));
-    let executable_path = install_or_update_tool(
+    let mut installed = install_or_update_tool(
         config,
         &install_target,
         false,
@@ -507,15 +946,12 @@ pub async fn reinstall_configured_tool(
     )
     .await?;
 
-    let installed_key = ToolIdentifier::parse(&install_target)
-        .map_err(|e| anyhow!(e))?
-        .config_key();
-
-    if restore_configured_entry(config, config_key, &installed_key, configured) {
+    if restore_configured_entry(config, config_key, &installed.key, configured) {
         save_tool_configs(config)?;
+        installed.key = config_key.to_string();
     }
 
-    Ok(executable_path)
+    Ok(installed)
 }
 
 fn restore_configured_entry(
@@ -528,7 +964,7 @@ fn restore_configured_entry(
         return false;
     }
 
-    let Some(mut repaired) = config.tools.remove(installed_key) else {
+    let Some(mut repaired) = config.remove_tool_entry(installed_key) else {
         return false;
     };
 
@@ -538,7 +974,7 @@ fn restore_configured_entry(
     repaired.pinned = configured.pinned;
     repaired.forge = configured.forge.clone();
     repaired.original_url = configured.original_url.clone();
-    config.tools.insert(config_key.to_string(), repaired);
+    config.insert_tool(config_key.to_string(), repaired);
     true
 }
 
@@ -551,18 +987,18 @@ pub fn pin_tool(config: &mut ToolerConfig, tool_id: &str) -> Result<()> {
     }
 
     let key = tool_identifier.config_key();
-    if let Some(mut tool_info) = config.tools.remove(&key) {
+    if let Some(mut tool_info) = config.remove_tool_entry(&key) {
         tool_info.pinned = true;
         let version = tool_info.version.clone();
-        config.tools.insert(key, tool_info.clone());
+        config.insert_tool(key, tool_info.clone());
 
         // Also update @latest entry to point to this pinned version
         let latest_key = tool_identifier.default_config_key();
-        if let Some(mut latest_tool) = config.tools.remove(&latest_key) {
+        if let Some(mut latest_tool) = config.remove_tool_entry(&latest_key) {
             latest_tool.pinned = true;
             latest_tool.version = tool_info.version.clone();
             latest_tool.executable_path = tool_info.executable_path.clone();
-            config.tools.insert(latest_key, latest_tool);
+            config.insert_tool(latest_key, latest_tool);
         }
 
         save_tool_configs(config)?;
@@ -574,23 +1010,33 @@ pub fn pin_tool(config: &mut ToolerConfig, tool_id: &str) -> Result<()> {
 }
 
 pub fn remove_tool(config: &mut ToolerConfig, key: &str) -> Result<()> {
-    if let Some(tool_info) = config.tools.remove(key) {
-        // Delete the tool files from disk
+    if let Some(tool_info) = config.remove_tool_entry(key) {
+        save_tool_configs(config)?;
+
+        // A flat directory of a few files (a single-binary release) is deleted
+        // directly. Anything larger is moved into the trash rather than deleted
+        // here: the rename is instant however large the install is, so the
+        // config and the tools directory agree before the slow delete starts.
         let exec_path = std::path::Path::new(&tool_info.executable_path);
         if let Some(parent_dir) = exec_path.parent() {
             if parent_dir.exists() {
                 tracing::debug!("Removing tool directory: {}", parent_dir.display());
-                if let Err(e) = fs::remove_dir_all(parent_dir) {
-                    tracing::warn!(
-                        "Failed to remove tool directory '{}': {}",
-                        parent_dir.display(),
-                        e
-                    );
+                let removed = remove_small_dir(parent_dir).unwrap_or(false)
+                    || get_tooler_trash_dir()
+                        .and_then(|trash| move_to_trash(parent_dir, &trash))
+                        .is_ok();
+                if !removed {
+                    if let Err(e) = fs::remove_dir_all(parent_dir) {
+                        tracing::warn!(
+                            "Failed to remove tool directory '{}': {}",
+                            parent_dir.display(),
+                            e
+                        );
+                    }
                 }
             }
         }
 
-        save_tool_configs(config)?;
         tracing::info!("Tool {} removed", key);
         Ok(())
     } else {
@@ -598,6 +1044,71 @@ pub fn remove_tool(config: &mut ToolerConfig, key: &str) -> Result<()> {
     }
 }
 
+/// Entries up to which a flat directory is deleted in place instead of trashed.
+const SMALL_DIR_ENTRIES: usize = 16;
+
+/// Delete `dir` with one unlink per file when it holds only a few plain files,
+/// skipping the recursive walk. Returns `Ok(false)`, having deleted nothing,
+/// when the directory is larger or has subdirectories.
+fn remove_small_dir(dir: &std::path::Path) -> io::Result<bool> {
+    let mut files = Vec::new();
+    for entry in fs::read_dir(dir)? {
+        let entry = entry?;
+        if entry.file_type()?.is_dir() || files.len() == SMALL_DIR_ENTRIES {
+            return Ok(false);
+        }
+        files.push(entry.path());
+    }
+    for file in files {
+        fs::remove_file(file)?;
+    }
+    fs::remove_dir(dir)?;
+    Ok(true)
+}
+
+/// Rename `dir` into `trash_dir` under a unique name. Fails when the two are on
+/// different filesystems, in which case the caller deletes in place.
+fn move_to_trash(dir: &std::path::Path, trash_dir: &std::path::Path) -> Result<()> {
+    let nanos = std::time::SystemTime::now()
+        .duration_since(std::time::UNIX_EPOCH)
+        .map(|d| d.as_nanos())
+        .unwrap_or_default();
+    let name = dir.file_name().unwrap_or_default().to_string_lossy();
+    let target = trash_dir.join(format!("{}-{}-{}", name, std::process::id(), nanos));
+    fs::rename(dir, target)?;
+    Ok(())
+}
+
+/// Empty the trash left behind by `remove`. Runs at most once per process, so
+/// concurrent installs never race each other deleting the same entries.
+pub fn empty_trash() {
+    static EMPTIED: AtomicBool = AtomicBool::new(false);
+    if EMPTIED.swap(true, Ordering::Relaxed) {
+        return;
+    }
+    if let Ok(trash_dir) = get_tooler_trash_dir() {
+        purge_trash(&trash_dir);
+    }
+}
+
+/// Delete everything in the trash left behind by `remove`.
+fn purge_trash(trash_dir: &std::path::Path) {
+    let Ok(entries) = fs::read_dir(trash_dir) else {
+        return;
+    };
+    for entry in entries.flatten() {
+        let path = entry.path();
+        let removed = if entry.file_type().is_ok_and(|t| t.is_dir()) {
+            fs::remove_dir_all(&path)
+        } else {
+            fs::remove_file(&path)
+        };
+        if let Err(e) = removed {
+            tracing::debug!("Failed to purge {}: {}", path.display(), e);
+        }
+    }
+}
+
 pub fn recover_all_installed_tools(config: &mut ToolerConfig) -> Result<usize> {
     let tools_dir = get_tooler_tools_dir()?;
     let mut recovered_count = 0;
@@ -662,7 +1173,7 @@ pub fn recover_all_installed_tools(config: &mut ToolerConfig) -> Result<usize> {
             };
 
             if should_add {
-                config.tools.insert(key, recovered);
+                config.insert_tool(key, recovered);
                 recovered_count += 1;
             }
         }
@@ -675,30 +1186,57 @@ pub fn recover_all_installed_tools(config: &mut ToolerConfig) -> Result<usize> {
     Ok(recovered_count)
 }
 
-#[allow(dead_code)]
+#[cfg(test)]
 pub(crate) fn find_highest_version(tools: Vec<&ToolInfo>) -> Option<&ToolInfo> {
-    tools.into_iter().max_by(|a, b| {
-        let v_a = semver::Version::parse(a.version.trim_start_matches('v'))
-            .unwrap_or_else(|_| semver::Version::new(0, 0, 0));
-        let v_b = semver::Version::parse(b.version.trim_start_matches('v'))
-            .unwrap_or_else(|_| semver::Version::new(0, 0, 0));
-        v_a.cmp(&v_b)
-    })
+    tools
+        .into_iter()
+        .max_by_key(|info| version_sort_key(&info.version))
+}
+
+/// Semver ordering key for a version tag; unparseable versions sort lowest.
+fn version_sort_key(version: &str) -> semver::Version {
+    semver::Version::parse(version.trim_start_matches('v'))
+        .unwrap_or_else(|_| semver::Version::new(0, 0, 0))
+}
+
+/// The identifier `tool_query` looks up: its alias target when it is an alias,
+/// otherwise the query itself. Pass `parsed` when the caller has already parsed
+/// the query, so it is not parsed again.
+pub fn lookup_identifier<'a>(
+    config: &ToolerConfig,
+    tool_query: &str,
+    parsed: Option<&'a ToolIdentifier>,
+) -> Option<Cow<'a, ToolIdentifier>> {
+    match (config.aliases.get(tool_query), parsed) {
+        (None, Some(parsed)) => Some(Cow::Borrowed(parsed)),
+        (alias, _) => ToolIdentifier::parse(alias.map_or(tool_query, String::as_str))
+            .ok()
+            .map(Cow::Owned),
+    }
 }
 
 pub fn find_tool_entry<'a>(
     config: &'a ToolerConfig,
     tool_query: &str,
 ) -> Option<(&'a String, &'a ToolInfo)> {
-    // 0. Resolve alias if it exists
-    let resolved_query = config
-        .aliases
-        .get(tool_query)
-        .map(|s| s.as_str())
-        .unwrap_or(tool_query);
-
-    let tool_identifier = ToolIdentifier::parse(resolved_query).ok()?;
+    let tool_identifier = lookup_identifier(config, tool_query, None)?;
+    find_tool_entry_for_id(config, &tool_identifier)
+}
+
+/// Find the configured entry for an already alias-resolved identifier.
+pub fn find_tool_entry_for_id<'a>(
+    config: &'a ToolerConfig,
+    tool_identifier: &ToolIdentifier,
+) -> Option<(&'a String, &'a ToolInfo)> {
     let tool_key = tool_identifier.config_key();
+    let system_info = get_system_info();
+    let query_name = tool_identifier.tool_name();
+    let query_name_lc = query_name.to_lowercase();
+    let query_repo_lc = tool_identifier.full_repo().to_lowercase();
+
+    // Direct name/repo/binary matches come from the index without a scan. The
+    // index may miss entries inserted straight into `config.tools`, so every
+    // hit is re-verified and an empty result falls back to the full scan.
 
     // 1. Try exact match (including version if specified)
     if tool_identifier.is_pinned() {
@@ -708,74 +1246,82 @@ pub fn find_tool_entry<'a>(
             return config.tools.get_key_value(&tool_key);
         }
 
-        // Semver match for partial versions
-        let matching_tools: Vec<(&String, &ToolInfo)> = config
-            .tools
+        let mut indexed: Vec<(&String, &ToolInfo)> = config
+            .indexed_keys(&query_name_lc)
             .iter()
-            .filter(|(_, info)| {
-                let binary_name = std::path::Path::new(&info.executable_path)
-                    .file_name()
-                    .and_then(|n| n.to_str())
-                    .unwrap_or("")
-                    .to_lowercase();
-
-                // Tightened matching: match repo name, full repo path, or actual binary name
-                let name_matches = info.tool_name.to_lowercase()
-                    == tool_identifier.tool_name().to_lowercase()
-                    || info.repo.to_lowercase() == tool_identifier.full_repo().to_lowercase()
-                    || binary_name == tool_identifier.tool_name().to_lowercase();
-
-                if name_matches {
-                    return version_matches(requested_version, &info.version);
-                }
+            .chain(config.indexed_keys(&query_repo_lc))
+            .filter_map(|key| config.tools.get_key_value(key))
+            .filter(|(_, info)| tool_name_matches(info, &query_name_lc, &query_repo_lc))
+            .collect();
+        indexed.sort_by(|a, b| a.0.cmp(b.0));
+        indexed.dedup_by(|a, b| a.0 == b.0);
 
-                // Deep search: check for other binaries in the same directory
-                let exec_path = std::path::Path::new(&info.executable_path);
-                if let Some(parent) = exec_path.parent() {
-                    if has_matching_binary(parent, &tool_identifier.tool_name()) {
+        // Semver match for partial versions
+        let indexed_matches: Vec<(&String, &ToolInfo)> = indexed
+            .into_iter()
+            .filter(|(_, info)| version_matches(requested_version, &info.version))
+            .collect();
+        let matching_tools: Vec<(&String, &ToolInfo)> = if !indexed_matches.is_empty() {
+            indexed_matches
+        } else {
+            config
+                .tools
+                .iter()
+                .filter(|(_, info)| {
+                    if tool_name_matches(info, &query_name_lc, &query_repo_lc) {
                         return version_matches(requested_version, &info.version);
                     }
-                }
 
-                false
-            })
-            .collect();
+                    // Deep search: check for other binaries in the same directory
+                    let exec_path = std::path::Path::new(&info.executable_path);
+                    if let Some(parent) = exec_path.parent() {
+                        if has_matching_binary(parent, &query_name, &query_name_lc, &system_info.os)
+                        {
+                            return version_matches(requested_version, &info.version);
+                        }
+                    }
+
+                    false
+                })
+                .collect()
+        };
 
         if !matching_tools.is_empty() {
-            return matching_tools.into_iter().max_by(|a, b| {
-                let v_a = semver::Version::parse(a.1.version.trim_start_matches('v'))
-                    .unwrap_or_else(|_| semver::Version::new(0, 0, 0));
-                let v_b = semver::Version::parse(b.1.version.trim_start_matches('v'))
-                    .unwrap_or_else(|_| semver::Version::new(0, 0, 0));
-                v_a.cmp(&v_b)
-            });
+            return matching_tools
+                .into_iter()
+                .max_by_key(|(_, info)| version_sort_key(&info.version));
         }
 
         config.tools.get_key_value(&tool_key)
     } else {
-        // Unqualified name or unpinned: find most recently accessed matching tool
+        // Unqualified name or unpinned: find most recently accessed matching tool.
+        // Index buckets are hottest-first, so each bucket's first hit is its best.
+        let hottest = |name_lc: &str| {
+            config
+                .indexed_keys(name_lc)
+                .iter()
+                .filter_map(|key| config.tools.get_key_value(key))
+                .find(|(_, info)| tool_name_matches(info, &query_name_lc, &query_repo_lc))
+        };
+        if let Some(found) = [hottest(&query_name_lc), hottest(&query_repo_lc)]
+            .into_iter()
+            .flatten()
+            .max_by_key(|(_, info)| &info.last_accessed)
+        {
+            return Some(found);
+        }
         config
             .tools
             .iter()
             .filter(|(_, info)| {
-                let binary_name = std::path::Path::new(&info.executable_path)
-                    .file_name()
-                    .and_then(|n| n.to_str())
-                    .unwrap_or("")
-                    .to_lowercase();
-
-                // Tightened matching: match repo name, full repo path, or actual binary name
-                if info.tool_name.to_lowercase() == tool_identifier.tool_name().to_lowercase()
-                    || info.repo.to_lowercase() == tool_identifier.full_repo().to_lowercase()
-                    || binary_name == tool_identifier.tool_name().to_lowercase()
-                {
+                if tool_name_matches(info, &query_name_lc, &query_repo_lc) {
                     return true;
                 }
 
                 // Deep search: check for other binaries in the same directory
                 let exec_path = std::path::Path::new(&info.executable_path);
                 if let Some(parent) = exec_path.parent() {
-                    if has_matching_binary(parent, &tool_identifier.tool_name()) {
+                    if has_matching_binary(parent, &query_name, &query_name_lc, &system_info.os) {
                         return true;
                     }
                 }
@@ -786,15 +1332,34 @@ pub fn find_tool_entry<'a>(
     }
 }
 
+/// Tightened matching: the query (already lowercased) must equal the tool name,
+/// the full repo path, or the actual binary name, case-insensitively.
+fn tool_name_matches(info: &ToolInfo, query_name_lc: &str, query_repo_lc: &str) -> bool {
+    let binary_name = std::path::Path::new(&info.executable_path)
+        .file_name()
+        .and_then(|n| n.to_str())
+        .unwrap_or("");
+    eq_lowercase(&info.tool_name, query_name_lc)
+        || eq_lowercase(&info.repo, query_repo_lc)
+        || eq_lowercase(binary_name, query_name_lc)
+}
+
+/// Compare `s.to_lowercase()` with an already-lowercased string without allocating.
+fn eq_lowercase(s: &str, lowercase: &str) -> bool {
+    s.chars().flat_map(char::to_lowercase).eq(lowercase.chars())
+}
+
 /// Check if a directory contains an executable whose name starts with `target_name`.
 /// Handles cases like "cmk.linux.x86-64" matching a search for "cmk".
-fn has_matching_binary(dir: &std::path::Path, target_name: &str) -> bool {
-    let target_lower = target_name.to_lowercase();
-    let system_info = crate::platform::get_system_info();
-
+fn has_matching_binary(
+    dir: &std::path::Path,
+    target_name: &str,
+    target_lower: &str,
+    os_system: &str,
+) -> bool {
     // Exact match first
     let candidate = dir.join(target_name);
-    if candidate.exists() && crate::download::is_executable(&candidate, &system_info.os) {
+    if crate::download::is_executable(&candidate, os_system) {
         return true;
     }
 
@@ -803,17 +1368,17 @@ fn has_matching_binary(dir: &std::path::Path, target_name: &str) -> bool {
         return false;
     };
     for entry in entries.flatten() {
-        let path = entry.path();
-        if !path.is_file() {
+        if entry.file_type().is_ok_and(|t| t.is_dir()) {
             continue;
         }
+        let path = entry.path();
         let name = path
             .file_name()
             .map(|n| n.to_string_lossy().to_lowercase())
             .unwrap_or_default();
         // Match "cmk.linux.x86-64" or "cmk-linux-amd64" for query "cmk"
         let stem = name.split(['.', '-', '_']).next().unwrap_or("");
-        if stem == target_lower && crate::download::is_executable(&path, &system_info.os) {
+        if stem == target_lower && crate::download::is_executable(&path, os_system) {
             return true;
         }
     }
@@ -835,7 +1400,7 @@ pub fn find_all_executables_in_tool_dir(executable_path: &str, os_system: &str)
         .filter_map(|e| e.ok())
     {
         let path = entry.path();
-        if path.is_file() && crate::download::is_executable(path, os_system) {
+        if !entry.file_type().is_dir() && crate::download::is_executable(path, os_system) {
             if let Some(name) = path.file_name().and_then(|n| n.to_str()) {
                 executables.insert(name.to_string());
             }
@@ -848,33 +1413,31 @@ pub fn find_all_executables_in_tool_dir(executable_path: &str, os_system: &str)
 }
 
 pub fn find_tool_executable(config: &ToolerConfig, tool_query: &str) -> Option<ToolInfo> {
-    let (_, base_info) = find_tool_entry(config, tool_query)?;
+    let tool_id = lookup_identifier(config, tool_query, None)?;
+    let (_, base_info) = find_tool_entry_for_id(config, &tool_id)?;
+    Some(resolve_entry_executable(&tool_id, base_info))
+}
+
+/// Point a configured entry at the binary `tool_id` names within the tool's
+/// directory, for tools that ship several executables.
+pub fn resolve_entry_executable(tool_id: &ToolIdentifier, base_info: &ToolInfo) -> ToolInfo {
     let mut info = base_info.clone();
 
     // Resolve specific binary path within the tool's directory
-    let resolved_query = config
-        .aliases
-        .get(tool_query)
-        .map(|s| s.as_str())
-        .unwrap_or(tool_query);
-    if let Ok(tool_id) = ToolIdentifier::parse(resolved_query) {
-        let target_name = tool_id.tool_name();
-        let exec_path = std::path::Path::new(&info.executable_path);
-
-        if let Some(parent) = exec_path.parent() {
-            if let Some(better_exec) = crate::download::find_executable_in_extracted(
-                parent,
-                &target_name,
-                &info.repo,
-                &crate::platform::get_system_info().os,
-                &std::path::PathBuf::new(),
-            ) {
-                info.executable_path = better_exec.to_string_lossy().to_string();
-            }
+    let exec_path = std::path::Path::new(&info.executable_path);
+    if let Some(parent) = exec_path.parent() {
+        if let Some(better_exec) = crate::download::find_executable_in_extracted(
+            parent,
+            &tool_id.tool_name(),
+            &info.repo,
+            &get_system_info().os,
+            &std::path::PathBuf::new(),
+        ) {
+            info.executable_path = better_exec.to_string_lossy().to_string();
         }
     }
 
-    Some(info)
+    info
 }
 
 pub fn reinstall_target_for_tool_info(info: &ToolInfo, requested_tool_id: Option<&str>) -> String {
@@ -940,7 +1503,6 @@ pub fn try_recover_tool(tool_query: &str) -> Result<Option<ToolInfo>> {
         scan_dirs.push(tools_dir.join(forge));
     }
 
-    let re_version = regex::Regex::new(r"v?\d+\.\d+").unwrap();
     let query_name_lower = tool_id.tool_name().to_lowercase();
 
     // Two-pass scan: prefer directory-name matches over binary-name matches,
@@ -1017,14 +1579,9 @@ pub fn try_recover_tool(tool_query: &str) -> Result<Option<ToolInfo>> {
                 continue;
             }
 
-            let Some(recovered) = build_recovered_tool_info(
-                &path,
-                &forge_dir,
-                author,
-                repo,
-                &system_info,
-                &re_version,
-            ) else {
+            let Some(recovered) =
+                build_recovered_tool_info(&path, &forge_dir, author, repo, system_info)
+            else {
                 continue;
             };
 
@@ -1046,7 +1603,7 @@ pub fn try_recover_tool(tool_query: &str) -> Result<Option<ToolInfo>> {
 fn dir_contains_binary_named(dir: &std::path::Path, target_name: &str, os: &str) -> bool {
     for entry in WalkDir::new(dir).into_iter().filter_map(|e| e.ok()) {
         let p = entry.path();
-        if !p.is_file() || !crate::download::is_executable(p, os) {
+        if entry.file_type().is_dir() || !crate::download::is_executable(p, os) {
             continue;
         }
         let name = p
@@ -1071,8 +1628,9 @@ fn build_recovered_tool_info(
     author: &str,
     repo: &str,
     system_info: &crate::types::PlatformInfo,
-    re_version: &regex::Regex,
 ) -> Option<ToolInfo> {
+    static VERSION_DIR: OnceLock<regex::Regex> = OnceLock::new();
+    let re_version = VERSION_DIR.get_or_init(|| regex::Regex::new(r"v?\d+\.\d+").unwrap());
     let mut version_candidates: Vec<(String, PathBuf)> = Vec::new();
     for entry in WalkDir::new(tool_path).into_iter().filter_map(|e| e.ok()) {
         if entry.path().is_dir() {
@@ -1133,6 +1691,7 @@ fn build_recovered_tool_info(
         }
     };
 
+    let now = Utc::now();
     Some(ToolInfo {
         tool_name: repo.to_lowercase(),
         repo: if author == "direct" || author == "unknown" {
@@ -1144,9 +1703,11 @@ fn build_recovered_tool_info(
         executable_path: exec_path.to_string_lossy().to_string(),
         install_type,
         pinned: false,
-        installed_at: Utc::now().to_rfc3339(),
-        last_accessed: Utc::now().to_rfc3339(),
-        last_checked: Some(Utc::now().to_rfc3339()),
+        installed_at: now.to_rfc3339(),
+        last_accessed: now.to_rfc3339(),
+        last_checked: Some(now.to_rfc3339()),
+        last_accessed_ts: Some(now.timestamp()),
+        last_checked_ts: Some(now.timestamp()),
         forge: forge_val,
         original_url: None,
     })
@@ -1230,6 +1791,8 @@ mod tests {
             installed_at: now.clone(),
             last_accessed: now.clone(),
             last_checked: None,
+            last_accessed_ts: None,
+            last_checked_ts: None,
             forge: crate::types::Forge::GitHub,
             original_url: None,
         });
@@ -1244,6 +1807,8 @@ mod tests {
             installed_at: now.clone(),
             last_accessed: now.clone(),
             last_checked: None,
+            last_accessed_ts: None,
+            last_checked_ts: None,
             forge: crate::types::Forge::GitHub,
             original_url: None,
         });
@@ -1258,6 +1823,8 @@ mod tests {
             installed_at: now.clone(),
             last_accessed: now.clone(),
             last_checked: None,
+            last_accessed_ts: None,
+            last_checked_ts: None,
             forge: crate::types::Forge::GitHub,
             original_url: None,
         });
@@ -1290,6 +1857,8 @@ mod tests {
             installed_at: now.clone(),
             last_accessed: now.clone(),
             last_checked: None,
+            last_accessed_ts: None,
+            last_checked_ts: None,
             forge: crate::types::Forge::GitHub,
             original_url: None,
         };
@@ -1355,6 +1924,8 @@ mod tests {
             installed_at: now.clone(),
             last_accessed: now.clone(),
             last_checked: None,
+            last_accessed_ts: None,
+            last_checked_ts: None,
             forge: crate::types::Forge::GitHub,
             original_url: None,
         };
@@ -1432,6 +2003,8 @@ mod tests {
             installed_at: now.clone(),
             last_accessed: now.clone(),
             last_checked: None,
+            last_accessed_ts: None,
+            last_checked_ts: None,
             forge: crate::types::Forge::GitHub,
             original_url: None,
         };
@@ -1481,6 +2054,8 @@ mod tests {
             installed_at: "2026-04-24T14:52:57.383004330+00:00".to_string(),
             last_accessed: "2026-05-21T22:42:46.660429251+00:00".to_string(),
             last_checked: Some("2026-04-24T14:52:57.383007905+00:00".to_string()),
+            last_accessed_ts: None,
+            last_checked_ts: None,
             forge: crate::types::Forge::GitHub,
             original_url: None,
         };
@@ -1491,6 +2066,312 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_tool_index_tracks_inserts_and_removals() {
+        let tool = |repo: &str, name: &str, binary: &str| ToolInfo {
+            tool_name: name.to_string(),
+            repo: repo.to_string(),
+            version: "v1.0.0".to_string(),
+            executable_path: format!("/nonexistent/{}", binary),
+            install_type: "binary".to_string(),
+            pinned: false,
+            installed_at: "2024-01-01T00:00:00Z".to_string(),
+            last_accessed: "2024-01-01T00:00:00Z".to_string(),
+            last_checked: None,
+            last_accessed_ts: None,
+            last_checked_ts: None,
+            forge: crate::types::Forge::GitHub,
+            original_url: None,
+        };
+
+        let mut config = ToolerConfig::default();
+        config.insert_tool("cli/cli@latest".to_string(), tool("cli/cli", "cli", "gh"));
+        config.insert_tool(
+            "derailed/k9s@latest".to_string(),
+            tool("derailed/k9s", "k9s", "k9s"),
+        );
+        assert_eq!(config.indexed_keys("gh"), ["cli/cli@latest".to_string()]);
+        assert_eq!(
+            find_tool_entry(&config, "gh").map(|(k, _)| k.as_str()),
+            Some("cli/cli@latest")
+        );
+
+        config.remove_tool_entry("cli/cli@latest");
+        assert!(config.indexed_keys("gh").is_empty());
+        assert!(find_tool_entry(&config, "gh").is_none());
+
+        let mut reloaded = config.clone();
+        reloaded.tool_index.clear();
+        reloaded.rebuild_tool_index();
+        assert_eq!(reloaded.tool_index, config.tool_index);
+    }
+
+    #[test]
+    fn test_recovered_entry_matches_latest_tag() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        let executable = temp_dir.path().join("k9s");
+        fs::write(&executable, "binary").unwrap();
+        // try_recover_tool stores the version without its `v` prefix
+        let recovered = ToolInfo {
+            tool_name: "k9s".to_string(),
+            repo: "derailed/k9s".to_string(),
+            version: "0.32.5".to_string(),
+            executable_path: executable.to_string_lossy().to_string(),
+            install_type: "binary".to_string(),
+            pinned: false,
+            installed_at: "2024-01-01T00:00:00Z".to_string(),
+            last_accessed: "2024-01-01T00:00:00Z".to_string(),
+            last_checked: None,
+            last_accessed_ts: None,
+            last_checked_ts: None,
+            forge: crate::types::Forge::GitHub,
+            original_url: None,
+        };
+        let tags = |tag: &str| HashMap::from([("derailed/k9s".to_string(), tag.to_string())]);
+
+        assert!(is_latest_installed(&recovered, &tags("v0.32.5")));
+        assert!(!is_latest_installed(&recovered, &tags("v0.32.6")));
+        assert!(!is_latest_installed(&recovered, &HashMap::new()));
+
+        let mut missing = recovered.clone();
+        missing.executable_path = temp_dir.path().join("gone").to_string_lossy().to_string();
+        assert!(!is_latest_installed(&missing, &tags("v0.32.5")));
+    }
+
+    #[test]
+    fn test_tool_index_keeps_most_recently_accessed_first() {
+        let tool = |version: &str, last_accessed: &str| ToolInfo {
+            tool_name: "k9s".to_string(),
+            repo: "derailed/k9s".to_string(),
+            version: version.to_string(),
+            executable_path: "/nonexistent/k9s".to_string(),
+            install_type: "binary".to_string(),
+            pinned: true,
+            installed_at: "2024-01-01T00:00:00Z".to_string(),
+            last_accessed: last_accessed.to_string(),
+            last_checked: None,
+            last_accessed_ts: None,
+            last_checked_ts: None,
+            forge: crate::types::Forge::GitHub,
+            original_url: None,
+        };
+
+        let mut config = ToolerConfig::default();
+        config.insert_tool(
+            "derailed/k9s@v1.0.0".to_string(),
+            tool("v1.0.0", "2024-01-01T00:00:00Z"),
+        );
+        config.insert_tool(
+            "derailed/k9s@v2.0.0".to_string(),
+            tool("v2.0.0", "2024-01-02T00:00:00Z"),
+        );
+        assert_eq!(config.indexed_keys("k9s")[0], "derailed/k9s@v2.0.0");
+
+        assert!(config.mark_tool_accessed("derailed/k9s", "v1.0.0", Utc::now()));
+        assert_eq!(config.indexed_keys("k9s")[0], "derailed/k9s@v1.0.0");
+        assert_eq!(
+            find_tool_entry(&config, "k9s").map(|(k, _)| k.as_str()),
+            Some("derailed/k9s@v1.0.0")
+        );
+
+        let mut reloaded = config.clone();
+        reloaded.rebuild_tool_index();
+        assert_eq!(reloaded.tool_index, config.tool_index);
+        assert!(!config.mark_tool_accessed("derailed/k9s", "v3.0.0", Utc::now()));
+    }
+
+    #[test]
+    fn test_trash_moves_then_purges_tool_dirs() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        let trash_dir = temp_dir.path().join("trash");
+        fs::create_dir_all(&trash_dir).unwrap();
+        for version in ["v1.0.0", "v2.0.0"] {
+            let version_dir = temp_dir.path().join("tools").join(version);
+            fs::create_dir_all(version_dir.join("bin")).unwrap();
+            fs::write(version_dir.join("bin").join("tool"), "binary").unwrap();
+            move_to_trash(&version_dir, &trash_dir).unwrap();
+            assert!(!version_dir.exists());
+        }
+        assert_eq!(fs::read_dir(&trash_dir).unwrap().count(), 2);
+
+        purge_trash(&trash_dir);
+        assert_eq!(fs::read_dir(&trash_dir).unwrap().count(), 0);
+    }
+
+    #[test]
+    fn test_remove_small_dir_only_deletes_flat_dirs() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        let flat = temp_dir.path().join("flat");
+        fs::create_dir_all(&flat).unwrap();
+        fs::write(flat.join("tool"), "binary").unwrap();
+        fs::write(flat.join("tool.tar.gz"), "archive").unwrap();
+        assert!(remove_small_dir(&flat).unwrap());
+        assert!(!flat.exists());
+
+        let nested = temp_dir.path().join("nested");
+        fs::create_dir_all(nested.join("bin")).unwrap();
+        fs::write(nested.join("README"), "docs").unwrap();
+        assert!(!remove_small_dir(&nested).unwrap());
+        assert!(nested.join("README").exists());
+    }
+
+    #[test]
+    fn test_last_check_timestamp_prefers_epoch_fields() {
+        let mut info = ToolInfo {
+            tool_name: "act".to_string(),
+            repo: "nektos/act".to_string(),
+            version: "v0.2.79".to_string(),
+            executable_path: "/tmp/act".to_string(),
+            install_type: "binary".to_string(),
+            pinned: false,
+            installed_at: "2024-01-01T00:00:00Z".to_string(),
+            last_accessed: "2024-01-02T00:00:00Z".to_string(),
+            last_checked: None,
+            last_accessed_ts: None,
+            last_checked_ts: None,
+            forge: crate::types::Forge::GitHub,
+            original_url: None,
+        };
+
+        // Legacy entries fall back to parsing the RFC 3339 strings.
+        assert_eq!(info.last_check_timestamp(), Some(1_704_153_600));
+
+        let now = Utc::now();
+        info.mark_checked(now);
+        assert_eq!(info.last_check_timestamp(), Some(now.timestamp()));
+        assert_eq!(info.last_checked, Some(now.to_rfc3339()));
+    }
+
+    #[tokio::test]
+    async fn test_release_body_answer_survives_concurrent_fetches() {
+        use std::sync::atomic::{AtomicUsize, Ordering};
+        static PROMPTS: AtomicUsize = AtomicUsize::new(0);
+        fn answer_always() -> io::Result<String> {
+            PROMPTS.fetch_add(1, Ordering::SeqCst);
+            Ok("always\n".to_string())
+        }
+
+        let asset = AssetInfo {
+            name: "tool".to_string(),
+            download_url: "https://example.com/tool".to_string(),
+        };
+        for prompted_first in [true, false] {
+            PROMPTS.store(0, Ordering::SeqCst);
+            let release_body = ReleaseBodyGate::new(ReleaseBodyPolicy::Ask);
+            let approve = |repo| {
+                approve_release_body_asset(
+                    &release_body,
+                    repo,
+                    "v1.0.0",
+                    &asset,
+                    None,
+                    answer_always,
+                )
+            };
+            let (first, second) = if prompted_first {
+                tokio::join!(approve("owner/a"), approve("owner/b"))
+            } else {
+                let (second, first) = tokio::join!(approve("owner/b"), approve("owner/a"));
+                (first, second)
+            };
+            assert!(first.is_ok() && second.is_ok());
+            // The second fetch sees the first answer instead of prompting again
+            assert_eq!(PROMPTS.load(Ordering::SeqCst), 1);
+
+            let mut config = ToolerConfig::default();
+            assert!(release_body.record(&mut config));
+            assert_eq!(
+                config.settings.parse_release_body,
+                ReleaseBodyPolicy::Always
+            );
+        }
+
+        // Without an answer the configured policy is not written back
+        let mut config = ToolerConfig::default();
+        config.settings.parse_release_body = ReleaseBodyPolicy::Never;
+        assert!(!ReleaseBodyGate::new(ReleaseBodyPolicy::Ask).record(&mut config));
+        assert_eq!(config.settings.parse_release_body, ReleaseBodyPolicy::Never);
+    }
+
+    #[test]
+    fn test_pending_updates_are_taken_per_tool_across_runs() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        std::env::set_var("TOOLER_DATA_DIR", temp_dir.path());
+        let pending = |repo: &str| PendingUpdate {
+            key: format!("{}@latest", repo),
+            tool_name: repo.split('/').next_back().unwrap().to_string(),
+            source: repo.to_string(),
+            current_version: "v1.0.0".to_string(),
+            latest_version: "v1.1.0".to_string(),
+            forge: Forge::GitHub,
+        };
+        let keys = |updates: Vec<PendingUpdate>| -> Vec<String> {
+            updates.into_iter().map(|u| u.key).collect()
+        };
+
+        // One run's background check records updates for two tools
+        let mut config = ToolerConfig::default();
+        let check = UpdateCheck {
+            checked_keys: Vec::new(),
+            updates: vec![pending("derailed/k9s"), pending("nektos/act")],
+        };
+        assert!(!record_update_check(&mut config, check).unwrap());
+        assert_eq!(load_pending_updates().len(), 2);
+
+        // The next run of k9s takes only its own entry; act's stays on disk
+        assert_eq!(
+            keys(take_pending_updates("derailed/k9s@latest")),
+            ["derailed/k9s@latest"]
+        );
+        assert_eq!(keys(load_pending_updates()), ["nektos/act@latest"]);
+        assert!(take_pending_updates("derailed/k9s@latest").is_empty());
+
+        // Taking the last entry removes the file
+        assert_eq!(keys(take_pending_updates("nektos/act@latest")).len(), 1);
+        assert!(!get_pending_updates_file_path().unwrap().exists());
+    }
+
+    #[tokio::test]
+    async fn test_apply_update_check_ignores_outdated_pending_update() {
+        let mut config = ToolerConfig::default();
+        config.settings.auto_update = true;
+        config.tools.insert(
+            "nektos/act@latest".to_string(),
+            ToolInfo {
+                tool_name: "act".to_string(),
+                repo: "nektos/act".to_string(),
+                version: "v0.2.80".to_string(),
+                executable_path: "/tmp/act".to_string(),
+                install_type: "binary".to_string(),
+                pinned: false,
+                installed_at: "2026-04-24T14:52:57Z".to_string(),
+                last_accessed: "2026-05-21T22:42:46Z".to_string(),
+                last_checked: None,
+                last_accessed_ts: None,
+                last_checked_ts: None,
+                forge: crate::types::Forge::GitHub,
+                original_url: None,
+            },
+        );
+        let before = config.clone();
+
+        // Recorded against v0.2.79, but the tool has since been updated.
+        let check = UpdateCheck {
+            checked_keys: Vec::new(),
+            updates: vec![PendingUpdate {
+                key: "nektos/act@latest".to_string(),
+                tool_name: "act".to_string(),
+                source: "nektos/act".to_string(),
+                current_version: "v0.2.79".to_string(),
+                latest_version: "v0.2.80".to_string(),
+                forge: crate::types::Forge::GitHub,
+            }],
+        };
+
+        apply_update_check(&mut config, check).await.unwrap();
+        assert_eq!(config, before);
+    }
+
     #[test]
     fn test_reinstall_target_keeps_simple_configured_version() {
         let info = ToolInfo {
@@ -1505,6 +2386,8 @@ mod tests {
             installed_at: "2026-04-24T14:52:57Z".to_string(),
             last_accessed: "2026-05-21T22:42:46Z".to_string(),
             last_checked: None,
+            last_accessed_ts: None,
+            last_checked_ts: None,
             forge: crate::types::Forge::GitHub,
             original_url: None,
         };
@@ -1529,6 +2412,8 @@ mod tests {
             installed_at: "2026-04-24T14:52:57Z".to_string(),
             last_accessed: "2026-05-21T22:42:46Z".to_string(),
             last_checked: None,
+            last_accessed_ts: None,
+            last_checked_ts: None,
             forge: crate::types::Forge::Url,
             original_url: Some(
                 "https://dl.k8s.io/release/v1.31.0/bin/linux/arm64/kubectl".to_string(),
@@ -1555,6 +2440,8 @@ mod tests {
             installed_at: "2026-04-24T14:52:57Z".to_string(),
             last_accessed: "2026-05-21T22:42:46Z".to_string(),
             last_checked: None,
+            last_accessed_ts: None,
+            last_checked_ts: None,
             forge: crate::types::Forge::Url,
             original_url: None,
         };
@@ -1580,6 +2467,8 @@ mod tests {
             installed_at: "2026-04-24T14:52:57Z".to_string(),
             last_accessed: "2026-05-21T22:42:46Z".to_string(),
             last_checked: None,
+            last_accessed_ts: None,
+            last_checked_ts: None,
             forge: crate::types::Forge::GitHub,
             original_url: None,
         };
@@ -1593,6 +2482,8 @@ mod tests {
             installed_at: "2026-05-27T15:37:58Z".to_string(),
             last_accessed: "2026-05-27T15:38:06Z".to_string(),
             last_checked: Some("2026-05-27T15:37:58Z".to_string()),
+            last_accessed_ts: None,
+            last_checked_ts: None,
             forge: crate::types::Forge::GitHub,
             original_url: None,
         };
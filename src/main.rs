@@ -3,40 +3,72 @@ mod config;
 mod download;
 mod install;
 mod platform;
+mod run_cache;
 mod tool_id;
 mod types;
 
 use anyhow::{anyhow, Result};
 use chrono::{DateTime, Utc};
-use clap::{CommandFactory, Parser};
+use clap::CommandFactory;
 use cli::{Cli, Commands, ConfigAction};
-use config::{load_tool_configs, normalize_key, save_tool_configs};
+use config::{load_pending_updates, load_tool_configs, normalize_key, save_tool_configs};
 use download::is_executable;
 use install::{
-    check_for_updates, find_all_executables_in_tool_dir, find_tool_entry, find_tool_executable,
+    find_all_executables_in_tool_dir, find_tool_entry, find_tool_executable,
     install_or_update_tool, list_installed_tools, pin_tool, reinstall_configured_tool, remove_tool,
 };
+use std::collections::HashSet;
 use std::env;
 use std::fs;
-use std::io;
+use std::io::{self, Write};
 use std::path::{Path, PathBuf};
 use std::process::Command;
 use std::sync::Mutex;
 use tool_id::ToolIdentifier;
-use types::{ReleaseBodyPolicy, ToolerConfig, ToolerSettings};
+use types::{find_setting, setting_keys, ToolInfo, ToolerConfig, SETTINGS};
 
-#[tokio::main]
-async fn main() -> Result<()> {
-    let cli = Cli::parse();
+/// How long `run` waits after the tool exits for its background update check.
+/// The check has had the tool's whole runtime already; this only covers a
+/// request in flight on a fast network, not a full GitHub round trip.
+const UPDATE_CHECK_GRACE: std::time::Duration = std::time::Duration::from_millis(250);
 
-    // Setup logging
-    setup_logging(&cli)?;
-    tracing::info!("Logging initialized");
+/// How long `update all` trusts an earlier check that found no update.
+const UPDATE_ALL_RECHECK: std::time::Duration = std::time::Duration::from_secs(60 * 60);
+
+fn main() -> Result<()> {
+    // A bare `tooler version` needs neither clap, logging nor the config
+    let mut args = std::env::args_os().skip(1);
+    if args.next().is_some_and(|a| a == "version") && args.next().is_none() {
+        print_version();
+        return Ok(());
+    }
+
+    let cli = Cli::parse_args();
+
+    // Setup logging. Reading settings only prints, so it skips building the log
+    // outputs (and opening the log file) unless logging was asked for.
+    let print_only = matches!(
+        cli.command,
+        Commands::Config {
+            action: ConfigAction::Get { .. } | ConfigAction::Show { .. }
+        }
+    );
+    if !print_only || cli.verbose > 0 || cli.output.is_some() {
+        setup_logging(&cli)?;
+        tracing::info!("Logging initialized");
+    }
+
+    if let Commands::Version = cli.command {
+        print_version();
+        return Ok(());
+    }
 
     // Load configuration
     let mut config = load_tool_configs()?;
 
-    match cli.command {
+    // Commands report failures they have already explained as a nonzero exit
+    // code, so the process exits in one place, after every handler has returned.
+    let code = match cli.command {
         Commands::External(args) => {
             if args.is_empty() {
                 Cli::command().print_help()?;
@@ -44,7 +76,15 @@ async fn main() -> Result<()> {
             }
             let tool_id = args[0].clone();
             let tool_args = args[1..].to_vec();
-            execute_run(&mut config, tool_id, tool_args, None, None).await?;
+            block_on(execute_run(
+                &mut config,
+                tool_id,
+                tool_args,
+                None,
+                None,
+                false,
+                false,
+            ))?
         }
         Commands::Run {
             tool_id,
@@ -52,511 +92,539 @@ async fn main() -> Result<()> {
             asset,
             parse_release_body,
             no_parse_release_body,
+            cache,
+            cache_stdin,
         } => {
-            let parse_body = if parse_release_body {
-                Some(true)
-            } else if no_parse_release_body {
-                Some(false)
-            } else {
-                None
-            };
-            execute_run(&mut config, tool_id, tool_args, asset, parse_body).await?;
-        }
-        Commands::Version => {
-            // Version is handled by clap's #[command(version = ...)] attribute
-            // but we keep this for explicit 'tooler version' command
-            let version_str = if let Some(tag) = option_env!("TOOLER_GIT_TAG") {
-                tag.to_string()
-            } else {
-                let commit = option_env!("TOOLER_GIT_COMMIT").unwrap_or("unknown");
-                let branch = option_env!("TOOLER_GIT_BRANCH").unwrap_or("unknown");
-                format!("v{}-{} ({})", env!("CARGO_PKG_VERSION"), commit, branch)
-            };
-            println!("{} {}", env!("CARGO_PKG_NAME"), version_str);
-            return Ok(());
+            let parse_body = release_body_flag(parse_release_body, no_parse_release_body);
+            block_on(execute_run(
+                &mut config,
+                tool_id,
+                tool_args,
+                asset,
+                parse_body,
+                cache || cache_stdin,
+                cache_stdin,
+            ))?
         }
+        Commands::Version => unreachable!("version is handled before loading the config"),
         Commands::List => {
             if let Ok(count) = install::recover_all_installed_tools(&mut config) {
                 if count > 0 {
                     tracing::info!("Recovered {} tools from local installation", count);
                 }
             }
-            list_installed_tools(&config);
+            list_installed_tools(&config)?;
+            0
         }
         Commands::Remove { tool_id } => {
             let key = find_tool_entry(&config, &tool_id).map(|(k, _)| k.clone());
             if let Some(key) = key {
                 remove_tool(&mut config, &key)?;
+                // The entry is gone; now reclaim the space of anything trashed
+                install::empty_trash();
             } else {
                 return Err(anyhow!("Tool '{}' not found in configuration", tool_id));
             }
+            0
         }
-        Commands::Update { tool_id } => {
-            if let Some(tool_id) = tool_id {
-                if tool_id == "all" {
-                    tracing::info!("Updating all applicable tools...");
-                    let mut updated_count = 0;
-                    let keys_to_update: Vec<String> = config
-                        .tools
-                        .keys()
-                        .filter(|k| !k.contains(':')) // Only non-version-pinned tools
-                        .cloned()
-                        .collect();
-                    for key in keys_to_update {
-                        if let Some(info) = config.tools.get(&key).cloned() {
-                            let old_version = info.version.clone();
-                            match install_or_update_tool(&mut config, &info.repo, true, None, None)
-                                .await
-                            {
-                                Ok(_) => {
-                                    let new_version = config
-                                        .tools
-                                        .get(&key)
-                                        .map(|t| t.version.clone())
-                                        .unwrap_or_else(|| "unknown".to_string());
-                                    report_update(&info.repo, Some(&old_version), &new_version);
-                                    updated_count += 1;
-                                }
-                                Err(e) => tracing::warn!("Failed to update {}: {}", info.repo, e),
-                            }
-                        }
-                    }
-                    eprintln!(
-                        "Update process finished. {} tool(s) were checked/updated.",
-                        updated_count
-                    );
-                } else {
-                    let existing_tool = find_tool_executable(&config, &tool_id);
-                    let old_version = existing_tool.as_ref().map(|t| t.version.clone());
-                    let (repo, tool_identifier) = if let Some(tool_info) = existing_tool {
-                        (tool_info.repo.clone(), ToolIdentifier::parse(&tool_id).ok())
-                    } else {
-                        let tool_identifier = match ToolIdentifier::parse(&tool_id) {
-                            Ok(id) => id,
-                            Err(e) => {
-                                if tool_id.starts_with('-') {
-                                    eprintln!("\nError: Invalid tool identifier '{}'. It looks like a flag.", tool_id);
-                                    eprintln!("Tooler flags (like -v, --quiet) must be placed BEFORE the subcommand: 'tooler {} update ...'", tool_id);
-                                    eprintln!("Subcommand flags must be placed AFTER the tool name: 'tooler update <tool> {}'", tool_id);
-                                    std::process::exit(1);
-                                }
-                                return Err(anyhow!("Invalid tool identifier: {}", e));
-                            }
-                        };
-                        (tool_identifier.full_repo(), Some(tool_identifier))
-                    };
-
-                    tracing::info!("Attempting to update {}...", repo);
-                    match install_or_update_tool(&mut config, &repo, true, None, None).await {
-                        Ok(path) => {
-                            handle_self_update(&path, &repo)?;
-                            let new_version = find_tool_executable(&config, &tool_id)
-                                .map(|t| t.version)
-                                .unwrap_or_else(|| "unknown".to_string());
-                            report_update(&tool_id, old_version.as_deref(), &new_version);
-                        }
-                        Err(e) => {
-                            tracing::error!("Failed to update tool '{}': {}", tool_id, e);
-                            if e.to_string().contains("404") {
-                                match tool_identifier
-                                    .as_ref()
-                                    .map(|id| id.forge.clone())
-                                    .unwrap_or(types::Forge::GitHub)
-                                {
-                                    types::Forge::GitHub => {
-                                        eprintln!(
-                                            "\nError: Tool '{}' not found on GitHub.",
-                                            tool_id
-                                        );
-                                        eprintln!(
-                                            "Please check that the repository 'https://github.com/{}' exists.",
-                                            repo
-                                        );
-                                    }
-                                    types::Forge::Url => {
-                                        eprintln!(
-                                            "\nError: Tool '{}' (URL) not found or returned 404.",
-                                            tool_id
-                                        );
-                                        eprintln!(
-                                            "Please check that the URL '{}' is still valid.",
-                                            repo
-                                        );
-                                    }
-                                }
-                            } else {
-                                eprintln!("\nError: {}", e);
-                            }
-                            std::process::exit(1);
-                        }
-                    }
-                }
-            } else {
+        Commands::Update { tool_id } => match tool_id.as_deref() {
+            Some("all") => {
+                block_on(update_all_tools(&mut config))?;
+                0
+            }
+            Some(tool_id) => block_on(update_tool(&mut config, tool_id))?,
+            None => {
                 tracing::error!("Please specify a tool to update or use 'all' to update all tools");
-                std::process::exit(1);
+                1
             }
-        }
+        },
         Commands::Pull {
             tool_id,
             asset,
             parse_release_body,
             no_parse_release_body,
         } => {
-            let tool_identifier = match ToolIdentifier::parse(&tool_id) {
-                Ok(id) => id,
-                Err(e) => {
-                    if tool_id.starts_with('-') {
+            let parse_body = release_body_flag(parse_release_body, no_parse_release_body);
+            block_on(execute_pull(&mut config, tool_id, asset, parse_body))?
+        }
+        Commands::Config { action } => execute_config(&mut config, action)?,
+        Commands::Pin { tool_id } => {
+            pin_tool(&mut config, &tool_id)?;
+            0
+        }
+        Commands::Alias {
+            name,
+            target,
+            remove,
+        } => {
+            execute_alias(&mut config, name, target, remove)?;
+            0
+        }
+        Commands::Info { tool_ids } => execute_info(&mut config, &tool_ids)?,
+    };
+
+    if code != 0 {
+        std::process::exit(code);
+    }
+    Ok(())
+}
+
+async fn update_all_tools(config: &mut ToolerConfig) -> Result<()> {
+    tracing::info!("Updating all applicable tools...");
+    let mut updated_count = 0;
+    let now = Utc::now();
+
+    // A tool checked within the recheck window without an update being found
+    // is still current; asking GitHub again would only repeat that answer.
+    let recheck_after = now.timestamp() - UPDATE_ALL_RECHECK.as_secs() as i64;
+    let pending: HashSet<String> = load_pending_updates().into_iter().map(|p| p.key).collect();
+    let mut keys_to_update = Vec::new();
+    for (key, info) in &config.tools {
+        if key.contains(':') {
+            continue; // Only non-version-pinned tools
+        }
+        let checked_recently = info.last_checked.is_some()
+            && info
+                .last_check_timestamp()
+                .is_some_and(|checked| checked > recheck_after)
+            && !pending.contains(key)
+            && Path::new(&info.executable_path).exists();
+        if checked_recently {
+            tracing::debug!("{} was checked within the recheck window", info.repo);
+            report_update(&info.repo, Some(&info.version), &info.version);
+            updated_count += 1;
+        } else {
+            keys_to_update.push(key.clone());
+        }
+    }
+    let github_repos: Vec<String> = keys_to_update
+        .iter()
+        .filter_map(|k| config.tools.get(k))
+        .filter(|t| t.forge == types::Forge::GitHub)
+        .map(|t| t.repo.clone())
+        .collect();
+    let latest_tags = install::resolve_latest_tags(&github_repos).await;
+    let mut outdated = Vec::new();
+    let mut dirty = false;
+    for key in keys_to_update {
+        if let Some(info) = config.tools.get_mut(&key) {
+            if install::is_latest_installed(info, &latest_tags) {
+                info.mark_checked(now);
+                dirty = true;
+                report_update(&info.repo, Some(&info.version), &info.version);
+                updated_count += 1;
+                continue;
+            }
+            outdated.push(((key, info.clone()), info.repo.clone()));
+        }
+    }
+
+    // Downloads are network-bound, so fetch several tools at once and
+    // record each in the config as it finishes; the config is saved
+    // once at the end.
+    dirty |= install::fetch_tools(
+        config,
+        outdated,
+        |config, (key, info), fetched| match fetched {
+            Ok(_) => {
+                let new_version = config
+                    .tools
+                    .get(&key)
+                    .map(|t| t.version.clone())
+                    .unwrap_or_else(|| "unknown".to_string());
+                report_update(&info.repo, Some(&info.version), &new_version);
+                updated_count += 1;
+            }
+            Err(e) => tracing::warn!("Failed to update {}: {}", info.repo, e),
+        },
+    )
+    .await;
+    if dirty {
+        save_tool_configs(config)?;
+    }
+    eprintln!(
+        "Update process finished. {} tool(s) were checked/updated.",
+        updated_count
+    );
+    Ok(())
+}
+
+async fn update_tool(config: &mut ToolerConfig, tool_id: &str) -> Result<i32> {
+    let existing_tool = find_tool_executable(config, tool_id);
+    let old_version = existing_tool.as_ref().map(|t| t.version.clone());
+    let (repo, tool_identifier) = match (existing_tool, ToolIdentifier::parse(tool_id)) {
+        (Some(tool_info), parsed) => (tool_info.repo, parsed.ok()),
+        (None, Ok(id)) => (id.full_repo(), Some(id)),
+        (None, Err(e)) => {
+            if tool_id.starts_with('-') {
+                eprintln!(
+                    "\nError: Invalid tool identifier '{}'. It looks like a flag.",
+                    tool_id
+                );
+                eprintln!("Tooler flags (like -v, --quiet) must be placed BEFORE the subcommand: 'tooler {} update ...'", tool_id);
+                eprintln!("Subcommand flags must be placed AFTER the tool name: 'tooler update <tool> {}'", tool_id);
+                return Ok(1);
+            }
+            return Err(anyhow!("Invalid tool identifier: {}", e));
+        }
+    };
+
+    tracing::info!("Attempting to update {}...", repo);
+    match install_or_update_tool(config, &repo, true, None, None).await {
+        Ok(installed) => {
+            handle_self_update(&installed.executable_path, &repo)?;
+            let new_version = config
+                .tools
+                .get(&installed.key)
+                .map_or("unknown", |t| t.version.as_str());
+            report_update(tool_id, old_version.as_deref(), new_version);
+        }
+        Err(e) => {
+            tracing::error!("Failed to update tool '{}': {}", tool_id, e);
+            if e.to_string().contains("404") {
+                match tool_identifier
+                    .as_ref()
+                    .map(|id| id.forge.clone())
+                    .unwrap_or(types::Forge::GitHub)
+                {
+                    types::Forge::GitHub => {
+                        eprintln!("\nError: Tool '{}' not found on GitHub.", tool_id);
                         eprintln!(
-                            "\nError: Invalid tool identifier '{}'. It looks like a flag.",
-                            tool_id
+                            "Please check that the repository 'https://github.com/{}' exists.",
+                            repo
                         );
-                        eprintln!("Tooler flags (like -v, --quiet) must be placed BEFORE the subcommand: 'tooler {} pull ...'", tool_id);
+                    }
+                    types::Forge::Url => {
                         eprintln!(
-                            "Subcommand flags must be placed AFTER the tool name: 'tooler pull <tool> {}'",
+                            "\nError: Tool '{}' (URL) not found or returned 404.",
                             tool_id
                         );
-                        std::process::exit(1);
+                        eprintln!("Please check that the URL '{}' is still valid.", repo);
                     }
-                    return Err(anyhow!("Invalid tool identifier: {}", e));
                 }
-            };
-
-            let parse_body = if parse_release_body {
-                Some(true)
-            } else if no_parse_release_body {
-                Some(false)
             } else {
-                None
-            };
+                eprintln!("\nError: {}", e);
+            }
+            return Ok(1);
+        }
+    }
+    Ok(0)
+}
 
-            let existing = find_tool_executable(&config, &tool_id);
-            let old_version = existing.as_ref().map(|t| t.version.clone());
-            let repo_to_pull = if let Some(existing) = existing {
-                tracing::info!(
-                    "Tool '{}' resolves to repository {}",
-                    tool_id,
-                    existing.repo
+async fn execute_pull(
+    config: &mut ToolerConfig,
+    tool_id: String,
+    asset: Option<String>,
+    parse_body: Option<bool>,
+) -> Result<i32> {
+    let tool_identifier = match ToolIdentifier::parse(&tool_id) {
+        Ok(id) => id,
+        Err(e) => {
+            if tool_id.starts_with('-') {
+                eprintln!(
+                    "\nError: Invalid tool identifier '{}'. It looks like a flag.",
+                    tool_id
                 );
-                existing.repo.clone()
-            } else {
-                tracing::info!("Pulling {}...", tool_id);
-                tool_id.clone()
-            };
-
-            match install_or_update_tool(
-                &mut config,
-                &repo_to_pull,
-                true,
-                asset.as_deref(),
-                parse_body,
-            )
-            .await
-            {
-                Ok(path) => {
-                    handle_self_update(&path, &repo_to_pull)?;
-                    let new_version = find_tool_executable(&config, &tool_id)
-                        .map(|t| t.version)
-                        .unwrap_or_else(|| "unknown".to_string());
-                    report_update(&repo_to_pull, old_version.as_deref(), &new_version);
-                    tracing::info!("Path: {}", path.display());
-                    if config.settings.auto_shim {
-                        if let Err(e) = setup_auto_shim(
-                            &config.settings.bin_dir,
-                            &tool_identifier.tool_name(),
-                            &path,
-                        ) {
-                            tracing::warn!(
-                                "auto-shim skipped (bin_dir={}): {}. Pull itself succeeded — set bin-dir to a writable path or disable auto-shim.",
-                                config.settings.bin_dir,
-                                e
-                            );
-                        }
-                    }
-                }
-                Err(e) => {
-                    if let Some(gh_error) = e.downcast_ref::<install::github::GitHubReleaseError>()
-                    {
-                        display_github_error(&tool_id, gh_error);
-                    } else if tool_identifier.forge == types::Forge::Url {
-                        eprintln!("\nError: Tool '{}' could not be fetched from URL.", tool_id);
-                        if let Some(url) = &tool_identifier.url {
-                            eprintln!("URL: {}", url);
-                        }
-                    } else {
-                        eprintln!("\nError: {}", e);
-                    }
-                    std::process::exit(1);
-                }
+                eprintln!("Tooler flags (like -v, --quiet) must be placed BEFORE the subcommand: 'tooler {} pull ...'", tool_id);
+                eprintln!(
+                    "Subcommand flags must be placed AFTER the tool name: 'tooler pull <tool> {}'",
+                    tool_id
+                );
+                return Ok(1);
             }
+            return Err(anyhow!("Invalid tool identifier: {}", e));
         }
-        Commands::Config { action } => match action {
-            ConfigAction::Get { key } => {
-                if let Some(key) = key {
-                    let normalized_key = normalize_key(&key);
-                    let value = match normalized_key.as_str() {
-                        "update_check_days" => config.settings.update_check_days.to_string(),
-                        "auto_shim" => config.settings.auto_shim.to_string(),
-                        "auto_update" => config.settings.auto_update.to_string(),
-                        "parse_release_body" => config.settings.parse_release_body.to_string(),
-                        "bin_dir" => config.settings.bin_dir.clone(),
-                        _ => format!("Setting '{}' not found", key),
-                    };
-                    println!("{}", value);
-                } else {
-                    println!("--- Tooler Settings ---");
-                    for (k, v) in &[
-                        (
-                            "update-check-days",
-                            &config.settings.update_check_days.to_string(),
-                        ),
-                        ("auto-shim", &config.settings.auto_shim.to_string()),
-                        ("auto-update", &config.settings.auto_update.to_string()),
-                        (
-                            "parse-release-body",
-                            &config.settings.parse_release_body.to_string(),
-                        ),
-                        ("bin-dir", &config.settings.bin_dir),
-                    ] {
-                        println!("  {}: {}", k, v);
-                    }
-                }
-            }
-            ConfigAction::Set { args } => {
-                let (key, value_str) = if args.len() == 1 {
-                    if let Some((k, v)) = args[0].split_once('=') {
-                        (k.to_string(), v.to_string())
-                    } else {
-                        tracing::error!("Invalid format. Use 'key=value' or 'key value'.");
-                        std::process::exit(1);
-                    }
-                } else if args.len() >= 2 {
-                    (args[0].clone(), args[1..].join(" "))
-                } else {
-                    tracing::error!("Invalid format. Use 'key=value' or 'key value'.");
-                    std::process::exit(1);
-                };
+    };
 
-                let normalized_key = normalize_key(&key);
-                match normalized_key.as_str() {
-                    "update_check_days" => {
-                        if let Ok(days) = value_str.parse::<i32>() {
-                            config.settings.update_check_days = days;
-                            save_tool_configs(&config)?;
-                            tracing::info!("Setting '{}' updated to '{}'", normalized_key, days);
-                        } else {
-                            tracing::error!("Invalid value for '{}'", key);
-                        }
-                    }
-                    "auto_shim" => {
-                        let value = value_str.to_lowercase() == "true" || value_str == "1";
-                        config.settings.auto_shim = value;
-                        save_tool_configs(&config)?;
-                        tracing::info!("Setting '{}' updated to '{}'", normalized_key, value);
-                    }
-                    "auto_update" => {
-                        let value = value_str.to_lowercase() == "true" || value_str == "1";
-                        config.settings.auto_update = value;
-                        save_tool_configs(&config)?;
-                        tracing::info!("Setting '{}' updated to '{}'", normalized_key, value);
-                    }
-                    "parse_release_body" => {
-                        let Some(value) = ReleaseBodyPolicy::parse(&value_str) else {
-                            tracing::error!(
-                                "Invalid value for '{}'. Use ask, always, or never.",
-                                key
-                            );
-                            std::process::exit(1);
-                        };
-                        config.settings.parse_release_body = value.clone();
-                        save_tool_configs(&config)?;
-                        tracing::info!("Setting '{}' updated to '{}'", normalized_key, value);
-                    }
-                    "bin_dir" => {
-                        config.settings.bin_dir = value_str.to_string();
-                        save_tool_configs(&config)?;
-                        tracing::info!("Setting '{}' updated to '{}'", normalized_key, value_str);
-                    }
-                    _ => {
-                        tracing::error!(
-                            "'{}' is not a valid configuration setting. Valid settings: update-check-days, auto-shim, auto-update, parse-release-body, bin-dir",
-                            key
-                        );
-                    }
+    let existing = find_tool_executable(config, &tool_id);
+    let old_version = existing.as_ref().map(|t| t.version.clone());
+    let repo_to_pull = if let Some(existing) = existing {
+        tracing::info!(
+            "Tool '{}' resolves to repository {}",
+            tool_id,
+            existing.repo
+        );
+        existing.repo.clone()
+    } else {
+        tracing::info!("Pulling {}...", tool_id);
+        tool_id.clone()
+    };
+
+    match install_or_update_tool(config, &repo_to_pull, true, asset.as_deref(), parse_body).await {
+        Ok(installed) => {
+            let path = installed.executable_path;
+            handle_self_update(&path, &repo_to_pull)?;
+            let new_version = config
+                .tools
+                .get(&installed.key)
+                .map_or("unknown", |t| t.version.as_str());
+            report_update(&repo_to_pull, old_version.as_deref(), new_version);
+            tracing::info!("Path: {}", path.display());
+            if config.settings.auto_shim {
+                if let Err(e) = setup_auto_shim(
+                    &config.settings.bin_dir,
+                    &tool_identifier.tool_name(),
+                    &path,
+                ) {
+                    tracing::warn!(
+                        "auto-shim skipped (bin_dir={}): {}. Pull itself succeeded — set bin-dir to a writable path or disable auto-shim.",
+                        config.settings.bin_dir,
+                        e
+                    );
                 }
             }
-            ConfigAction::Unset { key } => {
-                let key = normalize_key(&key);
-                match key.as_str() {
-                    "update_check_days" => {
-                        config.settings.update_check_days =
-                            ToolerSettings::default().update_check_days;
-                        save_tool_configs(&config)?;
-                        tracing::info!("Setting '{}' unset", key);
-                    }
-                    "auto_shim" => {
-                        config.settings.auto_shim = ToolerSettings::default().auto_shim;
-                        save_tool_configs(&config)?;
-                        tracing::info!("Setting '{}' unset", key);
-                    }
-                    "auto_update" => {
-                        config.settings.auto_update = ToolerSettings::default().auto_update;
-                        save_tool_configs(&config)?;
-                        tracing::info!("Setting '{}' unset", key);
-                    }
-                    "parse_release_body" => {
-                        config.settings.parse_release_body =
-                            ToolerSettings::default().parse_release_body;
-                        save_tool_configs(&config)?;
-                        tracing::info!("Setting '{}' unset", key);
-                    }
-                    "bin_dir" => {
-                        config.settings.bin_dir = ToolerSettings::default().bin_dir;
-                        save_tool_configs(&config)?;
-                        tracing::info!("Setting '{}' unset", key);
-                    }
-                    _ => {
-                        tracing::error!(
-                            "'{}' is not a valid configuration setting. Valid settings: update-check-days, auto-shim, auto-update, parse-release-body, bin-dir",
-                            key
-                        );
-                    }
+        }
+        Err(e) => {
+            if let Some(gh_error) = e.downcast_ref::<install::github::GitHubReleaseError>() {
+                display_github_error(&tool_id, gh_error);
+            } else if tool_identifier.forge == types::Forge::Url {
+                eprintln!("\nError: Tool '{}' could not be fetched from URL.", tool_id);
+                if let Some(url) = &tool_identifier.url {
+                    eprintln!("URL: {}", url);
                 }
+            } else {
+                eprintln!("\nError: {}", e);
             }
-            ConfigAction::Show { format } => {
-                if format == "json" {
-                    let json = serde_json::to_string_pretty(&config)?;
-                    println!("{}", json);
-                } else if format == "yaml" {
-                    let yaml = serde_yaml::to_string(&config)?;
-                    println!("{}", yaml);
-                } else {
-                    println!("--- Tooler Configuration ---");
-                    println!("Settings:");
-                    println!("  update-check-days: {}", config.settings.update_check_days);
-                    println!("  auto-shim: {}", config.settings.auto_shim);
-                    println!("  auto-update: {}", config.settings.auto_update);
-                    println!(
-                        "  parse-release-body: {}",
-                        config.settings.parse_release_body
-                    );
-                    println!("  bin-dir: {}", config.settings.bin_dir);
-
-                    if !config.aliases.is_empty() {
-                        println!("\nAliases:");
-                        for (name, target) in &config.aliases {
-                            println!("  {} -> {}", name, target);
-                        }
-                    }
+            return Ok(1);
+        }
+    }
+    Ok(0)
+}
 
-                    println!("\nTools: {}", config.tools.len());
-                    for (key, info) in &config.tools {
-                        println!("  - {}: v{} ({})", key, info.version, info.repo);
-                    }
+fn execute_config(config: &mut ToolerConfig, action: ConfigAction) -> Result<i32> {
+    match action {
+        ConfigAction::Get { key } => {
+            if let Some(key) = key {
+                match find_setting(&normalize_key(&key)) {
+                    Some(setting) => println!("{}", (setting.get)(&config.settings)),
+                    None => println!("Setting '{}' not found", key),
                 }
+            } else {
+                let mut out = io::BufWriter::new(io::stdout().lock());
+                writeln!(out, "--- Tooler Settings ---")?;
+                for setting in SETTINGS {
+                    writeln!(
+                        out,
+                        "  {}: {}",
+                        setting.display_key(),
+                        (setting.get)(&config.settings)
+                    )?;
+                }
+                out.flush()?;
             }
-        },
-        Commands::Pin { tool_id } => {
-            pin_tool(&mut config, &tool_id)?;
         }
-        Commands::Alias {
-            name,
-            target,
-            remove,
-        } => {
-            if remove {
-                if config.aliases.remove(&name).is_some() {
-                    save_tool_configs(&config)?;
-                    tracing::info!("Alias '{}' removed", name);
+        ConfigAction::Set { args } => {
+            let (key, value_str) = if args.len() == 1 {
+                if let Some((k, v)) = args[0].split_once('=') {
+                    (k.to_string(), v.to_string())
                 } else {
-                    tracing::warn!("Alias '{}' not found", name);
+                    tracing::error!("Invalid format. Use 'key=value' or 'key value'.");
+                    return Ok(1);
                 }
-            } else if let Some(target) = target {
-                config.aliases.insert(name.clone(), target.clone());
-                save_tool_configs(&config)?;
-                tracing::info!("Alias '{}' set to '{}'", name, target);
-            } else if let Some(target) = config.aliases.get(&name) {
-                println!("{} -> {}", name, target);
+            } else if args.len() >= 2 {
+                (args[0].clone(), args[1..].join(" "))
             } else {
-                return Err(anyhow!("Alias '{}' not found", name));
+                tracing::error!("Invalid format. Use 'key=value' or 'key value'.");
+                return Ok(1);
+            };
+
+            let Some(setting) = find_setting(&normalize_key(&key)) else {
+                tracing::error!(
+                    "'{}' is not a valid configuration setting. Valid settings: {}",
+                    key,
+                    setting_keys()
+                );
+                return Ok(1);
+            };
+            let before = config.settings.clone();
+            if let Err(hint) = (setting.set)(&mut config.settings, &value_str) {
+                tracing::error!("Invalid value for '{}'. {}", key, hint);
+                return Ok(1);
+            }
+            tracing::info!(
+                "Setting '{}' updated to '{}'",
+                setting.key,
+                (setting.get)(&config.settings)
+            );
+            // Setting a value to what it already is leaves the file untouched
+            if config.settings != before {
+                save_tool_configs(config)?;
             }
         }
-        Commands::Info { tool_ids } => {
-            let mut any_missing = false;
-            let os = platform::get_system_info().os;
-            for tool_id in &tool_ids {
-                let mut info = find_tool_executable(&config, tool_id);
-
-                // Invalidate stale entries (path missing or non-executable) so recovery runs.
-                let resolved_repo = info.as_ref().map(|i| i.repo.clone());
-                let mut configured_info = None;
-                if let Some(ref i) = info {
-                    let p = Path::new(&i.executable_path);
-                    if !p.exists() || !is_executable(p, &os) {
-                        eprintln!(
-                            "Note: cached entry for '{}' points at missing/invalid binary ({}). Attempting recovery...",
-                            tool_id, i.executable_path
-                        );
-                        configured_info = Some(i.clone());
-                        info = None;
-                    }
+        ConfigAction::Unset { key } => {
+            let Some(setting) = find_setting(&normalize_key(&key)) else {
+                tracing::error!(
+                    "'{}' is not a valid configuration setting. Valid settings: {}",
+                    normalize_key(&key),
+                    setting_keys()
+                );
+                return Ok(1);
+            };
+            let before = config.settings.clone();
+            (setting.reset)(&mut config.settings);
+            tracing::info!("Setting '{}' unset", setting.key);
+            // Setting a value to what it already is leaves the file untouched
+            if config.settings != before {
+                save_tool_configs(config)?;
+            }
+        }
+        ConfigAction::Show { format } => {
+            if format == "json" {
+                let json = serde_json::to_string_pretty(config)?;
+                println!("{}", json);
+            } else if format == "yaml" {
+                let yaml = serde_yaml::to_string(config)?;
+                println!("{}", yaml);
+            } else {
+                println!("--- Tooler Configuration ---");
+                println!("Settings:");
+                for setting in SETTINGS {
+                    println!(
+                        "  {}: {}",
+                        setting.display_key(),
+                        (setting.get)(&config.settings)
+                    );
                 }
 
-                let recovery_target: &str = resolved_repo.as_deref().unwrap_or(tool_id);
-                if info.is_none() {
-                    if let Ok(Some(recovered)) = install::try_recover_tool(recovery_target) {
-                        eprintln!(
-                            "Recovered tool {} (v{}) from local installation.",
-                            tool_id, recovered.version
-                        );
-                        let key = ToolIdentifier::parse(&recovered.repo)
-                            .map_err(|e| anyhow!(e))?
-                            .config_key();
-                        config.tools.insert(key, recovered);
-                        save_tool_configs(&config)?;
-                        info = find_tool_executable(&config, tool_id);
+                if !config.aliases.is_empty() {
+                    println!("\nAliases:");
+                    for (name, target) in &config.aliases {
+                        println!("  {} -> {}", name, target);
                     }
                 }
 
-                if info.is_none() {
-                    if let Some(configured) = configured_info {
-                        eprintln!(
-                            "Note: local recovery did not find a replacement binary; showing configured metadata."
-                        );
-                        info = Some(configured);
-                    }
+                println!("\nTools: {}", config.tools.len());
+                for (key, info) in &config.tools {
+                    println!("  - {}: v{} ({})", key, info.version, info.repo);
                 }
+            }
+        }
+    }
+    Ok(0)
+}
 
-                if let Some(info) = info {
-                    let system_info = platform::get_system_info();
-                    let all_binaries =
-                        find_all_executables_in_tool_dir(&info.executable_path, &system_info.os);
-
-                    println!("--- Tool Information ({}) ---", tool_id);
-                    println!("  Name:          {}", info.tool_name);
-                    println!("  Repository:    {}", info.repo);
-                    println!("  Version:       {}", info.version);
-                    println!("  Installed at:  {}", info.installed_at);
-                    println!("  Last accessed: {}", info.last_accessed);
-                    println!("  Install type:  {}", info.install_type);
-                    println!("  Pinned:        {}", info.pinned);
-                    println!("  Binaries:      {}", all_binaries.join(", "));
-                    println!("  Path:          {}", info.executable_path);
-                    println!("------------------------");
-                } else {
-                    tracing::error!(
-                        "Tool '{}' not found. Try `tooler list` to see installed tools.",
-                        tool_id
-                    );
-                    any_missing = true;
-                }
+fn execute_alias(
+    config: &mut ToolerConfig,
+    name: String,
+    target: Option<String>,
+    remove: bool,
+) -> Result<()> {
+    if remove {
+        if config.aliases.remove(&name).is_some() {
+            save_tool_configs(config)?;
+            tracing::info!("Alias '{}' removed", name);
+        } else {
+            tracing::warn!("Alias '{}' not found", name);
+        }
+    } else if let Some(target) = target {
+        config.aliases.insert(name.clone(), target.clone());
+        save_tool_configs(config)?;
+        tracing::info!("Alias '{}' set to '{}'", name, target);
+    } else if let Some(target) = config.aliases.get(&name) {
+        println!("{} -> {}", name, target);
+    } else {
+        return Err(anyhow!("Alias '{}' not found", name));
+    }
+    Ok(())
+}
+
+fn execute_info(config: &mut ToolerConfig, tool_ids: &[String]) -> Result<i32> {
+    let mut any_missing = false;
+    let system_info = platform::get_system_info();
+    for tool_id in tool_ids {
+        let mut info = find_tool_executable(config, tool_id);
+
+        // Invalidate stale entries (path missing or non-executable) so recovery runs.
+        let resolved_repo = info.as_ref().map(|i| i.repo.clone());
+        let mut configured_info = None;
+        if let Some(ref i) = info {
+            let p = Path::new(&i.executable_path);
+            if !is_executable(p, &system_info.os) {
+                eprintln!(
+                    "Note: cached entry for '{}' points at missing/invalid binary ({}). Attempting recovery...",
+                    tool_id, i.executable_path
+                );
+                configured_info = Some(i.clone());
+                info = None;
+            }
+        }
+
+        let recovery_target: &str = resolved_repo.as_deref().unwrap_or(tool_id);
+        if info.is_none() {
+            if let Ok(Some(recovered)) = install::try_recover_tool(recovery_target) {
+                eprintln!(
+                    "Recovered tool {} (v{}) from local installation.",
+                    tool_id, recovered.version
+                );
+                let key = ToolIdentifier::parse(&recovered.repo)
+                    .map_err(|e| anyhow!(e))?
+                    .config_key();
+                config.insert_tool(key, recovered);
+                save_tool_configs(config)?;
+                info = find_tool_executable(config, tool_id);
             }
-            if any_missing {
-                std::process::exit(1);
+        }
+
+        if info.is_none() {
+            if let Some(configured) = configured_info {
+                eprintln!(
+                    "Note: local recovery did not find a replacement binary; showing configured metadata."
+                );
+                info = Some(configured);
             }
         }
+
+        if let Some(info) = info {
+            let all_binaries =
+                find_all_executables_in_tool_dir(&info.executable_path, &system_info.os);
+
+            let mut out = io::BufWriter::new(io::stdout().lock());
+            writeln!(out, "--- Tool Information ({}) ---", tool_id)?;
+            writeln!(out, "  Name:          {}", info.tool_name)?;
+            writeln!(out, "  Repository:    {}", info.repo)?;
+            writeln!(out, "  Version:       {}", info.version)?;
+            writeln!(out, "  Installed at:  {}", info.installed_at)?;
+            writeln!(out, "  Last accessed: {}", info.last_accessed)?;
+            writeln!(out, "  Install type:  {}", info.install_type)?;
+            writeln!(out, "  Pinned:        {}", info.pinned)?;
+            writeln!(out, "  Binaries:      {}", all_binaries.join(", "))?;
+            writeln!(out, "  Path:          {}", info.executable_path)?;
+            writeln!(out, "------------------------")?;
+            out.flush()?;
+        } else {
+            tracing::error!(
+                "Tool '{}' not found. Try `tooler list` to see installed tools.",
+                tool_id
+            );
+            any_missing = true;
+        }
     }
+    Ok(if any_missing { 1 } else { 0 })
+}
 
-    Ok(())
+/// Drive an async command to completion. Only commands that reach the network
+/// build a runtime; the rest run on the main thread alone.
+fn block_on<T>(command: impl std::future::Future<Output = Result<T>>) -> Result<T> {
+    let runtime = tokio::runtime::Builder::new_multi_thread()
+        .enable_all()
+        .build()?;
+    let result = runtime.block_on(command);
+    // An abandoned background update check may still be resolving a host name
+    // on a blocking thread; exiting must not wait for it.
+    runtime.shutdown_background();
+    result
+}
+
+/// The `--parse-release-body`/`--no-parse-release-body` flag pair as an
+/// override of the configured policy.
+fn release_body_flag(parse_release_body: bool, no_parse_release_body: bool) -> Option<bool> {
+    if parse_release_body {
+        Some(true)
+    } else if no_parse_release_body {
+        Some(false)
+    } else {
+        None
+    }
 }
 
 async fn execute_run(
@@ -565,7 +633,9 @@ async fn execute_run(
     tool_args: Vec<String>,
     asset: Option<String>,
     parse_release_body: Option<bool>,
-) -> Result<()> {
+    cache: bool,
+    cache_stdin: bool,
+) -> Result<i32> {
     let tool_identifier = match ToolIdentifier::parse(&tool_id) {
         Ok(id) => id,
         Err(_) => {
@@ -579,7 +649,7 @@ async fn execute_run(
 
                     if let Some(help) = sub_help {
                         println!("{}", help);
-                        std::process::exit(0);
+                        return Ok(0);
                     }
                 }
                 eprintln!(
@@ -591,40 +661,189 @@ async fn execute_run(
                     "Subcommand flags must be placed AFTER the tool name: 'tooler run <tool> {}'",
                     tool_id
                 );
-                std::process::exit(1);
+                return Ok(1);
             }
             return Err(anyhow!("Invalid tool identifier: {}", tool_id));
         }
     };
 
-    // Check for updates for this specific tool if not pinned
-    if !tool_identifier.is_pinned() {
-        if let Some(key) = find_tool_entry(config, &tool_id).map(|(k, _)| k.clone()) {
-            check_for_updates(config, Some(&key)).await?;
+    // Resolve the configured entry once; the update check, the executable
+    // lookup and the reinstall fallback below all start from it. The parsed
+    // identifier is reused unless the tool id is an alias.
+    let lookup_id = install::lookup_identifier(config, &tool_id, Some(&tool_identifier));
+    let find_configured = |config: &ToolerConfig| {
+        lookup_id
+            .as_ref()
+            .and_then(|id| install::find_tool_entry_for_id(config, id))
+            .map(|(key, info)| (key.clone(), info.clone()))
+    };
+    let mut configured_entry = find_configured(config);
+
+    // Apply or report updates found by an earlier background check, then start
+    // a new check for this tool that runs while the tool executes.
+    let mut update_check = None;
+    if !tool_identifier.is_pinned() && install::update_checks_enabled() {
+        if let Some(key) = configured_entry.as_ref().map(|(k, _)| k.clone()) {
+            let pending = install::take_pending_updates(&key);
+            if !pending.is_empty() {
+                let check = types::UpdateCheck {
+                    checked_keys: Vec::new(),
+                    updates: pending,
+                };
+                install::apply_update_check(config, check).await?;
+                // An applied update replaces the entry
+                configured_entry = find_configured(config);
+            }
+
+            let snapshot = config.clone();
+            update_check = Some(tokio::spawn(async move {
+                install::find_available_updates(&snapshot, Some(&key)).await
+            }));
+        }
+    }
+
+    let Some(info) = resolve_run_target(
+        config,
+        &tool_id,
+        &tool_identifier,
+        lookup_id.as_deref(),
+        configured_entry.as_ref(),
+        asset.as_deref(),
+        parse_release_body,
+    )
+    .await?
+    else {
+        return Ok(1);
+    };
+
+    // Show tool age. Parsing the install time costs more than the check,
+    // and the message is hidden at the default log level.
+    if tracing::enabled!(tracing::Level::INFO) {
+        if let Ok(installed_at) = info.installed_at.parse::<DateTime<Utc>>() {
+            let duration = Utc::now() - installed_at;
+            let days_since_install = duration.num_days();
+            tracing::info!(
+                "{} is {} days old ({}h {}m {}s)",
+                info.repo,
+                days_since_install,
+                duration.num_hours() % 24,
+                duration.num_minutes() % 60,
+                duration.num_seconds() % 60
+            );
+            let is_pinned_version =
+                info.version != "latest" && !info.version.to_lowercase().contains("latest");
+            if is_pinned_version && days_since_install > config.settings.update_check_days as i64 {
+                tracing::info!("Tool is version-pinned and not auto-updated");
+            }
+        }
+    }
+
+    // Create shim if auto_shim is enabled
+    if config.settings.auto_shim {
+        if let Err(e) = setup_auto_shim(
+            &config.settings.bin_dir,
+            &tool_identifier.tool_name(),
+            Path::new(&info.executable_path),
+        ) {
+            tracing::warn!(
+                "auto-shim skipped (bin_dir={}): {}. Tool still runs from {}.",
+                config.settings.bin_dir,
+                e,
+                info.executable_path
+            );
+        }
+    }
+
+    // Update last accessed time; saved once, together with any update-check stamps
+    let executable_path = info.executable_path.clone();
+    let accessed = config.mark_tool_accessed(&info.repo, &info.version, Utc::now());
+
+    // Execute tool
+    let mut cmd = Command::new(&executable_path);
+
+    cmd.args(&tool_args);
+    tracing::debug!("Executing: {:?} {:?}", executable_path, tool_args);
+
+    if cache {
+        let code = run_cached(
+            cmd,
+            &executable_path,
+            &info.version,
+            &tool_args,
+            cache_stdin,
+        )?;
+        finish_run(config, accessed, update_check).await;
+        return Ok(code);
+    }
+
+    // With no background update check to collect, replace tooler with the
+    // tool instead of staying resident as its parent.
+    #[cfg(unix)]
+    if update_check.is_none() {
+        use std::os::unix::process::CommandExt;
+        if accessed {
+            save_tool_configs(config)?;
         }
+        let e = cmd.exec();
+        return Err(execute_error(&executable_path, e));
     }
 
-    let mut tool_info = find_tool_executable(config, &tool_id);
+    // Like a shell waiting on a foreground job: the terminal sends Ctrl-C and
+    // Ctrl-\ to the tool as well, so tooler must outlive them to collect it.
+    #[cfg(unix)]
+    let _deferred_signals = defer_terminal_signals();
+    // Keep `cmd` free of `pre_exec` hooks and uid/gid changes: without them
+    // std spawns through posix_spawn (vfork-style on Linux), and since std
+    // opens every descriptor close-on-exec there is none to sweep in the child.
+    let status = cmd
+        .status()
+        .map_err(|e| execute_error(&executable_path, e))?;
+    finish_run(config, accessed, update_check).await;
+    Ok(exit_code(status))
+}
+
+/// Find the executable `run` should start: the configured entry while its
+/// binary is intact, otherwise a local recovery, otherwise a fresh install.
+/// Returns `None` once the reason nothing could be resolved has been reported.
+async fn resolve_run_target(
+    config: &mut ToolerConfig,
+    tool_id: &str,
+    tool_identifier: &ToolIdentifier,
+    lookup_id: Option<&ToolIdentifier>,
+    configured_entry: Option<&(String, ToolInfo)>,
+    asset: Option<&str>,
+    parse_release_body: Option<bool>,
+) -> Result<Option<ToolInfo>> {
+    let find_executable = |config: &ToolerConfig| {
+        let id = lookup_id?;
+        let (_, info) = install::find_tool_entry_for_id(config, id)?;
+        Some(install::resolve_entry_executable(id, info))
+    };
+    let mut tool_info = configured_entry
+        .zip(lookup_id)
+        .map(|((_, info), id)| install::resolve_entry_executable(id, info));
 
     // Remember the resolved repo before any invalidation, so recovery & install
     // can use the real repo (e.g. "cli/cli") instead of the user's shortname ("gh").
     let resolved_repo: Option<String> = tool_info.as_ref().map(|i| i.repo.clone());
-    let configured_reinstall =
-        find_tool_entry(config, &tool_id).map(|(key, info)| (key.clone(), info.clone()));
 
-    // Validate tool_info if found
+    // Validate tool_info if found. An intact configured entry, the usual case,
+    // is ready to launch.
+    let os = &platform::get_system_info().os;
     if let Some(ref info) = tool_info {
         let path = Path::new(&info.executable_path);
-        if !path.exists() || !is_executable(path, &platform::get_system_info().os) {
+        if !is_executable(path, os) {
             tracing::warn!(
                 "Tool {} found in config but executable is missing or invalid. Attempting recovery...",
                 tool_id
             );
             tool_info = None;
+        } else if asset.is_none() {
+            return Ok(tool_info);
         }
     }
 
-    let recovery_target: &str = resolved_repo.as_deref().unwrap_or(&tool_id);
+    let recovery_target: &str = resolved_repo.as_deref().unwrap_or(tool_id);
 
     // Recovery: If tool not found in config, try to discover it locally
     if tool_info.is_none() && asset.is_none() {
@@ -637,9 +856,9 @@ async fn execute_run(
                 .map_err(|e| anyhow!(e))?
                 .config_key();
 
-            config.tools.insert(key, recovered);
+            config.insert_tool(key, recovered);
             save_tool_configs(config)?;
-            tool_info = find_tool_executable(config, &tool_id);
+            tool_info = find_executable(config);
         }
     }
 
@@ -651,35 +870,27 @@ async fn execute_run(
                 tool_id
             );
         }
-        let install_result = if let Some((key, configured)) = configured_reinstall.as_ref() {
-            reinstall_configured_tool(
-                config,
-                key,
-                configured,
-                &tool_id,
-                asset.as_deref(),
-                parse_release_body,
-            )
-            .await
+        let install_result = if let Some((key, configured)) = configured_entry {
+            reinstall_configured_tool(config, key, configured, tool_id, asset, parse_release_body)
+                .await
         } else {
-            install_or_update_tool(
-                config,
-                recovery_target,
-                false,
-                asset.as_deref(),
-                parse_release_body,
-            )
-            .await
+            install_or_update_tool(config, recovery_target, false, asset, parse_release_body).await
         };
 
         match install_result {
-            Ok(_) => {
-                *config = load_tool_configs()?; // Reload config
-                tool_info = find_tool_executable(config, &tool_id);
+            Ok(installed) => {
+                // The install recorded the entry in `config` and reports its key,
+                // so only a key it could not place needs a fresh lookup
+                tool_info = config
+                    .tools
+                    .get(&installed.key)
+                    .zip(lookup_id)
+                    .map(|(info, id)| install::resolve_entry_executable(id, info))
+                    .or_else(|| find_executable(config));
             }
             Err(e) => {
                 if let Some(gh_error) = e.downcast_ref::<install::github::GitHubReleaseError>() {
-                    display_github_error(&tool_id, gh_error);
+                    display_github_error(tool_id, gh_error);
                 } else if tool_identifier.forge == types::Forge::Url {
                     eprintln!("\nError: Tool '{}' could not be fetched from URL.", tool_id);
                     if let Some(url) = &tool_identifier.url {
@@ -688,102 +899,172 @@ async fn execute_run(
                 } else {
                     eprintln!("\nError: {}", e);
                 }
-                std::process::exit(1);
+                return Ok(None);
             }
         }
     }
 
-    if let Some(info) = tool_info {
-        // Show tool age
-        if let Ok(installed_at) = info.installed_at.parse::<DateTime<Utc>>() {
-            let now = Utc::now();
-            let duration = now - installed_at;
-            let days_since_install = duration.num_days();
-            let hours = duration.num_hours() % 24;
-            let minutes = duration.num_minutes() % 60;
-            let seconds = duration.num_seconds() % 60;
-            let is_pinned_version =
-                info.version != "latest" && !info.version.to_lowercase().contains("latest");
+    // A recovered or freshly installed binary gets the same check as a
+    // configured one, so a bad result is reported here instead of by exec
+    let tool_info = tool_info.filter(|info| is_executable(Path::new(&info.executable_path), os));
+    if tool_info.is_none() {
+        tracing::error!("Failed to find or install executable for {}", tool_id);
+    }
+    Ok(tool_info)
+}
 
-            if is_pinned_version {
-                tracing::info!(
-                    "{} is {} days old ({}h {}m {}s)",
-                    info.repo,
-                    days_since_install,
-                    hours,
-                    minutes,
-                    seconds
-                );
-                if days_since_install > config.settings.update_check_days as i64 {
-                    tracing::info!("Tool is version-pinned and not auto-updated");
-                }
-            } else {
-                tracing::info!(
-                    "{} is {} days old ({}h {}m {}s)",
-                    info.repo,
-                    days_since_install,
-                    hours,
-                    minutes,
-                    seconds
-                );
-            }
+/// Collect the background update check, if any, and save the config once if
+/// the run or the check changed it.
+async fn finish_run(
+    config: &mut ToolerConfig,
+    mut dirty: bool,
+    update_check: Option<tokio::task::JoinHandle<Result<types::UpdateCheck>>>,
+) {
+    if let Some(update_check) = update_check {
+        dirty |= finish_update_check(config, update_check).await;
+    }
+    if dirty {
+        if let Err(e) = save_tool_configs(config) {
+            tracing::warn!("Failed to save config: {}", e);
         }
+    }
+}
 
-        // Create shim if auto_shim is enabled
-        if config.settings.auto_shim {
-            if let Err(e) = setup_auto_shim(
-                &config.settings.bin_dir,
-                &tool_identifier.tool_name(),
-                Path::new(&info.executable_path),
-            ) {
-                tracing::warn!(
-                    "auto-shim skipped (bin_dir={}): {}. Tool still runs from {}.",
-                    config.settings.bin_dir,
-                    e,
-                    info.executable_path
-                );
+/// Run a tool through the result cache and relay its output, returning the
+/// exit code. A hit replays the stored output without starting the tool; a miss
+/// runs it to completion with captured output and stores the result unless the
+/// tool was killed by a signal. Stdin is only read, fed to the tool and keyed
+/// on with `read_stdin`; otherwise the tool's stdin is empty.
+fn run_cached(
+    mut cmd: Command,
+    executable_path: &str,
+    version: &str,
+    tool_args: &[String],
+    read_stdin: bool,
+) -> Result<i32> {
+    use std::io::Read;
+    use std::process::Stdio;
+
+    // Reading stdin unasked would block on a pipe that never closes and
+    // swallow input meant for the caller's next command.
+    let mut stdin = Vec::new();
+    if read_stdin {
+        io::stdin().read_to_end(&mut stdin)?;
+    }
+    let key = run_cache::CacheKey::new(
+        Path::new(executable_path),
+        version,
+        tool_args,
+        &env::current_dir()?,
+        &stdin,
+    );
+
+    let run = match run_cache::load(&key) {
+        Some(run) => {
+            tracing::debug!("Replaying cached run {}", key.file_name());
+            run
+        }
+        None => {
+            let mut child = cmd
+                .stdin(if read_stdin {
+                    Stdio::piped()
+                } else {
+                    Stdio::null()
+                })
+                .stdout(Stdio::piped())
+                .stderr(Stdio::piped())
+                .spawn()
+                .map_err(|e| execute_error(executable_path, e))?;
+            // Feed stdin from a separate thread so a tool that writes before it
+            // has read all of its input cannot deadlock against us.
+            let mut child_stdin = child.stdin.take();
+            let feeder = std::thread::spawn(move || {
+                if let Some(pipe) = child_stdin.as_mut() {
+                    let _ = pipe.write_all(&stdin);
+                }
+            });
+            let output = child.wait_with_output()?;
+            let _ = feeder.join();
+            let run = run_cache::CachedRun {
+                code: exit_code(output.status),
+                stdout: output.stdout,
+                stderr: output.stderr,
+            };
+            if output.status.code().is_some() {
+                if let Err(e) = run_cache::store(&key, &run) {
+                    tracing::warn!("Failed to store cached run: {}", e);
+                }
             }
+            run
         }
+    };
 
-        // Update last accessed time
-        let repo_to_match = info.repo.clone();
-        let version_to_match = info.version.clone();
-        let executable_path = info.executable_path.clone();
+    io::stdout().write_all(&run.stdout)?;
+    io::stdout().flush()?;
+    io::stderr().write_all(&run.stderr)?;
+    Ok(run.code)
+}
 
-        {
-            if let Some(found_info) = config
-                .tools
-                .values_mut()
-                .find(|t| t.repo == repo_to_match && t.version == version_to_match)
-            {
-                found_info.last_accessed = Utc::now().to_rfc3339();
-                save_tool_configs(config)?;
-            }
+/// Install handlers for the terminal's interrupt and quit signals, which stops
+/// them from terminating tooler for as long as the returned handles live.
+#[cfg(unix)]
+fn defer_terminal_signals() -> Vec<tokio::signal::unix::Signal> {
+    use tokio::signal::unix::{signal, SignalKind};
+
+    [SignalKind::interrupt(), SignalKind::quit()]
+        .into_iter()
+        .filter_map(|kind| signal(kind).ok())
+        .collect()
+}
+
+/// The exit code to report for a finished tool, using the shell's 128 + N
+/// convention for tools killed by signal N.
+fn exit_code(status: std::process::ExitStatus) -> i32 {
+    #[cfg(unix)]
+    {
+        use std::os::unix::process::ExitStatusExt;
+        if let Some(signal) = status.signal() {
+            return 128 + signal;
         }
+    }
+    status.code().unwrap_or(1)
+}
 
-        // Execute tool
-        let mut cmd = Command::new(&executable_path);
-
-        cmd.args(&tool_args);
-        tracing::debug!("Executing: {:?} {:?}", executable_path, tool_args);
-        let mut child = cmd.spawn().map_err(|e| {
-            if e.raw_os_error() == Some(8) {
-                anyhow!(
-                    "Failed to execute '{}': Exec format error.\n\n\
-                    Check the file type with 'file {}'",
-                    executable_path,
-                    executable_path
-                )
-            } else {
-                anyhow!("Failed to execute tool: {}", e)
-            }
-        })?;
-        let status = child.wait()?;
-        std::process::exit(status.code().unwrap_or(1));
+fn execute_error(executable_path: &str, e: std::io::Error) -> anyhow::Error {
+    if e.raw_os_error() == Some(8) {
+        anyhow!(
+            "Failed to execute '{}': Exec format error.\n\n\
+            Check the file type with 'file {}'",
+            executable_path,
+            executable_path
+        )
+    } else {
+        anyhow!("Failed to execute tool: {}", e)
     }
+}
 
-    tracing::error!("Failed to find or install executable for {}", tool_id);
-    std::process::exit(1);
+/// Collect a background update check once the tool has exited. A check that is
+/// still waiting on the network after the grace period is abandoned and retried
+/// on a later run, since its tools were not stamped as checked. Returns whether
+/// the config needs saving.
+async fn finish_update_check(
+    config: &mut ToolerConfig,
+    update_check: tokio::task::JoinHandle<Result<types::UpdateCheck>>,
+) -> bool {
+    match tokio::time::timeout(UPDATE_CHECK_GRACE, update_check).await {
+        Ok(Ok(Ok(check))) => match install::record_update_check(config, check) {
+            Ok(dirty) => return dirty,
+            Err(e) => tracing::debug!("Failed to record update check: {}", e),
+        },
+        Ok(Ok(Err(e))) => tracing::debug!("Update check failed: {}", e),
+        Ok(Err(e)) => tracing::debug!("Update check task failed: {}", e),
+        Err(_) => tracing::debug!("Update check did not finish in time; skipping"),
+    }
+    false
+}
+
+fn print_version() {
+    println!("{} {}", env!("CARGO_PKG_NAME"), cli::get_version());
 }
 
 fn setup_logging(cli: &Cli) -> Result<()> {
@@ -824,28 +1105,32 @@ fn init_logging_subscriber(
 ) -> Result<()> {
     use tracing_subscriber::fmt::writer::MakeWriterExt;
 
+    let ansi = destinations.use_ansi();
     match (
         destinations.stderr,
         destinations.stdout,
         destinations.logfile_path.is_some(),
     ) {
-        (false, false, false) => init_logging_with_writer(filter, io::sink),
-        (true, false, false) => init_logging_with_writer(filter, io::stderr),
-        (false, true, false) => init_logging_with_writer(filter, io::stdout),
-        (true, true, false) => init_logging_with_writer(filter, io::stderr.and(io::stdout)),
+        (false, false, false) => init_logging_with_writer(filter, ansi, io::sink),
+        (true, false, false) => init_logging_with_writer(filter, ansi, io::stderr),
+        (false, true, false) => init_logging_with_writer(filter, ansi, io::stdout),
+        (true, true, false) => init_logging_with_writer(filter, ansi, io::stderr.and(io::stdout)),
         (false, false, true) => {
-            init_logging_with_writer(filter, Mutex::new(open_log_file(&destinations)?))
+            init_logging_with_writer(filter, ansi, Mutex::new(open_log_file(&destinations)?))
         }
         (true, false, true) => init_logging_with_writer(
             filter,
+            ansi,
             io::stderr.and(Mutex::new(open_log_file(&destinations)?)),
         ),
         (false, true, true) => init_logging_with_writer(
             filter,
+            ansi,
             io::stdout.and(Mutex::new(open_log_file(&destinations)?)),
         ),
         (true, true, true) => init_logging_with_writer(
             filter,
+            ansi,
             io::stderr
                 .and(io::stdout)
                 .and(Mutex::new(open_log_file(&destinations)?)),
@@ -853,7 +1138,11 @@ fn init_logging_subscriber(
     }
 }
 
-fn init_logging_with_writer<W>(filter: tracing_subscriber::EnvFilter, writer: W) -> Result<()>
+fn init_logging_with_writer<W>(
+    filter: tracing_subscriber::EnvFilter,
+    ansi: bool,
+    writer: W,
+) -> Result<()>
 where
     W: for<'writer> tracing_subscriber::fmt::MakeWriter<'writer> + Send + Sync + 'static,
 {
@@ -862,6 +1151,7 @@ where
     fmt()
         .with_env_filter(filter)
         .with_writer(writer)
+        .with_ansi(ansi)
         .with_target(false)
         .with_thread_ids(false)
         .with_thread_names(false)
@@ -877,6 +1167,17 @@ struct LogDestinations {
 }
 
 impl LogDestinations {
+    /// Whether to color log output, decided once when logging is set up: only
+    /// when every console destination is a terminal and NO_COLOR is unset.
+    fn use_ansi(&self) -> bool {
+        use std::io::IsTerminal;
+
+        (self.stderr || self.stdout)
+            && (!self.stderr || io::stderr().is_terminal())
+            && (!self.stdout || io::stdout().is_terminal())
+            && env::var_os("NO_COLOR").is_none_or(|v| v.is_empty())
+    }
+
     fn parse(value: &str) -> Result<Self> {
         let mut destinations = Self {
             stderr: false,
@@ -1230,11 +1531,14 @@ fn display_github_error(tool_id: &str, gh_error: &install::github::GitHubRelease
                 );
             }
         }
-        GitHubReleaseError::RateLimited { repo } => {
+        GitHubReleaseError::RateLimited { repo, reset_at } => {
             tracing::warn!("GitHub API rate limit reached while querying {}", repo);
             eprintln!(
                 "\nError: GitHub API rate limit reached. Try again later or set GITHUB_TOKEN."
             );
+            if let Some(reset) = reset_at.and_then(|r| DateTime::<Utc>::from_timestamp(r, 0)) {
+                eprintln!("The limit resets at {}.", reset.to_rfc3339());
+            }
         }
         GitHubReleaseError::RequestFailed { repo, status } => {
             tracing::error!("Failed to get release info for {}: {}", repo, status);
@@ -1,22 +1,77 @@
 use crate::types::*;
 use anyhow::Result;
-use std::collections::HashMap;
-
-pub fn get_system_info() -> PlatformInfo {
-    let os = std::env::consts::OS.to_string();
-    let arch = std::env::consts::ARCH.to_string();
-
-    let normalized_arch = match arch.as_str() {
-        "x86_64" => "amd64".to_string(),
-        "aarch64" => "arm64".to_string(),
-        "arm" => "arm".to_string(),
-        _ => arch,
-    };
-
-    PlatformInfo {
-        os,
-        arch: normalized_arch,
-    }
+use std::sync::OnceLock;
+
+/// The host OS and GitHub-style architecture name, computed once per process.
+pub fn get_system_info() -> &'static PlatformInfo {
+    static SYSTEM_INFO: OnceLock<PlatformInfo> = OnceLock::new();
+    SYSTEM_INFO.get_or_init(|| {
+        let normalized_arch = match std::env::consts::ARCH {
+            "x86_64" => "amd64",
+            "aarch64" => "arm64",
+            arch => arch,
+        };
+
+        PlatformInfo {
+            os: std::env::consts::OS.to_string(),
+            arch: normalized_arch.to_string(),
+        }
+    })
+}
+
+/// Asset-name spellings of each OS, keyed by `std::env::consts::OS`-style name.
+const OS_ALIASES: &[(&str, &[&str])] = &[
+    ("linux", &["linux", "unknown-linux", "pc-linux"]),
+    ("darwin", &["darwin", "macos", "osx"]),
+    ("macos", &["darwin", "macos", "osx"]),
+    ("windows", &["windows", "win", "cygwin"]),
+];
+
+/// Asset-name spellings of each architecture, keyed by system arch name.
+const ARCH_ALIASES: &[(&str, &[&str])] = &[
+    ("x86_64", &["amd64", "x64", "x86_64", "x86-64"]),
+    ("amd64", &["amd64", "x64", "x86_64", "x86-64"]),
+    ("aarch64", &["arm64", "aarch64"]),
+    ("arm64", &["arm64", "aarch64"]),
+    ("arm", &["arm", "armv7"]),
+    ("i686", &["i686", "i386", "x86"]),
+    ("i386", &["i686", "i386", "x86"]),
+];
+
+/// Markers of 32-bit x86 builds, rejected on 64-bit systems.
+const X86_32_MARKERS: &[&str] = &["i686", "i386", "i586", "i486"];
+
+const ARCHIVE_EXTS: &[&str] = &[".tar.gz", ".zip", ".tar.xz", ".tgz"];
+const PACKAGE_EXTS: &[&str] = &[".apk", ".deb", ".rpm"];
+const INVALID_ASSET_EXTS: &[&str] = &[
+    ".sha256", ".asc", ".sig", ".pem", ".pub", ".md", ".txt", ".pom", ".xml", ".json", ".whl",
+];
+
+/// Archive links accepted from a release body, and signature/checksum links skipped.
+const BODY_ARCHIVE_EXTS: &[&str] = &[".tar.gz", ".zip", ".tar.xz", ".tgz", ".gz"];
+const BODY_INVALID_EXTS: &[&str] = &[".asc", ".sig", ".sha256", ".sha256sum", ".pem", ".pub"];
+
+fn aliases_for(table: &[(&str, &'static [&'static str])], name: &str) -> &'static [&'static str] {
+    table
+        .iter()
+        .find(|(key, _)| *key == name)
+        .map_or(&[], |(_, aliases)| aliases)
+}
+
+fn ends_with_any(name: &str, exts: &[&str]) -> bool {
+    exts.iter().any(|ext| name.ends_with(ext))
+}
+
+fn is_64bit_arch(arch: &str) -> bool {
+    matches!(arch, "x86_64" | "amd64" | "aarch64" | "arm64")
+}
+
+/// Whether `name_lower` mentions one of `aliases`, without letting "arm"
+/// match inside "arm64".
+fn mentions_arch(name_lower: &str, aliases: &[&str]) -> bool {
+    aliases.iter().any(|alias| {
+        name_lower.contains(alias) && !(*alias == "arm" && name_lower.contains("arm64"))
+    })
 }
 
 pub fn find_asset_for_platform(
@@ -34,249 +89,88 @@ pub fn find_asset_for_platform(
     let is_musl = is_musl_system();
     tracing::debug!("System is_musl: {}", is_musl);
 
-    let _default_os = [system_os.to_string()];
-    let _default_arch = [system_arch.to_string()];
-
-    let os_aliases = [
-        ("linux", vec!["linux", "unknown-linux", "pc-linux"]),
-        ("darwin", vec!["darwin", "macos", "osx"]),
-        ("macos", vec!["darwin", "macos", "osx"]),
-        ("windows", vec!["windows", "win", "cygwin"]),
-    ];
-
-    let arch_aliases = [
-        ("x86_64", vec!["amd64", "x64", "x86_64", "x86-64"]),
-        ("amd64", vec!["amd64", "x64", "x86_64", "x86-64"]),
-        ("aarch64", vec!["arm64", "aarch64"]),
-        ("arm64", vec!["arm64", "aarch64"]),
-        ("arm", vec!["arm", "armv7"]),
-        ("i686", vec!["i686", "i386", "x86"]),
-        ("i386", vec!["i686", "i386", "x86"]),
-    ];
-
-    tracing::trace!("Available arch aliases: {:?}", arch_aliases);
-
-    let archive_exts = vec![".tar.gz", ".zip", ".tar.xz", ".tgz"];
-    let package_exts = vec![".apk", ".deb", ".rpm"];
-    let invalid_exts = vec![
-        ".sha256", ".asc", ".sig", ".pem", ".pub", ".md", ".txt", ".pom", ".xml", ".json", ".whl",
-    ];
-
-    let mut candidates = categorize_assets(
-        assets,
-        &os_aliases,
-        &arch_aliases,
-        &archive_exts,
-        &package_exts,
-        &invalid_exts,
-    );
+    // Only this system's aliases can select an asset, so resolve them once
+    let system_os_aliases = aliases_for(OS_ALIASES, system_os);
+    let system_arch_aliases = aliases_for(ARCH_ALIASES, system_arch);
+    let is_64bit_system = is_64bit_arch(system_arch);
 
-    // Debug: print all candidates
-    for (category, asset_list) in &candidates {
-        if !asset_list.is_empty() {
-            tracing::trace!("Category '{}': {} assets", category, asset_list.len());
-            for asset in asset_list {
-                tracing::trace!("  - {}", asset.name);
-            }
-        }
-    }
+    // Single pass over the assets, lowercasing each name once. Among assets that
+    // name this OS and architecture, archives beat bare binaries beat packages,
+    // then a matching C library (musl or glibc) wins; ties keep release order.
+    let mut best: Option<((u8, u8), &GitHubAsset)> = None;
+    let mut first_wheel: Option<&GitHubAsset> = None;
+    for asset in assets {
+        let name_lower = asset.name.to_lowercase();
 
-    let priority_order = vec!["os_arch_archive", "os_arch_binary", "os_arch_package"];
-
-    let is_64bit_system = matches!(system_arch, "x86_64" | "amd64" | "aarch64" | "arm64");
-
-    for category in priority_order {
-        if let Some(asset_list) = candidates.remove(category) {
-            // Filter assets by exact OS and architecture match
-            let matching_assets: Vec<&GitHubAsset> = asset_list
-                .iter()
-                .filter(|asset| {
-                    let name_lower = asset.name.to_lowercase();
-
-                    // Reject 32-bit assets on 64-bit systems unless explicitly needed
-                    if is_64bit_system {
-                        let is_32bit = name_lower.contains("i686")
-                            || name_lower.contains("i386")
-                            || name_lower.contains("i586")
-                            || name_lower.contains("i486");
-                        if is_32bit {
-                            tracing::debug!(
-                                "Skipping 32-bit asset '{}' on 64-bit system",
-                                asset.name
-                            );
-                            return false;
-                        }
-                    }
-
-                    let os_match = os_aliases.iter().any(|(os, aliases)| {
-                        os == &system_os && aliases.iter().any(|alias| name_lower.contains(alias))
-                    });
-
-                    let arch_match = arch_aliases.iter().any(|(arch, aliases)| {
-                        if arch != &system_arch {
-                            return false;
-                        }
-
-                        aliases.iter().any(|alias| {
-                            if !name_lower.contains(alias) {
-                                return false;
-                            }
-
-                            // Special handling for "arm" to avoid matching "arm64"
-                            if alias == &"arm" && name_lower.contains("arm64") {
-                                return false;
-                            }
-
-                            true
-                        })
-                    });
-
-                    tracing::trace!(
-                        "Asset '{}': os_match={}, arch_match={}",
-                        asset.name,
-                        os_match,
-                        arch_match
-                    );
-
-                    // For os_arch_* categories, both must match
-                    if category.starts_with("os_arch_") {
-                        os_match && arch_match
-                    } else if category.starts_with("os_only_") {
-                        os_match
-                    } else if category.starts_with("arch_only_") {
-                        arch_match
-                    } else {
-                        false
-                    }
-                })
-                .collect();
-
-            tracing::trace!(
-                "Category '{}': {} matching assets out of {}",
-                category,
-                matching_assets.len(),
-                asset_list.len()
-            );
-
-            if !matching_assets.is_empty() {
-                // Prioritize assets based on musl match
-                let best_match = matching_assets.iter().min_by_key(|asset| {
-                    let name_lower = asset.name.to_lowercase();
-                    let asset_is_musl = name_lower.contains("musl");
-                    if asset_is_musl == is_musl {
-                        0 // Perfect match
-                    } else if !asset_is_musl && is_musl {
-                        2 // System is musl, asset is glibc
-                    } else {
-                        1 // System is glibc, asset is musl
-                    }
-                });
-
-                if let Some(asset) = best_match {
-                    tracing::info!("Found best match: '{}'", asset.name);
-                    return Ok(Some(AssetInfo {
-                        name: asset.name.clone(),
-                        download_url: asset.browser_download_url.clone(),
-                    }));
-                }
+        if ends_with_any(&name_lower, INVALID_ASSET_EXTS) {
+            if first_wheel.is_none() && name_lower.ends_with(".whl") {
+                first_wheel = Some(asset);
             }
+            continue;
         }
-    }
 
-    // Fallback to .whl files
-    for asset in assets {
-        if asset.name.to_lowercase().ends_with(".whl") {
-            tracing::warn!("Falling back to Python wheel");
-            return Ok(Some(AssetInfo {
-                name: asset.name.clone(),
-                download_url: asset.browser_download_url.clone(),
-            }));
+        // Reject 32-bit assets on 64-bit systems unless explicitly needed
+        if is_64bit_system && X86_32_MARKERS.iter().any(|bits| name_lower.contains(bits)) {
+            tracing::debug!("Skipping 32-bit asset '{}' on 64-bit system", asset.name);
+            continue;
         }
-    }
-
-    tracing::debug!("No suitable asset found in release assets");
-    Ok(None)
-}
 
-fn categorize_assets(
-    assets: &[GitHubAsset],
-    os_aliases: &[(&str, Vec<&str>)],
-    arch_aliases: &[(&str, Vec<&str>)],
-    archive_exts: &[&str],
-    package_exts: &[&str],
-    invalid_exts: &[&str],
-) -> HashMap<String, Vec<GitHubAsset>> {
-    let mut candidates = HashMap::new();
-
-    for category in &[
-        "os_arch_archive",
-        "os_arch_binary",
-        "os_arch_package",
-        "os_only_archive",
-        "os_only_binary",
-        "os_only_package",
-        "arch_only_archive",
-        "arch_only_binary",
-        "arch_only_package",
-    ] {
-        candidates.insert(category.to_string(), Vec::new());
-    }
-
-    for asset in assets {
-        let name_lower = asset.name.to_lowercase();
-
-        if invalid_exts.iter().any(|ext| name_lower.ends_with(ext)) {
+        let os_match = system_os_aliases
+            .iter()
+            .any(|alias| name_lower.contains(alias));
+        let arch_match = mentions_arch(&name_lower, system_arch_aliases);
+
+        tracing::trace!(
+            "Asset '{}': os_match={}, arch_match={}",
+            asset.name,
+            os_match,
+            arch_match
+        );
+        if !(os_match && arch_match) {
             continue;
         }
 
-        let has_os = os_aliases
-            .iter()
-            .any(|(_, aliases)| aliases.iter().any(|alias| name_lower.contains(alias)));
-        let has_arch = arch_aliases
-            .iter()
-            .any(|(_, aliases)| aliases.iter().any(|alias| name_lower.contains(alias)));
-
-        let is_archive = archive_exts.iter().any(|ext| name_lower.ends_with(ext));
-        let is_package = package_exts.iter().any(|ext| name_lower.ends_with(ext));
-        let is_binary = !is_archive && !is_package;
-
-        let category = match (has_os, has_arch) {
-            (true, true) => {
-                if is_archive {
-                    "os_arch_archive"
-                } else if is_binary {
-                    "os_arch_binary"
-                } else {
-                    "os_arch_package"
-                }
-            }
-            (true, false) => {
-                if is_archive {
-                    "os_only_archive"
-                } else if is_binary {
-                    "os_only_binary"
-                } else {
-                    "os_only_package"
-                }
-            }
-            (false, true) => {
-                if is_archive {
-                    "arch_only_archive"
-                } else if is_binary {
-                    "arch_only_binary"
-                } else {
-                    "arch_only_package"
-                }
-            }
-            (false, false) => continue,
+        let kind_rank = if ends_with_any(&name_lower, ARCHIVE_EXTS) {
+            0
+        } else if ends_with_any(&name_lower, PACKAGE_EXTS) {
+            2
+        } else {
+            1
+        };
+        let asset_is_musl = name_lower.contains("musl");
+        let libc_rank = if asset_is_musl == is_musl {
+            0 // Perfect match
+        } else if is_musl {
+            2 // System is musl, asset is glibc
+        } else {
+            1 // System is glibc, asset is musl
         };
 
-        if let Some(list) = candidates.get_mut(category) {
-            list.push(asset.clone());
+        let rank = (kind_rank, libc_rank);
+        if best.is_none_or(|(best_rank, _)| rank < best_rank) {
+            best = Some((rank, asset));
         }
     }
 
-    candidates
+    if let Some((_, asset)) = best {
+        tracing::info!("Found best match: '{}'", asset.name);
+        return Ok(Some(AssetInfo {
+            name: asset.name.clone(),
+            download_url: asset.browser_download_url.clone(),
+        }));
+    }
+
+    // Fallback to .whl files
+    if let Some(asset) = first_wheel {
+        tracing::warn!("Falling back to Python wheel");
+        return Ok(Some(AssetInfo {
+            name: asset.name.clone(),
+            download_url: asset.browser_download_url.clone(),
+        }));
+    }
+
+    tracing::debug!("No suitable asset found in release assets");
+    Ok(None)
 }
 
 pub fn find_asset_in_release_body(
@@ -284,77 +178,40 @@ pub fn find_asset_in_release_body(
     system_os: &str,
     system_arch: &str,
 ) -> Option<AssetInfo> {
-    let os_aliases = [
-        ("linux", vec!["linux", "unknown-linux", "pc-linux"]),
-        ("darwin", vec!["darwin", "macos", "osx"]),
-        ("macos", vec!["darwin", "macos", "osx"]),
-        ("windows", vec!["windows", "win", "cygwin"]),
-    ];
-
-    let arch_aliases = [
-        ("x86_64", vec!["amd64", "x64", "x86_64", "x86-64"]),
-        ("amd64", vec!["amd64", "x64", "x86_64", "x86-64"]),
-        ("aarch64", vec!["arm64", "aarch64"]),
-        ("arm64", vec!["arm64", "aarch64"]),
-        ("arm", vec!["arm", "armv7"]),
-        ("i686", vec!["i686", "i386", "x86"]),
-        ("i386", vec!["i686", "i386", "x86"]),
-    ];
-
-    let valid_extensions = [".tar.gz", ".zip", ".tar.xz", ".tgz", ".gz"];
-    let invalid_patterns = [".asc", ".sig", ".sha256", ".sha256sum", ".pem", ".pub"];
-
-    let md_link_regex = regex::Regex::new(r"\[([^\]]+)\]\(([^)]+)\)").ok()?;
+    let system_os_aliases = aliases_for(OS_ALIASES, system_os);
+    let system_arch_aliases = aliases_for(ARCH_ALIASES, system_arch);
+
+    static MD_LINK: OnceLock<regex::Regex> = OnceLock::new();
+    let md_link_regex =
+        MD_LINK.get_or_init(|| regex::Regex::new(r"\[([^\]]+)\]\(([^)]+)\)").unwrap());
 
     let mut candidates: Vec<AssetInfo> = Vec::new();
 
-    let is_64bit_system = matches!(system_arch, "x86_64" | "amd64" | "aarch64" | "arm64");
+    let is_64bit_system = is_64bit_arch(system_arch);
 
     for cap in md_link_regex.captures_iter(body) {
         let link_text = cap.get(1)?.as_str().to_lowercase();
         let url = cap.get(2)?.as_str().to_string();
         let url_lower = url.to_lowercase();
 
-        if invalid_patterns.iter().any(|p| url_lower.ends_with(p)) {
-            continue;
-        }
-
-        if !valid_extensions.iter().any(|ext| url_lower.ends_with(ext)) {
+        if ends_with_any(&url_lower, BODY_INVALID_EXTS)
+            || !ends_with_any(&url_lower, BODY_ARCHIVE_EXTS)
+        {
             continue;
         }
 
         // Reject 32-bit assets on 64-bit systems
-        if is_64bit_system {
-            let is_32bit = url_lower.contains("i686")
-                || url_lower.contains("i386")
-                || url_lower.contains("i586")
-                || url_lower.contains("i486");
-            if is_32bit {
-                continue;
-            }
+        if is_64bit_system && X86_32_MARKERS.iter().any(|bits| url_lower.contains(bits)) {
+            continue;
         }
 
         let url_filename = url.split('/').next_back().unwrap_or("");
         let search_text = format!("{} {}", link_text, url_filename.to_lowercase());
 
-        let os_match = os_aliases.iter().any(|(os, aliases)| {
-            os == &system_os && aliases.iter().any(|alias| search_text.contains(alias))
-        });
-
-        let arch_match = arch_aliases.iter().any(|(arch, aliases)| {
-            if arch != &system_arch {
-                return false;
-            }
-            aliases.iter().any(|alias| {
-                if !search_text.contains(alias) {
-                    return false;
-                }
-                if alias == &"arm" && search_text.contains("arm64") {
-                    return false;
-                }
-                true
-            })
-        });
+        let os_match = system_os_aliases
+            .iter()
+            .any(|alias| search_text.contains(alias));
+        let arch_match = mentions_arch(&search_text, system_arch_aliases);
 
         if os_match && arch_match {
             let name = url.split('/').next_back().unwrap_or("unknown").to_string();
@@ -368,7 +225,14 @@ pub fn find_asset_in_release_body(
     candidates.into_iter().next()
 }
 
+/// Whether the system C library is musl. Detection runs `ldd`, so the answer is
+/// computed once per process.
 pub fn is_musl_system() -> bool {
+    static IS_MUSL: OnceLock<bool> = OnceLock::new();
+    *IS_MUSL.get_or_init(detect_musl)
+}
+
+fn detect_musl() -> bool {
     #[cfg(target_os = "linux")]
     {
         if let Ok(output) = std::process::Command::new("ldd").arg("--version").output() {
@@ -453,6 +317,38 @@ mod tests {
         assert_eq!(asset.name, "gh_2.92.0_macOS_arm64.zip");
     }
 
+    #[test]
+    fn test_asset_ranking_prefers_archives_then_matching_libc() {
+        let asset = |name: &str| GitHubAsset {
+            name: name.to_string(),
+            browser_download_url: format!("https://example.invalid/{}", name),
+        };
+        let assets = vec![
+            asset("tool_linux_arm64.tar.gz"),
+            asset("tool_linux_i386.tar.gz"),
+            asset("tool_linux_amd64.deb"),
+            asset("tool_linux_amd64"),
+            asset("tool_linux_amd64.tar.gz.sha256"),
+            asset("tool-x86_64-unknown-linux-musl.tar.gz"),
+            asset("tool-x86_64-unknown-linux-gnu.tar.gz"),
+        ];
+
+        let best = find_asset_for_platform(&assets, "owner/tool", "linux", "amd64")
+            .unwrap()
+            .expect("linux amd64 asset should match");
+        let expected = if is_musl_system() {
+            "tool-x86_64-unknown-linux-musl.tar.gz"
+        } else {
+            "tool-x86_64-unknown-linux-gnu.tar.gz"
+        };
+        assert_eq!(best.name, expected);
+
+        let best = find_asset_for_platform(&assets[..4], "owner/tool", "linux", "amd64")
+            .unwrap()
+            .expect("bare binary should beat a package");
+        assert_eq!(best.name, "tool_linux_amd64");
+    }
+
     #[test]
     fn test_macos_release_body_matching_uses_rust_os_name() {
         let body = "[macOS arm64](https://example.invalid/gh_2.92.0_macOS_arm64.zip)";
@@ -0,0 +1,258 @@
+//! Result cache for `tooler run --cache`
+//!
+//! Stores the exit code, stdout and stderr of a tool run under a key derived
+//! from everything the run is assumed to depend on, so that repeating the same
+//! invocation replays the result without starting the tool.
+
+use crate::config::get_run_cache_dir;
+use anyhow::Result;
+use std::collections::hash_map::DefaultHasher;
+use std::fs;
+use std::hash::{Hash, Hasher};
+use std::io::Write;
+use std::path::{Path, PathBuf};
+use std::time::{SystemTime, UNIX_EPOCH};
+
+/// Total size of `run-cache/` above which storing an entry prunes the least
+/// recently used entries.
+const MAX_CACHE_BYTES: u64 = 64 * 1024 * 1024;
+
+/// The recorded outcome of a tool run.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct CachedRun {
+    pub code: i32,
+    pub stdout: Vec<u8>,
+    pub stderr: Vec<u8>,
+}
+
+/// Everything a run is assumed to depend on. Entries store these inputs
+/// verbatim and a hit must match them exactly, so the hash only picks a file
+/// name. `DefaultHasher` output may change between Rust releases; a tooler
+/// built with another toolchain then misses instead of replaying a wrong entry.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct CacheKey {
+    inputs: Vec<u8>,
+}
+
+impl CacheKey {
+    /// Key running `executable` at `version` with `args` in `cwd`, fed `stdin`.
+    /// The executable's size and modification time are part of the key, so
+    /// reinstalling a tool in place never replays the old binary's output.
+    pub fn new(
+        executable: &Path,
+        version: &str,
+        args: &[String],
+        cwd: &Path,
+        stdin: &[u8],
+    ) -> Self {
+        let mut inputs = Vec::new();
+        push_field(&mut inputs, executable.as_os_str().as_encoded_bytes());
+        let metadata = fs::metadata(executable).ok();
+        let modified = metadata
+            .as_ref()
+            .and_then(|m| m.modified().ok())
+            .and_then(|t| t.duration_since(UNIX_EPOCH).ok());
+        let stamp = format!(
+            "{:?} {:?}",
+            metadata.map(|m| m.len()),
+            modified.map(|d| d.as_nanos())
+        );
+        push_field(&mut inputs, stamp.as_bytes());
+        push_field(&mut inputs, version.as_bytes());
+        push_field(&mut inputs, args.len().to_string().as_bytes());
+        for arg in args {
+            push_field(&mut inputs, arg.as_bytes());
+        }
+        push_field(&mut inputs, cwd.as_os_str().as_encoded_bytes());
+        push_field(&mut inputs, stdin);
+        Self { inputs }
+    }
+
+    /// Name of the entry file for this key.
+    pub fn file_name(&self) -> String {
+        let mut hasher = DefaultHasher::new();
+        self.inputs.hash(&mut hasher);
+        format!("{:016x}", hasher.finish())
+    }
+}
+
+/// Append a length-prefixed field, so no two sequences of fields encode alike.
+fn push_field(inputs: &mut Vec<u8>, field: &[u8]) {
+    inputs.extend_from_slice(&(field.len() as u64).to_le_bytes());
+    inputs.extend_from_slice(field);
+}
+
+/// Look up a cached run. Like the release cache, entries are disposable: a
+/// missing or unreadable entry, or one stored for other inputs, is a miss.
+pub fn load(key: &CacheKey) -> Option<CachedRun> {
+    let path = get_run_cache_dir().ok()?.join(key.file_name());
+    let bytes = fs::read(&path).ok()?;
+    let (inputs, run) = decode(&bytes)?;
+    if inputs != key.inputs.as_slice() {
+        return None;
+    }
+    // A hit counts as a use, so pruning keeps the entries still being replayed
+    let _ = fs::File::options()
+        .write(true)
+        .open(&path)
+        .and_then(|f| f.set_modified(SystemTime::now()));
+    Some(run)
+}
+
+pub fn store(key: &CacheKey, run: &CachedRun) -> Result<()> {
+    let dir = get_run_cache_dir()?;
+    let mut temp = tempfile::NamedTempFile::new_in(&dir)?;
+    temp.write_all(&encode(&key.inputs, run))?;
+    temp.persist(dir.join(key.file_name()))?;
+    prune(&dir, MAX_CACHE_BYTES);
+    Ok(())
+}
+
+/// Delete the least recently used entries until `dir` holds at most
+/// `max_bytes`.
+fn prune(dir: &Path, max_bytes: u64) {
+    let Ok(entries) = fs::read_dir(dir) else {
+        return;
+    };
+    let mut files: Vec<(SystemTime, u64, PathBuf)> = entries
+        .flatten()
+        .filter_map(|entry| {
+            let metadata = entry.metadata().ok()?;
+            let modified = metadata.modified().unwrap_or(UNIX_EPOCH);
+            metadata
+                .is_file()
+                .then(|| (modified, metadata.len(), entry.path()))
+        })
+        .collect();
+    let mut total: u64 = files.iter().map(|(_, len, _)| len).sum();
+    if total <= max_bytes {
+        return;
+    }
+    files.sort_by_key(|(modified, ..)| *modified);
+    for (_, len, path) in files {
+        if total <= max_bytes {
+            break;
+        }
+        match fs::remove_file(&path) {
+            Ok(()) => total -= len,
+            Err(e) => tracing::debug!("Failed to prune {}: {}", path.display(), e),
+        }
+    }
+}
+
+/// Entries are a header line `<code> <inputs length> <stdout length>` followed
+/// by the key inputs and the raw stdout and stderr bytes.
+fn encode(inputs: &[u8], run: &CachedRun) -> Vec<u8> {
+    let mut bytes = format!("{} {} {}\n", run.code, inputs.len(), run.stdout.len()).into_bytes();
+    bytes.extend_from_slice(inputs);
+    bytes.extend_from_slice(&run.stdout);
+    bytes.extend_from_slice(&run.stderr);
+    bytes
+}
+
+fn decode(bytes: &[u8]) -> Option<(&[u8], CachedRun)> {
+    let newline = bytes.iter().position(|&b| b == b'\n')?;
+    let header = std::str::from_utf8(&bytes[..newline]).ok()?;
+    let mut fields = header.split(' ');
+    let code = fields.next()?.parse().ok()?;
+    let inputs_len: usize = fields.next()?.parse().ok()?;
+    let stdout_len: usize = fields.next()?.parse().ok()?;
+    let body = &bytes[newline + 1..];
+    if fields.next().is_some() || inputs_len.checked_add(stdout_len)? > body.len() {
+        return None;
+    }
+    let (inputs, body) = body.split_at(inputs_len);
+    let (stdout, stderr) = body.split_at(stdout_len);
+    let run = CachedRun {
+        code,
+        stdout: stdout.to_vec(),
+        stderr: stderr.to_vec(),
+    };
+    Some((inputs, run))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_cached_run_round_trip() {
+        let run = CachedRun {
+            code: 3,
+            stdout: b"line one\nline two\n".to_vec(),
+            stderr: b"warning\n".to_vec(),
+        };
+        assert_eq!(
+            decode(&encode(b"inputs", &run)),
+            Some((&b"inputs"[..], run))
+        );
+        assert_eq!(decode(b"0 0 10\nshort"), None);
+        assert_eq!(decode(b"0 10\nold format entry"), None);
+        assert_eq!(decode(b"garbage"), None);
+    }
+
+    #[test]
+    fn test_prune_removes_least_recently_used_entries() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        let now = SystemTime::now();
+        for (name, age) in [("old", 30), ("middle", 20), ("new", 10)] {
+            let path = temp_dir.path().join(name);
+            fs::write(&path, [0u8; 10]).unwrap();
+            fs::File::options()
+                .write(true)
+                .open(&path)
+                .unwrap()
+                .set_modified(now - std::time::Duration::from_secs(age))
+                .unwrap();
+        }
+
+        prune(temp_dir.path(), 30);
+        assert_eq!(fs::read_dir(temp_dir.path()).unwrap().count(), 3);
+
+        prune(temp_dir.path(), 25);
+        assert!(!temp_dir.path().join("old").exists());
+        assert!(temp_dir.path().join("middle").exists());
+        assert!(temp_dir.path().join("new").exists());
+    }
+
+    #[test]
+    fn test_cache_key_covers_every_input() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        let tool = temp_dir.path().join("tool");
+        fs::write(&tool, "binary").unwrap();
+        let args = vec!["fmt".to_string(), "-check".to_string()];
+        let key = |args: &[String], cwd: &Path, stdin: &[u8]| {
+            CacheKey::new(&tool, "v1.0.0", args, cwd, stdin)
+        };
+
+        let base = key(&args, temp_dir.path(), b"");
+        assert_eq!(base, key(&args, temp_dir.path(), b""));
+        assert_eq!(
+            base.file_name(),
+            key(&args, temp_dir.path(), b"").file_name()
+        );
+
+        let others = [
+            key(&args[..1], temp_dir.path(), b""),
+            // Splitting an argument differently is a different run
+            key(&["fmt -check".to_string()], temp_dir.path(), b""),
+            key(&args, Path::new("/"), b""),
+            key(&args, temp_dir.path(), b"input"),
+            CacheKey::new(&tool, "v2.0.0", &args, temp_dir.path(), b""),
+        ];
+        for other in &others {
+            assert_ne!(&base, other);
+            assert_ne!(base.file_name(), other.file_name());
+        }
+
+        // Reinstalling the tool in place changes its modification time
+        let modified = fs::metadata(&tool).unwrap().modified().unwrap();
+        fs::File::options()
+            .write(true)
+            .open(&tool)
+            .unwrap()
+            .set_modified(modified + std::time::Duration::from_secs(60))
+            .unwrap();
+        assert_ne!(base, key(&args, temp_dir.path(), b""));
+    }
+}
@@ -1,6 +1,7 @@
 use crate::types::Forge;
 use serde::{Deserialize, Serialize};
 use std::fmt;
+use std::sync::OnceLock;
 
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq, Eq)]
 pub struct ToolIdentifier {
@@ -32,26 +33,17 @@ impl ToolIdentifier {
 
         // Handle URL forge
         if tool_id.starts_with("http://") || tool_id.starts_with("https://") {
-            let (url_part, version_part) = if tool_id.contains('@') && !tool_id.contains("@v") {
-                // If it contains @ but it's not part of a version string (like in a path),
-                // we might need careful parsing. But usually @ is for versioning in tooler.
-                // However, for URLs, @ is rare unless it's for credentials (which we don't support here).
-                // Let's assume @ at the end is for version pinning.
-                let mut parts = tool_id.rsplitn(2, '@');
-                let version = parts.next().map(|s| s.to_string());
-                let url = parts.next().unwrap_or(tool_id).to_string();
-                (url, version)
-            } else {
-                (tool_id.to_string(), None)
+            // An @ in a URL is taken as version pinning (credentials are not
+            // supported); a URL containing "@v" is kept whole.
+            let (url_part, version_part) = match tool_id.rsplit_once('@') {
+                Some((url, version)) if !tool_id.contains("@v") => (url, Some(version.to_string())),
+                _ => (tool_id, None),
             };
 
-            let name = url_part
-                .split('/')
-                .next_back()
-                .unwrap_or("unknown_tool")
-                .split('?')
-                .next()
-                .unwrap_or("unknown_tool")
+            let file_name = url_part.rsplit_once('/').map_or(url_part, |(_, name)| name);
+            let name = file_name
+                .split_once('?')
+                .map_or(file_name, |(name, _)| name)
                 .trim_end_matches(".zip")
                 .trim_end_matches(".tar.gz")
                 .trim_end_matches(".tgz")
@@ -60,8 +52,10 @@ impl ToolIdentifier {
 
             // Attempt to guess version from URL if not provided
             let version = version_part.or_else(|| {
-                let re = regex::Regex::new(r"v?(\d+\.\d+\.\d+)").ok()?;
-                re.find(&url_part).map(|m| m.as_str().to_string())
+                static URL_VERSION: OnceLock<regex::Regex> = OnceLock::new();
+                let re =
+                    URL_VERSION.get_or_init(|| regex::Regex::new(r"v?(\d+\.\d+\.\d+)").unwrap());
+                re.find(url_part).map(|m| m.as_str().to_string())
             });
 
             return Ok(ToolIdentifier {
@@ -69,40 +63,29 @@ impl ToolIdentifier {
                 author: "direct".to_string(),
                 repo: name,
                 version,
-                url: Some(url_part),
+                url: Some(url_part.to_string()),
             });
         }
 
         // Handle @ for version
-        let (repo_part, version_part) = if tool_id.contains('@') {
-            let mut parts = tool_id.splitn(2, '@');
-            let repo = parts
-                .next()
-                .ok_or_else(|| "Missing repository part".to_string())?;
-            let version = parts.next().map(|s| s.to_string());
-            (repo, version)
-        } else {
-            (tool_id, Some("default".to_string()))
+        let (repo_part, version_part) = match tool_id.split_once('@') {
+            Some((repo, version)) => (repo, Some(version.to_string())),
+            None => (tool_id, Some("default".to_string())),
         };
 
         // Parse repository part
-        let repo_parts: Vec<&str> = repo_part.split('/').collect();
-        let (author, repo) = match repo_parts.len() {
-            1 => {
-                // Short form like "act" - no author specified
-                ("unknown".to_string(), repo_parts[0].to_string())
-            }
-            2 => {
-                // Full form like "nektos/act"
-                (repo_parts[0].to_string(), repo_parts[1].to_string())
-            }
+        let (author, repo) = match repo_part.split_once('/') {
+            // Short form like "act" - no author specified
+            None => ("unknown", repo_part),
+            // Full form like "nektos/act"
+            Some((author, repo)) if !repo.contains('/') => (author, repo),
             _ => return Err(format!("Invalid repository format: {}", repo_part)),
         };
 
         Ok(ToolIdentifier {
             forge: Forge::GitHub,
-            author,
-            repo,
+            author: author.to_string(),
+            repo: repo.to_string(),
             version: version_part,
             url: None,
         })
@@ -123,7 +106,7 @@ impl ToolIdentifier {
     }
 
     /// Get: version string for API calls (adds 'v' prefix if needed)
-    #[allow(dead_code)]
+    #[cfg(test)]
     pub fn api_version(&self) -> String {
         match self.version.as_deref().unwrap_or("default") {
             "default" => "latest".to_string(),
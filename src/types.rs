@@ -1,3 +1,4 @@
+use chrono::{DateTime, Utc};
 use serde::{Deserialize, Deserializer, Serialize};
 use std::cmp::PartialEq;
 use std::collections::HashMap;
@@ -24,6 +25,12 @@ pub struct ToolInfo {
     pub last_accessed: String,
     #[serde(default)]
     pub last_checked: Option<String>,
+    /// Unix-time mirrors of `last_accessed`/`last_checked`, so staleness checks
+    /// compare integers instead of parsing timestamps for every tool.
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub last_accessed_ts: Option<i64>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub last_checked_ts: Option<i64>,
     #[serde(default)]
     pub forge: Forge,
     #[serde(default)]
@@ -34,6 +41,29 @@ fn default_pinned() -> bool {
     false
 }
 
+impl ToolInfo {
+    pub fn mark_accessed(&mut self, now: DateTime<Utc>) {
+        self.last_accessed = now.to_rfc3339();
+        self.last_accessed_ts = Some(now.timestamp());
+    }
+
+    pub fn mark_checked(&mut self, now: DateTime<Utc>) {
+        self.last_checked = Some(now.to_rfc3339());
+        self.last_checked_ts = Some(now.timestamp());
+    }
+
+    /// Unix time of the last update check, or of the last access for tools that
+    /// were never checked. The RFC 3339 strings are only parsed for entries
+    /// written before the timestamp fields existed.
+    pub fn last_check_timestamp(&self) -> Option<i64> {
+        let parse = |s: &str| s.parse::<DateTime<Utc>>().ok().map(|t| t.timestamp());
+        match &self.last_checked {
+            Some(checked) => self.last_checked_ts.or_else(|| parse(checked)),
+            None => self.last_accessed_ts.or_else(|| parse(&self.last_accessed)),
+        }
+    }
+}
+
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq, Eq)]
 pub struct ToolerSettings {
     #[serde(default = "default_update_check_days")]
@@ -104,6 +134,91 @@ impl Default for ToolerSettings {
     }
 }
 
+/// A setting managed by `tooler config`: its key (as produced by
+/// `normalize_key`) and how to read, parse and reset its value.
+pub struct Setting {
+    pub key: &'static str,
+    pub get: fn(&ToolerSettings) -> String,
+    /// Store a value given on the command line, or explain why it is invalid
+    pub set: fn(&mut ToolerSettings, &str) -> Result<(), String>,
+    pub reset: fn(&mut ToolerSettings),
+}
+
+impl Setting {
+    /// The key as shown to users, e.g. `update-check-days`.
+    pub fn display_key(&self) -> String {
+        self.key.replace('_', "-")
+    }
+}
+
+/// Every configurable setting, in display order.
+pub static SETTINGS: &[Setting] = &[
+    Setting {
+        key: "update_check_days",
+        get: |s| s.update_check_days.to_string(),
+        set: |s, value| {
+            s.update_check_days = value.parse().map_err(|_| "Expected a number of days.")?;
+            Ok(())
+        },
+        reset: |s| s.update_check_days = default_update_check_days(),
+    },
+    Setting {
+        key: "auto_shim",
+        get: |s| s.auto_shim.to_string(),
+        set: |s, value| {
+            s.auto_shim = parse_flag(value);
+            Ok(())
+        },
+        reset: |s| s.auto_shim = default_auto_shim(),
+    },
+    Setting {
+        key: "auto_update",
+        get: |s| s.auto_update.to_string(),
+        set: |s, value| {
+            s.auto_update = parse_flag(value);
+            Ok(())
+        },
+        reset: |s| s.auto_update = default_auto_update(),
+    },
+    Setting {
+        key: "parse_release_body",
+        get: |s| s.parse_release_body.to_string(),
+        set: |s, value| {
+            s.parse_release_body =
+                ReleaseBodyPolicy::parse(value).ok_or("Use ask, always, or never.")?;
+            Ok(())
+        },
+        reset: |s| s.parse_release_body = default_parse_release_body(),
+    },
+    Setting {
+        key: "bin_dir",
+        get: |s| s.bin_dir.clone(),
+        set: |s, value| {
+            s.bin_dir = value.to_string();
+            Ok(())
+        },
+        reset: |s| s.bin_dir = default_bin_dir(),
+    },
+];
+
+/// Look up a setting by its normalized key.
+pub fn find_setting(key: &str) -> Option<&'static Setting> {
+    SETTINGS.iter().find(|setting| setting.key == key)
+}
+
+/// The comma-separated list of setting keys, for error messages.
+pub fn setting_keys() -> String {
+    SETTINGS
+        .iter()
+        .map(Setting::display_key)
+        .collect::<Vec<_>>()
+        .join(", ")
+}
+
+fn parse_flag(value: &str) -> bool {
+    value.eq_ignore_ascii_case("true") || value == "1"
+}
+
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq, Eq, Default)]
 #[serde(rename_all = "lowercase")]
 pub enum ReleaseBodyPolicy {
@@ -156,6 +271,112 @@ pub struct ToolerConfig {
     #[serde(default)]
     pub aliases: HashMap<String, String>,
     pub settings: ToolerSettings,
+    /// Lowercase repo, tool name and binary name -> config keys, most recently
+    /// accessed first. Built on load and kept current by `insert_tool`,
+    /// `remove_tool_entry` and `mark_tool_accessed`; never persisted.
+    #[serde(skip)]
+    pub tool_index: HashMap<String, Vec<String>>,
+}
+
+impl ToolerConfig {
+    pub fn rebuild_tool_index(&mut self) {
+        self.tool_index.clear();
+        for (key, info) in &self.tools {
+            for name in index_names(info) {
+                self.tool_index.entry(name).or_default().push(key.clone());
+            }
+        }
+        let tools = &self.tools;
+        for keys in self.tool_index.values_mut() {
+            keys.sort_by(|a, b| last_accessed(tools, b).cmp(last_accessed(tools, a)));
+        }
+    }
+
+    /// Insert or replace a tool entry, keeping `tool_index` in sync.
+    pub fn insert_tool(&mut self, key: String, info: ToolInfo) -> Option<ToolInfo> {
+        let previous = self.remove_tool_entry(&key);
+        for name in index_names(&info) {
+            let keys = self.tool_index.entry(name).or_default();
+            let tools = &self.tools;
+            let at =
+                keys.partition_point(|k| last_accessed(tools, k) > info.last_accessed.as_str());
+            keys.insert(at, key.clone());
+        }
+        self.tools.insert(key, info);
+        previous
+    }
+
+    /// Remove a tool entry, keeping `tool_index` in sync.
+    pub fn remove_tool_entry(&mut self, key: &str) -> Option<ToolInfo> {
+        let info = self.tools.remove(key)?;
+        for name in index_names(&info) {
+            if let Some(keys) = self.tool_index.get_mut(&name) {
+                keys.retain(|k| k != key);
+                if keys.is_empty() {
+                    self.tool_index.remove(&name);
+                }
+            }
+        }
+        Some(info)
+    }
+
+    /// Record an access to the entry for `repo` at `version`, moving it to the
+    /// front of its index buckets. Returns false when no such entry exists.
+    pub fn mark_tool_accessed(&mut self, repo: &str, version: &str, now: DateTime<Utc>) -> bool {
+        let is_entry = |info: &ToolInfo| info.repo == repo && info.version == version;
+        let key = self
+            .indexed_keys(&repo.to_lowercase())
+            .iter()
+            .find(|k| self.tools.get(*k).is_some_and(is_entry))
+            .or_else(|| {
+                self.tools
+                    .iter()
+                    .find(|(_, info)| is_entry(info))
+                    .map(|(k, _)| k)
+            })
+            .cloned();
+        let Some((key, info)) = key.and_then(|k| self.tools.get_mut(&k).map(|info| (k, info)))
+        else {
+            return false;
+        };
+        info.mark_accessed(now);
+        for name in index_names(info) {
+            if let Some(keys) = self.tool_index.get_mut(&name) {
+                if let Some(pos) = keys.iter().position(|k| *k == key) {
+                    keys[..=pos].rotate_right(1);
+                }
+            }
+        }
+        true
+    }
+
+    /// Config keys indexed under a lowercase repo, tool name or binary name,
+    /// most recently accessed first.
+    pub fn indexed_keys(&self, name_lc: &str) -> &[String] {
+        self.tool_index.get(name_lc).map_or(&[], Vec::as_slice)
+    }
+}
+
+fn last_accessed<'a>(tools: &'a HashMap<String, ToolInfo>, key: &str) -> &'a str {
+    tools
+        .get(key)
+        .map_or("", |info| info.last_accessed.as_str())
+}
+
+fn index_names(info: &ToolInfo) -> Vec<String> {
+    let binary_name = std::path::Path::new(&info.executable_path)
+        .file_name()
+        .and_then(|n| n.to_str())
+        .unwrap_or("");
+    let mut names = vec![
+        info.repo.to_lowercase(),
+        info.tool_name.to_lowercase(),
+        binary_name.to_lowercase(),
+    ];
+    names.retain(|n| !n.is_empty());
+    names.sort();
+    names.dedup();
+    names
 }
 
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq, Eq)]
@@ -183,3 +404,44 @@ pub struct GitHubAsset {
     pub name: String,
     pub browser_download_url: String,
 }
+
+/// A newer release found by an update check.
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq, Eq)]
+pub struct PendingUpdate {
+    pub key: String,
+    pub tool_name: String,
+    /// Repository (GitHub) or new download URL (direct URL tools) to install from.
+    pub source: String,
+    pub current_version: String,
+    pub latest_version: String,
+    pub forge: Forge,
+}
+
+/// Outcome of an update check: which tools were checked and what was found.
+#[derive(Debug, Clone, Default, PartialEq, Eq)]
+pub struct UpdateCheck {
+    pub checked_keys: Vec<String>,
+    pub updates: Vec<PendingUpdate>,
+}
+
+/// Result of a previous "latest release" lookup for a single repository.
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq, Eq)]
+pub struct CachedRelease {
+    pub tag_name: String,
+    #[serde(default)]
+    pub etag: Option<String>,
+    pub fetched_at: String,
+}
+
+/// Latest-release lookups keyed by `owner/repo`, persisted in the data directory.
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq, Eq, Default)]
+pub struct ReleaseCache {
+    #[serde(default)]
+    pub releases: HashMap<String, CachedRelease>,
+    /// Unix time until which GitHub rejects our requests; checks stay offline until then.
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub rate_limit_reset: Option<i64>,
+    /// Unix time of the last failed reachability probe; checks stay offline briefly after it.
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub offline_at: Option<i64>,
+}
@@ -446,6 +446,7 @@ fn test_update_check_triggers() {
     let output: CommandOutput = ctx
         .cmd()
         .env("TOOLER_UPDATE_CHECK_DAYS", "5") // Override the context default
+        .env("TOOLER_NO_UPDATE_CHECK", "0") // Check even though stderr is captured
         .args(["-v", "run", "k9s", "version", "--short"])
         .output()
         .expect("Failed to run tool")